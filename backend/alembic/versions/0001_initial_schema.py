@@ -0,0 +1,177 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 14:27:52.845185
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('password_hash', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_table('vehicles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('make', sa.String(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=True),
+    sa.Column('vin', sa.String(), nullable=True),
+    sa.Column('registration', sa.String(), nullable=True),
+    sa.Column('engine', sa.String(), nullable=True),
+    sa.Column('fuel_type', sa.String(), nullable=True),
+    sa.Column('mileage_km', sa.Integer(), nullable=False),
+    sa.Column('first_registration_date', sa.Date(), nullable=True),
+    sa.Column('photos', sa.JSON(), nullable=True),
+    sa.Column('service_interval_months', sa.Integer(), nullable=True),
+    sa.Column('service_interval_km', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_vehicles_id'), 'vehicles', ['id'], unique=False)
+    op.create_index(op.f('ix_vehicles_user_id'), 'vehicles', ['user_id'], unique=False)
+    op.create_table('events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('mileage_km', sa.Integer(), nullable=True),
+    sa.Column('cost_total', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('workshop_name', sa.String(), nullable=True),
+    sa.Column('notes', sa.String(), nullable=True),
+    sa.Column('attachments', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_events_id'), 'events', ['id'], unique=False)
+    op.create_index(op.f('ix_events_vehicle_id'), 'events', ['vehicle_id'], unique=False)
+    op.create_index('ix_events_user_vehicle_type_date', 'events', ['user_id', 'vehicle_id', 'type', 'date'], unique=False)
+    op.create_table('policies',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=False),
+    sa.Column('policy_type', sa.String(), nullable=False),
+    sa.Column('insurer', sa.String(), nullable=False),
+    sa.Column('policy_number', sa.String(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.Column('premium_total', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('premium_installments_json', sa.JSON(), nullable=True),
+    sa.Column('coverage_json', sa.JSON(), nullable=True),
+    sa.Column('deductible', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('exclusions', sa.JSON(), nullable=True),
+    sa.Column('documents', sa.JSON(), nullable=True),
+    sa.Column('raw_text', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_policies_end_date'), 'policies', ['end_date'], unique=False)
+    op.create_index(op.f('ix_policies_id'), 'policies', ['id'], unique=False)
+    op.create_index('ix_policies_user_vehicle_type', 'policies', ['user_id', 'vehicle_id', 'policy_type'], unique=False)
+    op.create_index(op.f('ix_policies_vehicle_id'), 'policies', ['vehicle_id'], unique=False)
+    op.create_table('offers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=False),
+    sa.Column('base_policy_id', sa.Integer(), nullable=True),
+    sa.Column('provider', sa.String(), nullable=False),
+    sa.Column('premium_total', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('coverage_json', sa.JSON(), nullable=True),
+    sa.Column('deductible', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('assistance_level', sa.String(), nullable=True),
+    sa.Column('link_out', sa.String(), nullable=True),
+    sa.Column('score_breakdown_json', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['base_policy_id'], ['policies.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_offers_base_policy_id'), 'offers', ['base_policy_id'], unique=False)
+    op.create_index(op.f('ix_offers_id'), 'offers', ['id'], unique=False)
+    op.create_index(op.f('ix_offers_vehicle_id'), 'offers', ['vehicle_id'], unique=False)
+    op.create_index('ix_offers_user_vehicle_created_at', 'offers', ['user_id', 'vehicle_id', 'created_at'], unique=False)
+    op.create_table('reminders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.String(), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=True),
+    sa.Column('policy_id', sa.Integer(), nullable=True),
+    sa.Column('event_id', sa.Integer(), nullable=True),
+    sa.Column('due_date', sa.Date(), nullable=False),
+    sa.Column('channel', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('snooze_until', sa.Date(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['policy_id'], ['policies.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_reminders_event_id'), 'reminders', ['event_id'], unique=False)
+    op.create_index(op.f('ix_reminders_id'), 'reminders', ['id'], unique=False)
+    op.create_index(op.f('ix_reminders_policy_id'), 'reminders', ['policy_id'], unique=False)
+    op.create_index('ix_reminders_status_due_date', 'reminders', ['status', 'due_date'], unique=False)
+    op.create_index('ix_reminders_user_status_due_date', 'reminders', ['user_id', 'status', 'due_date'], unique=False)
+    op.create_index(op.f('ix_reminders_vehicle_id'), 'reminders', ['vehicle_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_reminders_vehicle_id'), table_name='reminders')
+    op.drop_index('ix_reminders_user_status_due_date', table_name='reminders')
+    op.drop_index('ix_reminders_status_due_date', table_name='reminders')
+    op.drop_index(op.f('ix_reminders_policy_id'), table_name='reminders')
+    op.drop_index(op.f('ix_reminders_id'), table_name='reminders')
+    op.drop_index(op.f('ix_reminders_event_id'), table_name='reminders')
+    op.drop_table('reminders')
+    op.drop_index('ix_offers_user_vehicle_created_at', table_name='offers')
+    op.drop_index(op.f('ix_offers_vehicle_id'), table_name='offers')
+    op.drop_index(op.f('ix_offers_id'), table_name='offers')
+    op.drop_index(op.f('ix_offers_base_policy_id'), table_name='offers')
+    op.drop_table('offers')
+    op.drop_index(op.f('ix_policies_vehicle_id'), table_name='policies')
+    op.drop_index('ix_policies_user_vehicle_type', table_name='policies')
+    op.drop_index(op.f('ix_policies_id'), table_name='policies')
+    op.drop_index(op.f('ix_policies_end_date'), table_name='policies')
+    op.drop_table('policies')
+    op.drop_index('ix_events_user_vehicle_type_date', table_name='events')
+    op.drop_index(op.f('ix_events_vehicle_id'), table_name='events')
+    op.drop_index(op.f('ix_events_id'), table_name='events')
+    op.drop_table('events')
+    op.drop_index(op.f('ix_vehicles_user_id'), table_name='vehicles')
+    op.drop_index(op.f('ix_vehicles_id'), table_name='vehicles')
+    op.drop_table('vehicles')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,56 @@
+"""Cost rollups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 14:38:54.238119
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTH_EXPRESSIONS = {
+    'postgresql': "date_trunc('month', date)::date",
+    'sqlite': "date(date, 'start of month')",
+}
+
+
+def upgrade() -> None:
+    op.create_table('cost_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('vehicle_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('event_count', sa.Integer(), nullable=False),
+    sa.Column('cost_total', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'vehicle_id', 'month', 'type', name='uq_cost_rollups_user_vehicle_month_type')
+    )
+    op.create_index(op.f('ix_cost_rollups_id'), 'cost_rollups', ['id'], unique=False)
+    op.create_index(op.f('ix_cost_rollups_vehicle_id'), 'cost_rollups', ['vehicle_id'], unique=False)
+
+    # Seed the rollups from existing events (same as app.workers.rollup_rebuild).
+    month = MONTH_EXPRESSIONS[op.get_bind().dialect.name]
+    op.execute(
+        "INSERT INTO cost_rollups (user_id, vehicle_id, month, type, event_count, cost_total, created_at, updated_at) "
+        f"SELECT user_id, vehicle_id, {month}, type, count(*), coalesce(sum(cost_total), 0), CURRENT_TIMESTAMP, CURRENT_TIMESTAMP "
+        f"FROM events GROUP BY user_id, vehicle_id, {month}, type"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cost_rollups_vehicle_id'), table_name='cost_rollups')
+    op.drop_index(op.f('ix_cost_rollups_id'), table_name='cost_rollups')
+    op.drop_table('cost_rollups')
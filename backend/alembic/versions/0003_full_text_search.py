@@ -0,0 +1,64 @@
+"""Full-text search
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 15:20:11.402317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same objects as app/db/search.py creates for a fresh database.
+SEARCHED_COLUMNS = {
+    'policies': ('raw_text',),
+    'events': ('workshop_name', 'notes'),
+}
+
+
+def _sqlite_upgrade(table, columns):
+    fts = f'{table}_fts'
+    names = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    insert_new = f'INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});'
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    op.execute(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(f'CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END')
+    op.execute(f'CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END')
+    op.execute(f'CREATE TRIGGER {fts}_au AFTER UPDATE OF {names} ON {table} BEGIN {delete_old} {insert_new} END')
+    op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _postgresql_upgrade(table, columns):
+    document = " || ' ' || ".join(f"coalesce({table}.{column}, '')" for column in columns)
+    op.execute(f"CREATE INDEX ix_{table}_search ON {table} USING gin (to_tsvector('simple', {document}))")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table, columns in SEARCHED_COLUMNS.items():
+        if dialect == 'sqlite':
+            _sqlite_upgrade(table, columns)
+        elif dialect == 'postgresql':
+            _postgresql_upgrade(table, columns)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table in SEARCHED_COLUMNS:
+        if dialect == 'sqlite':
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f'DROP TRIGGER IF EXISTS {table}_fts_{suffix}')
+            op.execute(f'DROP TABLE IF EXISTS {table}_fts')
+        elif dialect == 'postgresql':
+            op.execute(f'DROP INDEX IF EXISTS ix_{table}_search')
@@ -1,29 +1,47 @@
-from typing import Generator
+import math
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.security import verify_password
-from app.db.session import get_db
+from app.core.hashing import HashingOverloadedError, get_password_hasher
+from app.core.rate_limit import Bucket, get_rate_limiter
+from app.core.revocation import get_revocation_store
+from app.core.security import REFRESH_TOKEN_TYPE
+from app.db.session import get_async_db, get_db
 from app.models.user import User
+from app.services.principals import Principal, get_principal_cache
 
 settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.api_v1_prefix}/auth/login")
 
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+overloaded_exception = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Authentication service is busy, try again shortly",
+    headers={"Retry-After": "1"},
+)
+
 
 def get_db_session() -> Generator[Session, None, None]:
     yield from get_db()
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db_session)) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async for db in get_async_db():
+        yield db
+
+
+def get_token_subject(token: str = Depends(oauth2_scheme)) -> str:
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
         user_email: str | None = payload.get("sub")
@@ -31,16 +49,89 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             raise credentials_exception
     except JWTError as exc:  # pragma: no cover - FastAPI handles logging
         raise credentials_exception from exc
-    user = db.query(User).filter(User.email == user_email).first()
+    if payload.get("typ") == REFRESH_TOKEN_TYPE:
+        raise credentials_exception
+    family = payload.get("fam")
+    if family and get_revocation_store().is_family_revoked(family):
+        raise credentials_exception
+    return user_email
+
+
+def decode_refresh_token(token: str) -> Dict[str, Any]:
+    try:
+        claims = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+    except JWTError as exc:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token") from exc
+    if claims.get("typ") != REFRESH_TOKEN_TYPE or not all(claims.get(name) for name in ("sub", "jti", "fam")):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    return claims
+
+
+async def get_current_principal(
+    subject: str = Depends(get_token_subject),
+    db: AsyncSession = Depends(get_async_db_session),
+) -> Principal:
+    cache = get_principal_cache()
+    principal = cache.get(subject)
+    if principal is not None:
+        return principal
+    row = (await db.execute(select(User.id, User.email, User.created_at).where(User.email == subject))).first()
+    if row is None:
+        raise credentials_exception
+    principal = Principal(id=row.id, email=row.email, created_at=row.created_at)
+    cache.set(principal)
+    return principal
+
+
+def get_current_user(subject: str = Depends(get_token_subject), db: Session = Depends(get_db_session)) -> User:
+    user = db.query(User).filter(User.email == subject).first()
     if user is None:
         raise credentials_exception
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> User | None:
-    user = db.query(User).filter(User.email == email).first()
+def check_auth_rate_limit(request: Request, email: Optional[str] = None) -> None:
+    """Spend a token from the client IP's bucket and, if given, the email's; 429 when either is empty.
+
+    Called first thing in the auth routes, before any hashing or database work.
+    """
+    if not settings.rate_limit_enabled:
+        return
+    limiter = get_rate_limiter()
+    client_ip = request.client.host if request.client else "unknown"
+    checks = [(f"auth:ip:{client_ip}", Bucket.per_minute(settings.auth_rate_limit_ip_burst, settings.auth_rate_limit_ip_per_minute))]
+    if email:
+        checks.append(
+            (f"auth:email:{email.lower()}", Bucket.per_minute(settings.auth_rate_limit_email_burst, settings.auth_rate_limit_email_per_minute))
+        )
+    for key, bucket in checks:
+        wait = limiter.acquire(key, bucket)
+        if wait:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many attempts, try again later",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+
+
+async def hash_password(password: str) -> str:
+    try:
+        return await get_password_hasher().hash(password)
+    except HashingOverloadedError as exc:
+        raise overloaded_exception from exc
+
+
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> User | None:
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    try:
+        verified, new_hash = await get_password_hasher().verify_and_update(password, user.password_hash)
+    except HashingOverloadedError as exc:
+        raise overloaded_exception from exc
+    if not verified:
         return None
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
     return user
@@ -0,0 +1,78 @@
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.vehicle import Vehicle
+from app.schemas.imports import ImportReport, ImportRowError
+from app.services.imports import UnsupportedImportFormat, import_format, iter_records, validate_record
+
+settings = get_settings()
+
+MAX_REPORTED_ERRORS = 1000
+
+# Called inside each chunk's transaction with the inserted rows (including their ids).
+ChunkHook = Callable[[Session, List[Dict[str, Any]]], None]
+
+
+def _report_error(report: ImportReport, row: int, errors: List[str]) -> None:
+    report.failed += 1
+    if len(report.errors) < MAX_REPORTED_ERRORS:
+        report.errors.append(ImportRowError(row=row, errors=errors))
+    else:
+        report.errors_truncated = True
+
+
+async def import_rows(
+    request: Request,
+    db: AsyncSession,
+    user_id: int,
+    schema: Type[BaseModel],
+    model: Any,
+    on_chunk: Optional[ChunkHook] = None,
+) -> ImportReport:
+    """Stream-parse an NDJSON/CSV body into ``model`` rows owned by ``user_id``.
+
+    Valid rows are inserted ``import_chunk_size`` at a time, one multi-row INSERT and
+    one commit per chunk; invalid rows are skipped and listed in the report.
+    """
+    try:
+        fmt = import_format(request.headers.get("content-type"))
+    except UnsupportedImportFormat as exc:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(exc)) from exc
+
+    vehicle_ids = set((await db.scalars(select(Vehicle.id).where(Vehicle.user_id == user_id))).all())
+    table = model.__table__
+    report = ImportReport()
+    chunk: List[Dict[str, Any]] = []
+
+    async def flush() -> None:
+        inserted = (await db.execute(insert(table).returning(*table.c), chunk)).mappings().all()
+        if on_chunk is not None:
+            await db.run_sync(on_chunk, [dict(row) for row in inserted])
+        await db.commit()
+        report.imported += len(inserted)
+        chunk.clear()
+
+    async for row, record, error in iter_records(request.stream(), fmt):
+        report.received += 1
+        if error is not None:
+            _report_error(report, row, [error])
+            continue
+        item, errors = validate_record(schema, record)
+        if errors:
+            _report_error(report, row, errors)
+            continue
+        if item.vehicle_id not in vehicle_ids:
+            _report_error(report, row, ["vehicle_id: vehicle not found"])
+            continue
+        chunk.append({**item.dict(), "user_id": user_id})
+        if len(chunk) >= settings.import_chunk_size:
+            await flush()
+    if chunk:
+        await flush()
+    return report
@@ -0,0 +1,48 @@
+from typing import Sequence
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PAYLOAD_TOO_LARGE_DETAIL = "Request body too large"
+
+
+class BodySizeLimitMiddleware:
+    """Rejects oversized request bodies on the given paths with 413.
+
+    A declared ``Content-Length`` over the limit is refused before any of the body is
+    read; otherwise the body is counted while it streams in and the request is aborted
+    as soon as it crosses the limit.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int, path_prefixes: Sequence[str]) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            response = JSONResponse({"detail": PAYLOAD_TOO_LARGE_DETAIL}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # Raised inside body parsing, so FastAPI re-raises it and the
+                    # exception middleware turns it into the 413 response.
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=PAYLOAD_TOO_LARGE_DETAIL)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,168 @@
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Literal, Optional, Type
+
+from fastapi import Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, and_, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.api.responses import list_response, serializer_for
+from app.core.config import get_settings
+
+settings = get_settings()
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+STREAM_MEDIA_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class PageParams:
+    """Paging query parameters.
+
+    Without ``limit`` or ``cursor`` a list is returned whole, as before paging was
+    added; a ``cursor`` without ``limit`` continues with pages of ``default_page_size``.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size),
+        cursor: Optional[str] = Query(None),
+        stream: Optional[Literal["json", "ndjson"]] = Query(None),
+        if_none_match: Optional[str] = Header(None),
+    ) -> None:
+        self.limit = settings.default_page_size if limit is None and cursor else limit
+        self.cursor = cursor
+        self.stream = stream
+        self.if_none_match = if_none_match
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column: InstrumentedAttribute) -> tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        python_type = sort_column.type.python_type
+        if python_type is datetime:
+            sort_value = datetime.fromisoformat(sort_value)
+        elif python_type is date:
+            sort_value = date.fromisoformat(sort_value)
+        elif python_type is int:
+            sort_value = int(sort_value)
+        return sort_value, int(row_id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _apply_keyset(
+    statement: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    descending: bool,
+    cursor: Optional[str],
+) -> Select:
+    columns = [sort_column] if sort_column is id_column else [sort_column, id_column]
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, sort_column)
+        if sort_column is id_column:
+            after = id_column < row_id if descending else id_column > row_id
+        elif descending:
+            after = or_(sort_column < sort_value, and_(sort_column == sort_value, id_column < row_id))
+        else:
+            after = or_(sort_column > sort_value, and_(sort_column == sort_value, id_column > row_id))
+        statement = statement.where(after)
+    return statement.order_by(*[column.desc() if descending else column.asc() for column in columns])
+
+
+async def collection_etag(db: AsyncSession, statement: Select, updated_column: InstrumentedAttribute, page: PageParams) -> str:
+    """Weak ETag for a list: row count and latest ``updated_at`` under the same filters.
+
+    Creates and updates move ``max(updated_at)`` and deletes change the count, so the
+    tag changes whenever the collection does, at the cost of one aggregate query.
+    """
+    count, last_updated = (await db.execute(statement.with_only_columns(func.count(), func.max(updated_column)).order_by(None))).one()
+    compiled = statement.compile()
+    key = json.dumps(
+        [str(compiled), sorted(compiled.params.items()), page.limit, page.cursor, page.stream, count, last_updated],
+        default=str,
+    )
+    return 'W/"' + hashlib.sha1(key.encode()).hexdigest()[:20] + '"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison: W/"x" matches "x".
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+async def _stream_rows(db: AsyncSession, statement: Select, schema: Type[BaseModel], fmt: str) -> AsyncIterator[bytes]:
+    # The request-scoped session may already be closed by the time the body is
+    # sent; closing it again here releases the connection used for streaming.
+    try:
+        serializer = serializer_for(schema)
+        first = True
+        if fmt == "json":
+            yield b"["
+        rows = await db.stream_scalars(statement.execution_options(yield_per=settings.stream_batch_size))
+        async for row in rows:
+            body = serializer.dump(row)
+            if fmt == "json":
+                yield body if first else b"," + body
+            else:
+                yield body + b"\n"
+            first = False
+        if fmt == "json":
+            yield b"]"
+    finally:
+        await db.close()
+
+
+async def paginate(
+    db: AsyncSession,
+    statement: Select,
+    page: PageParams,
+    schema: Type[BaseModel],
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    descending: bool = False,
+    updated_column: Optional[InstrumentedAttribute] = None,
+) -> Any:
+    headers = {}
+    if updated_column is not None:
+        etag = await collection_etag(db, statement, updated_column, page)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(etag, page.if_none_match):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    statement = _apply_keyset(statement, sort_column, id_column, descending, page.cursor)
+    if page.stream:
+        return StreamingResponse(
+            _stream_rows(db, statement, schema, page.stream), media_type=STREAM_MEDIA_TYPES[page.stream], headers=headers
+        )
+
+    if page.limit is None:
+        return list_response(schema, (await db.scalars(statement)).all(), headers=headers)
+
+    rows = (await db.scalars(statement.limit(page.limit + 1))).all()
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last = rows[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return list_response(schema, rows, headers=headers)
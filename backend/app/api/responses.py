@@ -0,0 +1,85 @@
+from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterable, Mapping, Optional, Type
+
+import orjson
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    # Same as pydantic's JSON encoder, so responses keep their shape.
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson response that also accepts a body serialised beforehand."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+class RowSerializer:
+    """Turns ORM objects or result mappings into dicts with the fields of a read schema.
+
+    Rows come from our own tables, so they are not validated again: values are read
+    with one ``attrgetter``/``itemgetter`` call per row, and ``None`` in a field that
+    does not allow it falls back to the schema default (``[]``/``{}`` for JSON columns).
+    """
+
+    def __init__(self, schema: Type[BaseModel]) -> None:
+        self.fields = list(schema.__fields__)
+        self._attrs = attrgetter(*self.fields)
+        self._items = itemgetter(*self.fields)
+        self._fallbacks = {
+            name: field.default
+            for name, field in schema.__fields__.items()
+            if not field.allow_none and field.default is not None
+        }
+
+    def to_dict(self, row: Any) -> Dict[str, Any]:
+        values = self._items(row) if isinstance(row, Mapping) else self._attrs(row)
+        data = dict(zip(self.fields, values))
+        for name, default in self._fallbacks.items():
+            if data[name] is None:
+                data[name] = default.copy() if hasattr(default, "copy") else default
+        return data
+
+    def dump(self, row: Any) -> bytes:
+        return dumps(self.to_dict(row))
+
+    def dump_many(self, rows: Iterable[Any]) -> bytes:
+        return dumps([self.to_dict(row) for row in rows])
+
+
+@lru_cache
+def serializer_for(schema: Type[BaseModel]) -> RowSerializer:
+    return RowSerializer(schema)
+
+
+def model_response(
+    schema: Type[BaseModel], row: Any, status_code: int = status.HTTP_200_OK, headers: Optional[Dict[str, str]] = None
+) -> FastJSONResponse:
+    """Serialise one row once; returning a Response skips FastAPI's response_model pass."""
+    return FastJSONResponse(serializer_for(schema).dump(row), status_code=status_code, headers=headers)
+
+
+def list_response(
+    schema: Type[BaseModel],
+    rows: Iterable[Any],
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Dict[str, str]] = None,
+) -> FastJSONResponse:
+    return FastJSONResponse(serializer_for(schema).dump_many(rows), status_code=status_code, headers=headers)
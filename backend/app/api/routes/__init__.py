@@ -1,11 +1,14 @@
-from . import auth, events, offers, policies, reminders, upload, vehicles
+from . import analytics, auth, events, export, offers, policies, reminders, search, upload, vehicles
 
 __all__ = [
+    "analytics",
     "auth",
     "events",
+    "export",
     "offers",
     "policies",
     "reminders",
+    "search",
     "upload",
     "vehicles",
 ]
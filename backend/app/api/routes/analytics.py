@@ -0,0 +1,73 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.api.responses import model_response
+from app.models.cost_rollup import CostRollup
+from app.models.policy import Policy
+from app.schemas.analytics import CostSummary, MonthlyCosts
+from app.services.rollups import month_start, next_month_start
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+@router.get("/costs", response_model=CostSummary)
+async def cost_summary(
+    vehicle_id: Optional[int] = Query(None),
+    from_month: Optional[date] = Query(None, alias="from"),
+    to_month: Optional[date] = Query(None, alias="to"),
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> Response:
+    # Event costs come from the rollups (one row per month and type); premiums are
+    # few enough per vehicle to bucket by policy start month here.
+    rollups = select(CostRollup.month, CostRollup.type, func.sum(CostRollup.event_count), func.sum(CostRollup.cost_total)).where(
+        CostRollup.user_id == current_user.id
+    )
+    premiums = select(Policy.start_date, Policy.premium_total).where(Policy.user_id == current_user.id)
+    if vehicle_id:
+        rollups = rollups.where(CostRollup.vehicle_id == vehicle_id)
+        premiums = premiums.where(Policy.vehicle_id == vehicle_id)
+    if from_month:
+        rollups = rollups.where(CostRollup.month >= month_start(from_month))
+        premiums = premiums.where(Policy.start_date >= month_start(from_month))
+    if to_month:
+        rollups = rollups.where(CostRollup.month <= month_start(to_month))
+        premiums = premiums.where(Policy.start_date < next_month_start(to_month))
+    rollups = rollups.group_by(CostRollup.month, CostRollup.type)
+
+    months: Dict[date, MonthlyCosts] = {}
+
+    def bucket(month: date) -> MonthlyCosts:
+        if month not in months:
+            months[month] = MonthlyCosts(month=month, event_count=0, events_total=0, premiums_total=0, by_type={})
+        return months[month]
+
+    by_type: Dict[str, Decimal] = defaultdict(Decimal)
+    for month, type_, count, total in await db.execute(rollups):
+        total = Decimal(total or 0)
+        entry = bucket(month)
+        entry.event_count += count
+        entry.events_total += total
+        entry.by_type[type_] = total
+        by_type[type_] += total
+    for start_date, premium in await db.execute(premiums):
+        bucket(month_start(start_date)).premiums_total += premium
+
+    ordered = [months[month] for month in sorted(months)]
+    events_total = sum((entry.events_total for entry in ordered), Decimal(0))
+    premiums_total = sum((entry.premiums_total for entry in ordered), Decimal(0))
+    summary = CostSummary(
+        vehicle_id=vehicle_id,
+        events_total=events_total,
+        premiums_total=premiums_total,
+        by_type=dict(by_type),
+        months=ordered,
+    )
+    return model_response(CostSummary, summary)
@@ -1,70 +1,119 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import time
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
-from app.core.security import create_access_token, create_refresh_token, get_password_hash
+from app.core.revocation import REUSED, REVOKED, get_revocation_store
+from app.core.security import create_token_pair
+from app.models.policy import Policy
+from app.models.reminder import Reminder
 from app.models.user import User
+from app.models.vehicle import Vehicle
 from app.schemas import auth as schemas_auth
 from app.schemas.user import UserCreate, UserRead
+from app.services.reminders import POLICY_RENEWAL
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+UPCOMING_DEADLINES_LIMIT = 5
+
+
+def _token_response(subject: str, family: str | None = None) -> schemas_auth.Token:
+    access_token, refresh_token = create_token_pair(subject, family)
+    return schemas_auth.Token(access_token=access_token, refresh_token=refresh_token)
+
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register_user(payload: UserCreate, db: Session = Depends(deps.get_db_session)) -> UserRead:
-    existing = db.query(User).filter(User.email == payload.email).first()
+async def register_user(request: Request, payload: UserCreate, db: AsyncSession = Depends(deps.get_async_db_session)) -> UserRead:
+    deps.check_auth_rate_limit(request, payload.email)
+    existing = await db.scalar(select(User.id).where(User.email == payload.email))
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
-    user = User(email=payload.email, password_hash=get_password_hash(payload.password))
+    user = User(email=payload.email, password_hash=await deps.hash_password(payload.password))
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return UserRead.from_orm(user)
 
 
 @router.post("/login", response_model=schemas_auth.Token)
-def login(payload: schemas_auth.LoginRequest, db: Session = Depends(deps.get_db_session)) -> schemas_auth.Token:
-    user = deps.authenticate_user(db, payload.email, payload.password)
+async def login(request: Request, payload: schemas_auth.LoginRequest, db: AsyncSession = Depends(deps.get_async_db_session)) -> schemas_auth.Token:
+    deps.check_auth_rate_limit(request, payload.email)
+    user = await deps.authenticate_user(db, payload.email, payload.password)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password")
-    return schemas_auth.Token(
-        access_token=create_access_token(user.email),
-        refresh_token=create_refresh_token(user.email),
-    )
+    return _token_response(user.email)
 
 
 @router.post("/refresh", response_model=schemas_auth.Token)
-def refresh(payload: schemas_auth.RefreshRequest) -> schemas_auth.Token:
-    from jose import JWTError, jwt
-
-    try:
-        decoded = jwt.decode(payload.refresh_token, deps.settings.secret_key, algorithms=["HS256"])
-    except JWTError as exc:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token") from exc
-    subject = decoded.get("sub")
-    if not subject:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
-    return schemas_auth.Token(
-        access_token=create_access_token(subject),
-        refresh_token=create_refresh_token(subject),
-    )
+def refresh(request: Request, payload: schemas_auth.RefreshRequest) -> schemas_auth.Token:
+    """Exchange a refresh token for a new pair; each refresh token works once."""
+    deps.check_auth_rate_limit(request)
+    claims = deps.decode_refresh_token(payload.refresh_token)
+    outcome = get_revocation_store().rotate(claims["jti"], claims["fam"], claims["exp"] - time.time())
+    if outcome == REUSED:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token reused, session revoked")
+    if outcome == REVOKED:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Session revoked")
+    return _token_response(claims["sub"], claims["fam"])
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(payload: schemas_auth.RefreshRequest) -> Response:
+    """Revoke the session (token family) the refresh token belongs to."""
+    claims = deps.decode_refresh_token(payload.refresh_token)
+    get_revocation_store().revoke_family(claims["fam"])
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get("/me", response_model=schemas_auth.MeResponse)
-def read_me(current_user: User = Depends(deps.get_current_user)) -> schemas_auth.MeResponse:
-    upcoming = [
-        {
-            "type": "policy",
-            "policy_id": policy.id,
-            "end_date": policy.end_date,
-        }
-        for policy in sorted(current_user.policies, key=lambda p: p.end_date)
-    ]
+async def read_me(
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> schemas_auth.MeResponse:
+    counts = (
+        await db.execute(
+            select(
+                select(func.count()).where(Vehicle.user_id == current_user.id).scalar_subquery().label("vehicles"),
+                select(func.count()).where(Policy.user_id == current_user.id).scalar_subquery().label("policies"),
+            )
+        )
+    ).one()
+
+    # Each branch is limited on its own index before the union, so the cost does not
+    # grow with the user's history.
+    policies = (
+        select(literal("policy").label("type"), Policy.id.label("ref_id"), Policy.end_date.label("deadline"))
+        .where(Policy.user_id == current_user.id, Policy.end_date >= date.today())
+        .order_by(Policy.end_date)
+        .limit(UPCOMING_DEADLINES_LIMIT)
+        .subquery()
+    )
+    # Renewal reminders repeat the policy deadlines listed above, so they are left out.
+    reminders = (
+        select(literal("reminder").label("type"), Reminder.id.label("ref_id"), Reminder.due_date.label("deadline"))
+        .where(Reminder.user_id == current_user.id, Reminder.status == "pending", Reminder.entity_type != POLICY_RENEWAL)
+        .order_by(Reminder.due_date)
+        .limit(UPCOMING_DEADLINES_LIMIT)
+        .subquery()
+    )
+    deadlines = union_all(select(policies), select(reminders)).subquery()
+    rows = await db.execute(select(deadlines).order_by(deadlines.c.deadline, deadlines.c.type).limit(UPCOMING_DEADLINES_LIMIT))
+
+    upcoming = []
+    for row in rows:
+        if row.type == "policy":
+            upcoming.append({"type": "policy", "policy_id": row.ref_id, "end_date": row.deadline})
+        else:
+            upcoming.append({"type": "reminder", "reminder_id": row.ref_id, "due_date": row.deadline})
     return schemas_auth.MeResponse(
         id=current_user.id,
         email=current_user.email,
         created_at=current_user.created_at,
-        vehicles_count=len(current_user.vehicles),
-        policies_count=len(current_user.policies),
-        upcoming_deadlines=upcoming[:5],
+        vehicles_count=counts.vehicles,
+        policies_count=counts.policies,
+        upcoming_deadlines=upcoming,
     )
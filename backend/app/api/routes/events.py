@@ -1,65 +1,113 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.imports import import_rows
+from app.api.pagination import PageParams, paginate
+from app.api.responses import model_response
 from app.models.event import Event
+from app.models.vehicle import Vehicle
 from app.schemas.event import EventCreate, EventRead, EventUpdate
+from app.schemas.imports import ImportReport
+from app.services.reminders import sync_vehicles_by_id
+from app.services.rollups import apply_deltas, event_delta
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
+def _after_import_chunk(session: Session, rows: List[Dict[str, Any]]) -> None:
+    # import_rows only inserts rows of one user, for vehicles that user owns.
+    sync_vehicles_by_id(session, rows[0]["user_id"], {row["vehicle_id"] for row in rows})
+    apply_deltas(session, [event_delta(row) for row in rows])
+
+
+async def _ensure_own_vehicle(db: AsyncSession, user_id: int, vehicle_id: int) -> None:
+    if not await db.scalar(select(Vehicle.id).where(Vehicle.id == vehicle_id, Vehicle.user_id == user_id)):
+        raise HTTPException(status_code=404, detail="Vehicle not found")
+
+
 @router.get("", response_model=list[EventRead])
-def list_events(
+async def list_events(
     vehicle_id: Optional[int] = Query(None),
     type: Optional[str] = Query(None),
-    db: Session = Depends(deps.get_db_session),
-    current_user=Depends(deps.get_current_user),
-) -> list[EventRead]:
-    query = db.query(Event).filter(Event.user_id == current_user.id)
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> Response:
+    statement = select(Event).where(Event.user_id == current_user.id)
     if vehicle_id:
-        query = query.filter(Event.vehicle_id == vehicle_id)
+        statement = statement.where(Event.vehicle_id == vehicle_id)
     if type:
-        query = query.filter(Event.type == type)
-    events = query.order_by(Event.date.desc()).all()
-    return [EventRead.from_orm(event) for event in events]
+        statement = statement.where(Event.type == type)
+    return await paginate(db, statement, page, EventRead, Event.date, Event.id, descending=True, updated_column=Event.updated_at)
 
 
 @router.post("", response_model=EventRead, status_code=status.HTTP_201_CREATED)
-def create_event(payload: EventCreate, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> EventRead:
+async def create_event(payload: EventCreate, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
+    await _ensure_own_vehicle(db, current_user.id, payload.vehicle_id)
     event = Event(**payload.dict(), user_id=current_user.id)
     db.add(event)
-    db.commit()
-    db.refresh(event)
-    return EventRead.from_orm(event)
+    await db.flush()
+    await db.run_sync(sync_vehicles_by_id, current_user.id, [event.vehicle_id])
+    await db.run_sync(apply_deltas, [event_delta(event)])
+    await db.commit()
+    await db.refresh(event)
+    return model_response(EventRead, event, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_events(request: Request, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> ImportReport:
+    return await import_rows(
+        request,
+        db,
+        current_user.id,
+        EventCreate,
+        Event,
+        on_chunk=_after_import_chunk,
+    )
 
 
 @router.get("/{event_id}", response_model=EventRead)
-def get_event(event_id: int, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> EventRead:
-    event = db.query(Event).filter(Event.id == event_id, Event.user_id == current_user.id).first()
+async def get_event(event_id: int, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
+    event = await db.scalar(select(Event).where(Event.id == event_id, Event.user_id == current_user.id))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    return EventRead.from_orm(event)
+    return model_response(EventRead, event)
 
 
 @router.put("/{event_id}", response_model=EventRead)
-def update_event(event_id: int, payload: EventUpdate, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> EventRead:
-    event = db.query(Event).filter(Event.id == event_id, Event.user_id == current_user.id).first()
+async def update_event(event_id: int, payload: EventUpdate, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
+    event = await db.scalar(select(Event).where(Event.id == event_id, Event.user_id == current_user.id))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    for key, value in payload.dict(exclude_unset=True).items():
+    changes = payload.dict(exclude_unset=True)
+    if "vehicle_id" in changes:
+        await _ensure_own_vehicle(db, current_user.id, changes["vehicle_id"])
+    previous = event_delta(event, sign=-1)
+    previous_vehicle_id = event.vehicle_id
+    for key, value in changes.items():
         setattr(event, key, value)
     db.add(event)
-    db.commit()
-    db.refresh(event)
-    return EventRead.from_orm(event)
+    await db.flush()
+    # A moved event changes the service history of both vehicles.
+    await db.run_sync(sync_vehicles_by_id, current_user.id, {previous_vehicle_id, event.vehicle_id})
+    await db.run_sync(apply_deltas, [previous, event_delta(event)])
+    await db.commit()
+    await db.refresh(event)
+    return model_response(EventRead, event)
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_event(event_id: int, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> None:
-    event = db.query(Event).filter(Event.id == event_id, Event.user_id == current_user.id).first()
+async def delete_event(event_id: int, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> None:
+    event = await db.scalar(select(Event).where(Event.id == event_id, Event.user_id == current_user.id))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    db.delete(event)
-    db.commit()
+    await db.delete(event)
+    await db.flush()
+    await db.run_sync(sync_vehicles_by_id, current_user.id, [event.vehicle_id])
+    await db.run_sync(apply_deltas, [event_delta(event, sign=-1)])
+    await db.commit()
@@ -0,0 +1,30 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.services.export import iter_ndjson, iter_zip
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+    "zip": ("application/zip", iter_zip),
+}
+
+
+@router.get("")
+async def export_account(
+    format: Literal["ndjson", "zip"] = Query("ndjson"),
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> StreamingResponse:
+    media_type, generate = EXPORT_FORMATS[format]
+    filename = f"autoguardian-export-{current_user.id}.{format}"
+    return StreamingResponse(
+        generate(db, current_user.id),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,118 +1,105 @@
 from datetime import datetime
-from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api.pagination import PageParams, paginate
+from app.api.responses import list_response
 from app.models.offer import Offer
-from app.schemas.offer import OfferRead
+from app.schemas.offer import OfferRead, QuoteRequest
+from app.services.providers import get_provider_registry
+from app.services.quote_cache import get_quote_cache
+from app.services.scoring import OfferCatalogue, resolve_weights
 
 router = APIRouter(prefix="/offers", tags=["offers"])
 
-
-DEFAULT_WEIGHTS = {
-    "price": 0.45,
-    "coverage": 0.35,
-    "deductible": 0.1,
-    "assistance": 0.1,
-}
-
-
-MOCK_OFFERS = [
-    {
-        "provider": "Shield Insurance",
-        "premium_total": 920.50,
-        "coverage_json": {"OC": True, "AC": True, "assistance": "EU"},
-        "deductible": 500,
-        "assistance_level": "EU",
-        "link_out": "https://shield.example/policy",
-    },
-    {
-        "provider": "BudgetProtect",
-        "premium_total": 780.00,
-        "coverage_json": {"OC": True, "AC": False, "assistance": "PL"},
-        "deductible": 1000,
-        "assistance_level": "PL",
-        "link_out": "https://budget.example/policy",
-    },
-    {
-        "provider": "PremiumCar",
-        "premium_total": 1100.00,
-        "coverage_json": {"OC": True, "AC": True, "szyby": True, "assistance": "EU"},
-        "deductible": 0,
-        "assistance_level": "EU",
-        "link_out": "https://premium.example/policy",
-    },
-]
-
-
-def _normalise(values: List[float]) -> List[float]:
-    if not values:
-        return []
-    min_v, max_v = min(values), max(values)
-    if max_v == min_v:
-        return [0.5 for _ in values]
-    return [(v - min_v) / (max_v - min_v) for v in values]
+QUOTE_CACHE_HEADER = "X-Quote-Cache"
+MISSING_PROVIDERS_HEADER = "X-Quote-Missing-Providers"
 
 
 @router.post("/quote", response_model=list[OfferRead], status_code=status.HTTP_201_CREATED)
-def quote_offers(
-    payload: Dict[str, Any],
-    db: Session = Depends(deps.get_db_session),
-    current_user=Depends(deps.get_current_user),
-) -> list[OfferRead]:
-    premiums = [offer["premium_total"] for offer in MOCK_OFFERS]
-    coverage_scores = [len(offer["coverage_json"]) for offer in MOCK_OFFERS]
-    deductibles = [offer["deductible"] for offer in MOCK_OFFERS]
-    assistance_scores = [1 if offer.get("assistance_level") == "EU" else 0 for offer in MOCK_OFFERS]
+async def quote_offers(
+    payload: QuoteRequest,
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> Response:
+    try:
+        weights = resolve_weights(payload.weights)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+    registry = get_provider_registry()
+    cache = get_quote_cache()
+    cache_key = cache.make_key(current_user.id, payload.vehicle_id, payload.policy_id, weights, payload.top_k, registry.version)
+    cached_ids = cache.get(cache_key)
+    if cached_ids:
+        statement = select(Offer).where(Offer.id.in_(cached_ids), Offer.user_id == current_user.id)
+        found = {offer.id: offer for offer in await db.scalars(statement)}
+        if len(found) == len(cached_ids):
+            # cached_ids are stored in ranked order.
+            cached = [found[offer_id] for offer_id in cached_ids]
+            return list_response(OfferRead, cached, status_code=status.HTTP_201_CREATED, headers={QUOTE_CACHE_HEADER: "hit"})
+        cache.discard(cache_key)
 
-    norm_price = _normalise([-p for p in premiums])
-    norm_coverage = _normalise(coverage_scores)
-    norm_deductible = _normalise([-d for d in deductibles])
-    norm_assistance = _normalise(assistance_scores)
+    headers = {QUOTE_CACHE_HEADER: "miss"}
+    fetched = await registry.fetch_all(payload)
+    missing = fetched.timed_out + fetched.failed
+    if missing:
+        headers[MISSING_PROVIDERS_HEADER] = ",".join(missing)
+    if not fetched.offers and missing:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="No insurer returned an offer in time")
+    ranked = OfferCatalogue(fetched.offers).rank(weights, top_k=payload.top_k)
+    if not ranked:
+        return list_response(OfferRead, [], status_code=status.HTTP_201_CREATED, headers=headers)
 
-    offers_to_persist: List[Offer] = []
-    response: List[OfferRead] = []
-    for index, offer_payload in enumerate(MOCK_OFFERS):
-        score = (
-            DEFAULT_WEIGHTS["price"] * norm_price[index]
-            + DEFAULT_WEIGHTS["coverage"] * norm_coverage[index]
-            + DEFAULT_WEIGHTS["deductible"] * norm_deductible[index]
-            + DEFAULT_WEIGHTS["assistance"] * norm_assistance[index]
-        )
-        offer = Offer(
-            user_id=current_user.id,
-            vehicle_id=payload.get("vehicle_id"),
-            base_policy_id=payload.get("policy_id"),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            score_breakdown_json={
-                "score": round(score, 3),
-                "weights": DEFAULT_WEIGHTS,
-                "inputs": offer_payload,
+    now = datetime.utcnow()
+    rows = [
+        {
+            "user_id": current_user.id,
+            "vehicle_id": payload.vehicle_id,
+            "base_policy_id": payload.policy_id,
+            "provider": scored.offer["provider"],
+            "premium_total": scored.offer["premium_total"],
+            "coverage_json": scored.offer.get("coverage_json") or {},
+            "deductible": scored.offer.get("deductible"),
+            "assistance_level": scored.offer.get("assistance_level"),
+            "link_out": scored.offer.get("link_out"),
+            "score_breakdown_json": {
+                "score": round(scored.score, 3),
+                "weights": weights,
+                "components": scored.components,
+                "inputs": scored.offer,
             },
-            **offer_payload,
-        )
-        db.add(offer)
-        offers_to_persist.append(offer)
-    db.commit()
-    for offer in offers_to_persist:
-        db.refresh(offer)
-        response.append(OfferRead.from_orm(offer))
-    return response
+            "created_at": now,
+            "updated_at": now,
+        }
+        for scored in ranked
+    ]
+    # One multi-row INSERT ... RETURNING instead of an INSERT plus a refresh SELECT per offer,
+    # with the returned rows put back in the (ranked) parameter order.
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite would fall back to one INSERT per row to honour sort_by_parameter_order.
+        # Within one statement it assigns rowids in VALUES order, so sort by id instead.
+        statement = insert(Offer.__table__).returning(*Offer.__table__.c)
+        inserted = sorted((await db.execute(statement, rows)).mappings().all(), key=lambda row: row["id"])
+    else:
+        statement = insert(Offer.__table__).returning(*Offer.__table__.c, sort_by_parameter_order=True)
+        inserted = (await db.execute(statement, rows)).mappings().all()
+    await db.commit()
+    # Partial results are not cached so the next quote asks the slow providers again.
+    if fetched.complete:
+        cache.set(cache_key, tuple(row["id"] for row in inserted))
+    return list_response(OfferRead, inserted, status_code=status.HTTP_201_CREATED, headers=headers)
 
 
 @router.get("", response_model=list[OfferRead])
-def list_offers(
+async def list_offers(
     vehicle_id: int,
-    db: Session = Depends(deps.get_db_session),
-    current_user=Depends(deps.get_current_user),
-) -> list[OfferRead]:
-    offers = (
-        db.query(Offer)
-        .filter(Offer.user_id == current_user.id, Offer.vehicle_id == vehicle_id)
-        .order_by(Offer.created_at.desc())
-        .all()
-    )
-    return [OfferRead.from_orm(offer) for offer in offers]
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> Response:
+    statement = select(Offer).where(Offer.user_id == current_user.id, Offer.vehicle_id == vehicle_id)
+    return await paginate(db, statement, page, OfferRead, Offer.created_at, Offer.id, descending=True)
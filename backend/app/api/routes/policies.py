@@ -1,65 +1,90 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api.imports import import_rows
+from app.api.pagination import PageParams, paginate
+from app.api.responses import model_response
 from app.models.policy import Policy
+from app.schemas.imports import ImportReport
 from app.schemas.policy import PolicyCreate, PolicyRead, PolicyUpdate
+from app.services.quote_cache import get_quote_cache
+from app.services.reminders import sync_policies_by_id, sync_policy_reminder
 
 router = APIRouter(prefix="/policies", tags=["policies"])
 
 
 @router.get("", response_model=list[PolicyRead])
-def list_policies(
+async def list_policies(
     vehicle_id: Optional[int] = Query(None),
     policy_type: Optional[str] = Query(None),
-    db: Session = Depends(deps.get_db_session),
-    current_user=Depends(deps.get_current_user),
-) -> list[PolicyRead]:
-    query = db.query(Policy).filter(Policy.user_id == current_user.id)
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> Response:
+    statement = select(Policy).where(Policy.user_id == current_user.id)
     if vehicle_id:
-        query = query.filter(Policy.vehicle_id == vehicle_id)
+        statement = statement.where(Policy.vehicle_id == vehicle_id)
     if policy_type:
-        query = query.filter(Policy.policy_type == policy_type)
-    policies = query.all()
-    return [PolicyRead.from_orm(policy) for policy in policies]
+        statement = statement.where(Policy.policy_type == policy_type)
+    return await paginate(db, statement, page, PolicyRead, Policy.id, Policy.id, updated_column=Policy.updated_at)
 
 
 @router.post("", response_model=PolicyRead, status_code=status.HTTP_201_CREATED)
-def create_policy(payload: PolicyCreate, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> PolicyRead:
+async def create_policy(payload: PolicyCreate, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
     policy = Policy(**payload.dict(), user_id=current_user.id)
     db.add(policy)
-    db.commit()
-    db.refresh(policy)
-    return PolicyRead.from_orm(policy)
+    await db.flush()
+    await db.run_sync(sync_policy_reminder, current_user.id, policy.id)
+    await db.commit()
+    await db.refresh(policy)
+    return model_response(PolicyRead, policy, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_policies(request: Request, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> ImportReport:
+    return await import_rows(
+        request,
+        db,
+        current_user.id,
+        PolicyCreate,
+        Policy,
+        on_chunk=lambda session, rows: sync_policies_by_id(session, current_user.id, (row["id"] for row in rows)),
+    )
 
 
 @router.get("/{policy_id}", response_model=PolicyRead)
-def get_policy(policy_id: int, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> PolicyRead:
-    policy = db.query(Policy).filter(Policy.id == policy_id, Policy.user_id == current_user.id).first()
+async def get_policy(policy_id: int, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
+    policy = await db.scalar(select(Policy).where(Policy.id == policy_id, Policy.user_id == current_user.id))
     if not policy:
         raise HTTPException(status_code=404, detail="Policy not found")
-    return PolicyRead.from_orm(policy)
+    return model_response(PolicyRead, policy)
 
 
 @router.put("/{policy_id}", response_model=PolicyRead)
-def update_policy(policy_id: int, payload: PolicyUpdate, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> PolicyRead:
-    policy = db.query(Policy).filter(Policy.id == policy_id, Policy.user_id == current_user.id).first()
+async def update_policy(policy_id: int, payload: PolicyUpdate, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
+    policy = await db.scalar(select(Policy).where(Policy.id == policy_id, Policy.user_id == current_user.id))
     if not policy:
         raise HTTPException(status_code=404, detail="Policy not found")
     for key, value in payload.dict(exclude_unset=True).items():
         setattr(policy, key, value)
     db.add(policy)
-    db.commit()
-    db.refresh(policy)
-    return PolicyRead.from_orm(policy)
+    await db.flush()
+    await db.run_sync(sync_policy_reminder, current_user.id, policy.id)
+    await db.commit()
+    get_quote_cache().invalidate_policy(current_user.id, policy_id)
+    await db.refresh(policy)
+    return model_response(PolicyRead, policy)
 
 
 @router.delete("/{policy_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_policy(policy_id: int, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> None:
-    policy = db.query(Policy).filter(Policy.id == policy_id, Policy.user_id == current_user.id).first()
+async def delete_policy(policy_id: int, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> None:
+    policy = await db.scalar(select(Policy).where(Policy.id == policy_id, Policy.user_id == current_user.id))
     if not policy:
         raise HTTPException(status_code=404, detail="Policy not found")
-    db.delete(policy)
-    db.commit()
+    await db.delete(policy)
+    await db.commit()
+    get_quote_cache().invalidate_policy(current_user.id, policy_id)
@@ -0,0 +1,27 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.api.responses import list_response
+from app.core.config import get_settings
+from app.schemas.search import SearchHit
+from app.services.search import search
+
+router = APIRouter(prefix="/search", tags=["search"])
+settings = get_settings()
+
+
+@router.get("", response_model=list[SearchHit])
+async def search_documents(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[List[Literal["policy", "event"]]] = Query(None, alias="type"),
+    limit: int = Query(20, ge=1, le=settings.max_page_size),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> Response:
+    """Policies (document text) and events (notes, workshop) matching every word of ``q``, best first."""
+    hits = await search(db, current_user.id, q, kinds=types, limit=limit, offset=offset)
+    return list_response(SearchHit, hits)
@@ -1,30 +1,70 @@
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
+from kombu.exceptions import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api.responses import model_response
+from app.core.config import get_settings
 from app.models.policy import Policy
 from app.schemas.policy import PolicyCreate, PolicyRead
-from app.services.ocr import extract_policy_metadata
+from app.services.documents import DocumentTooLargeError, scan_upload, store_document
+from app.services.extraction_cache import get_extraction_cache
+from app.services.reminders import sync_policy_reminder
+from app.workers.extraction import extract_document
+from app.workers.jobs import JOB_FAILED, JOB_SUCCEEDED, get_job_store, new_job
 
 router = APIRouter(prefix="/upload", tags=["upload"])
+settings = get_settings()
 
 
-@router.post("", status_code=status.HTTP_200_OK)
-def upload_document(file: UploadFile = File(...)) -> dict:
-    contents = file.file.read()
-    if not contents:
+@router.post("", status_code=status.HTTP_202_ACCEPTED)
+def upload_document(file: UploadFile = File(...), current_user=Depends(deps.get_current_principal)) -> dict:
+    try:
+        document = scan_upload(file.file, settings.upload_max_bytes, settings.upload_chunk_size)
+    except DocumentTooLargeError as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File too large") from exc
+    if not document.size:
         raise HTTPException(status_code=400, detail="Empty file")
-    return extract_policy_metadata(contents, file.filename)
+
+    store = get_job_store()
+    job = new_job(user_id=current_user.id, filename=file.filename, sha256=document.sha256, size_bytes=document.size)
+    cached = get_extraction_cache().get(current_user.id, document.sha256)
+    if cached is not None:
+        # This user's same bytes were extracted before: answer with a finished job and skip OCR entirely.
+        job.update(status=JOB_SUCCEEDED, result=cached, cached=True)
+        store.save(job)
+        return job
+
+    path = store_document(document, settings.upload_storage_dir, job["job_id"], settings.upload_chunk_size)
+    store.save(job)
+    try:
+        extract_document.delay(job["job_id"], str(path), file.filename, document.sha256, current_user.id)
+    except OperationalError as exc:
+        path.unlink(missing_ok=True)
+        store.update(job["job_id"], status=JOB_FAILED, error="Extraction queue unavailable")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Extraction queue unavailable") from exc
+    return store.get(job["job_id"]) or job
+
+
+@router.get("/jobs/{job_id}")
+def get_extraction_job(job_id: str, current_user=Depends(deps.get_current_principal)) -> dict:
+    job = get_job_store().get(job_id)
+    # Someone else's job is indistinguishable from a missing one.
+    if job is None or job.get("user_id") != current_user.id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
 
 @router.post("/policies/from-extraction", response_model=PolicyRead, status_code=status.HTTP_201_CREATED)
-def create_policy_from_extraction(
+async def create_policy_from_extraction(
     payload: PolicyCreate,
-    db: Session = Depends(deps.get_db_session),
-    current_user=Depends(deps.get_current_user),
-) -> PolicyRead:
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> Response:
     policy = Policy(**payload.dict(), user_id=current_user.id)
     db.add(policy)
-    db.commit()
-    db.refresh(policy)
-    return PolicyRead.from_orm(policy)
+    await db.flush()
+    await db.run_sync(sync_policy_reminder, current_user.id, policy.id)
+    await db.commit()
+    await db.refresh(policy)
+    return model_response(PolicyRead, policy, status_code=status.HTTP_201_CREATED)
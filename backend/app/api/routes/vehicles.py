@@ -1,53 +1,68 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.api.pagination import PageParams, paginate
+from app.api.responses import model_response
 from app.models.vehicle import Vehicle
 from app.schemas.vehicle import VehicleCreate, VehicleRead, VehicleUpdate
+from app.services.quote_cache import get_quote_cache
+from app.services.reminders import sync_vehicle_reminders
 
 router = APIRouter(prefix="/vehicles", tags=["vehicles"])
 
 
 @router.get("", response_model=list[VehicleRead])
-def list_vehicles(db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> list[VehicleRead]:
-    vehicles = db.query(Vehicle).filter(Vehicle.user_id == current_user.id).all()
-    return [VehicleRead.from_orm(vehicle) for vehicle in vehicles]
+async def list_vehicles(
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(deps.get_async_db_session),
+    current_user=Depends(deps.get_current_principal),
+) -> Response:
+    statement = select(Vehicle).where(Vehicle.user_id == current_user.id)
+    return await paginate(db, statement, page, VehicleRead, Vehicle.id, Vehicle.id, updated_column=Vehicle.updated_at)
 
 
 @router.post("", response_model=VehicleRead, status_code=status.HTTP_201_CREATED)
-def create_vehicle(payload: VehicleCreate, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> VehicleRead:
+async def create_vehicle(payload: VehicleCreate, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
     vehicle = Vehicle(**payload.dict(), user_id=current_user.id)
     db.add(vehicle)
-    db.commit()
-    db.refresh(vehicle)
-    return VehicleRead.from_orm(vehicle)
+    await db.flush()
+    await db.run_sync(sync_vehicle_reminders, current_user.id, vehicle.id)
+    await db.commit()
+    await db.refresh(vehicle)
+    return model_response(VehicleRead, vehicle, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{vehicle_id}", response_model=VehicleRead)
-def get_vehicle(vehicle_id: int, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> VehicleRead:
-    vehicle = db.query(Vehicle).filter(Vehicle.id == vehicle_id, Vehicle.user_id == current_user.id).first()
+async def get_vehicle(vehicle_id: int, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
+    vehicle = await db.scalar(select(Vehicle).where(Vehicle.id == vehicle_id, Vehicle.user_id == current_user.id))
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
-    return VehicleRead.from_orm(vehicle)
+    return model_response(VehicleRead, vehicle)
 
 
 @router.put("/{vehicle_id}", response_model=VehicleRead)
-def update_vehicle(vehicle_id: int, payload: VehicleUpdate, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> VehicleRead:
-    vehicle = db.query(Vehicle).filter(Vehicle.id == vehicle_id, Vehicle.user_id == current_user.id).first()
+async def update_vehicle(vehicle_id: int, payload: VehicleUpdate, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> Response:
+    vehicle = await db.scalar(select(Vehicle).where(Vehicle.id == vehicle_id, Vehicle.user_id == current_user.id))
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
     for key, value in payload.dict(exclude_unset=True).items():
         setattr(vehicle, key, value)
     db.add(vehicle)
-    db.commit()
-    db.refresh(vehicle)
-    return VehicleRead.from_orm(vehicle)
+    await db.flush()
+    await db.run_sync(sync_vehicle_reminders, current_user.id, vehicle.id)
+    await db.commit()
+    get_quote_cache().invalidate_vehicle(current_user.id, vehicle_id)
+    await db.refresh(vehicle)
+    return model_response(VehicleRead, vehicle)
 
 
 @router.delete("/{vehicle_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_vehicle(vehicle_id: int, db: Session = Depends(deps.get_db_session), current_user=Depends(deps.get_current_user)) -> None:
-    vehicle = db.query(Vehicle).filter(Vehicle.id == vehicle_id, Vehicle.user_id == current_user.id).first()
+async def delete_vehicle(vehicle_id: int, db: AsyncSession = Depends(deps.get_async_db_session), current_user=Depends(deps.get_current_principal)) -> None:
+    vehicle = await db.scalar(select(Vehicle).where(Vehicle.id == vehicle_id, Vehicle.user_id == current_user.id))
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
-    db.delete(vehicle)
-    db.commit()
+    await db.delete(vehicle)
+    await db.commit()
+    get_quote_cache().invalidate_vehicle(current_user.id, vehicle_id)
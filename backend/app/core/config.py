@@ -11,12 +11,74 @@ class Settings(BaseSettings):
     secret_key: str = Field("change-me", env="SECRET_KEY")
     access_token_expire_minutes: int = 30
     refresh_token_expire_minutes: int = 60 * 24 * 14
+    token_revocation_backend: str = Field("memory", env="TOKEN_REVOCATION_BACKEND")
+    token_revocation_max_entries: int = Field(1_000_000, env="TOKEN_REVOCATION_MAX_ENTRIES")
+    token_revocation_filter_capacity: int = Field(100_000, env="TOKEN_REVOCATION_FILTER_CAPACITY")
+    token_revocation_filter_error_rate: float = Field(0.001, env="TOKEN_REVOCATION_FILTER_ERROR_RATE")
+    token_revocation_sync_seconds: float = Field(5.0, env="TOKEN_REVOCATION_SYNC_SECONDS")
+    bcrypt_rounds: int = Field(12, env="BCRYPT_ROUNDS")
+    password_hash_executor: str = Field("process", env="PASSWORD_HASH_EXECUTOR")
+    password_hash_workers: int | None = Field(None, env="PASSWORD_HASH_WORKERS")
+    password_hash_queue_limit: int = Field(64, env="PASSWORD_HASH_QUEUE_LIMIT")
+    rate_limit_enabled: bool = Field(True, env="RATE_LIMIT_ENABLED")
+    rate_limit_backend: str = Field("memory", env="RATE_LIMIT_BACKEND")
+    auth_rate_limit_ip_burst: int = Field(20, env="AUTH_RATE_LIMIT_IP_BURST")
+    auth_rate_limit_ip_per_minute: float = Field(10.0, env="AUTH_RATE_LIMIT_IP_PER_MINUTE")
+    auth_rate_limit_email_burst: int = Field(5, env="AUTH_RATE_LIMIT_EMAIL_BURST")
+    auth_rate_limit_email_per_minute: float = Field(2.0, env="AUTH_RATE_LIMIT_EMAIL_PER_MINUTE")
 
     sqlalchemy_database_uri: str = Field("sqlite:///./dev.db", env="DATABASE_URL")
     alembic_ini_path: Path = Path(__file__).resolve().parents[2] / "alembic.ini"
+    db_pool_size: int = Field(5, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, env="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(30.0, env="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_recycle_seconds: int = Field(1800, env="DB_POOL_RECYCLE_SECONDS")
+    db_pool_pre_ping: bool = Field(False, env="DB_POOL_PRE_PING")
+    db_statement_timeout_ms: int = Field(30_000, env="DB_STATEMENT_TIMEOUT_MS")
+    db_prepared_statement_cache_size: int = Field(500, env="DB_PREPARED_STATEMENT_CACHE_SIZE")
+    db_query_cache_size: int = Field(500, env="DB_QUERY_CACHE_SIZE")
+    sqlite_journal_mode: str = Field("WAL", env="SQLITE_JOURNAL_MODE")
+    sqlite_synchronous: str = Field("NORMAL", env="SQLITE_SYNCHRONOUS")
+    sqlite_busy_timeout_ms: int = Field(5000, env="SQLITE_BUSY_TIMEOUT_MS")
+    sqlite_mmap_size: int = Field(256 * 1024 * 1024, env="SQLITE_MMAP_SIZE")
+
+    default_page_size: int = Field(100, env="DEFAULT_PAGE_SIZE")
+    max_page_size: int = Field(1000, env="MAX_PAGE_SIZE")
+    stream_batch_size: int = Field(500, env="STREAM_BATCH_SIZE")
+
+    principal_cache_backend: str = Field("memory", env="PRINCIPAL_CACHE_BACKEND")
+    principal_cache_ttl_seconds: int = Field(60, env="PRINCIPAL_CACHE_TTL_SECONDS")
+    principal_cache_max_entries: int = Field(10_000, env="PRINCIPAL_CACHE_MAX_ENTRIES")
+
+    quote_cache_ttl_seconds: int = Field(15 * 60, env="QUOTE_CACHE_TTL_SECONDS")
+    quote_cache_max_entries: int = Field(10_000, env="QUOTE_CACHE_MAX_ENTRIES")
+    quote_provider_timeout_seconds: float = Field(2.0, env="QUOTE_PROVIDER_TIMEOUT_SECONDS")
+    quote_deadline_seconds: float = Field(4.0, env="QUOTE_DEADLINE_SECONDS")
+    quote_stub_latency_seconds: float = Field(0.0, env="QUOTE_STUB_LATENCY_SECONDS")
+
+    upload_max_bytes: int = Field(20 * 1024 * 1024, env="UPLOAD_MAX_BYTES")
+    upload_chunk_size: int = Field(1024 * 1024, env="UPLOAD_CHUNK_SIZE")
+    upload_storage_dir: Path = Field(Path(__file__).resolve().parents[2] / "var" / "uploads", env="UPLOAD_STORAGE_DIR")
+
+    extraction_jobs_eager: bool = Field(False, env="EXTRACTION_JOBS_EAGER")
+    extraction_job_ttl_seconds: int = Field(24 * 60 * 60, env="EXTRACTION_JOB_TTL_SECONDS")
+    extraction_job_max_entries: int = Field(10_000, env="EXTRACTION_JOB_MAX_ENTRIES")
+    extraction_cache_ttl_seconds: int = Field(7 * 24 * 60 * 60, env="EXTRACTION_CACHE_TTL_SECONDS")
+    extraction_cache_max_entries: int = Field(1_000, env="EXTRACTION_CACHE_MAX_ENTRIES")
+
+    reminder_scheduler_batch_size: int = Field(500, env="REMINDER_SCHEDULER_BATCH_SIZE")
+    reminder_scheduler_horizon_hours: int = Field(24, env="REMINDER_SCHEDULER_HORIZON_HOURS")
+    reminder_scheduler_lease_seconds: int = Field(600, env="REMINDER_SCHEDULER_LEASE_SECONDS")
+    reminder_scheduler_poll_seconds: float = Field(60.0, env="REMINDER_SCHEDULER_POLL_SECONDS")
+    reminder_policy_lead_days: int = Field(30, env="REMINDER_POLICY_LEAD_DAYS")
+    reminder_backfill_batch_size: int = Field(200, env="REMINDER_BACKFILL_BATCH_SIZE")
+    rollup_rebuild_batch_size: int = Field(500, env="ROLLUP_REBUILD_BATCH_SIZE")
+
+    import_chunk_size: int = Field(500, env="IMPORT_CHUNK_SIZE")
 
     allowed_origins: List[str] = Field(default_factory=lambda: ["*"], env="ALLOWED_ORIGINS")
     redis_url: str = Field("redis://redis:6379/0", env="REDIS_URL")
+    redis_socket_timeout: float = Field(0.5, env="REDIS_SOCKET_TIMEOUT")
     minio_endpoint: str | None = Field(None, env="MINIO_ENDPOINT")
     minio_access_key: str | None = Field(None, env="MINIO_ACCESS_KEY")
     minio_secret_key: str | None = Field(None, env="MINIO_SECRET_KEY")
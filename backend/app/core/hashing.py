@@ -0,0 +1,74 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from app.core import security
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class HashingOverloadedError(Exception):
+    """Raised when more password hashing work is queued than the pool accepts."""
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated pool so it never blocks the event loop or the request threadpool.
+
+    At most ``max_workers + queue_limit`` operations may be in flight; anything beyond
+    that is rejected immediately instead of queueing behind a login storm.
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int, use_processes: bool = True) -> None:
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+                else:
+                    self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.queue_limit:
+                raise HashingOverloadedError
+            self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(security.get_password_hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        return await self._run(security.verify_and_update_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    return PasswordHasher(
+        max_workers=settings.password_hash_workers or os.cpu_count() or 1,
+        queue_limit=settings.password_hash_queue_limit,
+        use_processes=settings.password_hash_executor == "process",
+    )
@@ -0,0 +1,108 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, NamedTuple
+
+import redis
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class Bucket(NamedTuple):
+    """Token bucket shape: up to ``capacity`` requests in a burst, refilled at ``refill_per_second``."""
+
+    capacity: float
+    refill_per_second: float
+
+    @classmethod
+    def per_minute(cls, capacity: float, per_minute: float) -> "Bucket":
+        return cls(capacity, per_minute / 60)
+
+
+class RateLimiter:
+    """In-process token buckets, one per key; enough for a single API process.
+
+    ``acquire`` takes a token and returns ``0.0``, or returns how many seconds to
+    wait until one is available. The least recently used keys are forgotten beyond
+    ``max_keys``, which only ever resets them to a full bucket.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, bucket: Bucket) -> float:
+        with self._lock:
+            now = self._clock()
+            tokens, updated_at = self._buckets.get(key, (bucket.capacity, now))
+            tokens = min(bucket.capacity, tokens + (now - updated_at) * bucket.refill_per_second)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / bucket.refill_per_second
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return wait
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+# Same algorithm as RateLimiter.acquire, run atomically on the Redis server with its
+# clock, so every API process shares the buckets. Returns the wait as a string
+# because Lua numbers are truncated to integers on the way back.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """Buckets shared by all API processes, falling back to in-process buckets if Redis is unavailable."""
+
+    key_prefix = "ratelimit:"
+
+    def __init__(self, client: redis.Redis, max_keys: int = 100_000) -> None:
+        super().__init__(max_keys)
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def acquire(self, key: str, bucket: Bucket) -> float:
+        try:
+            return float(self._script(keys=[self.key_prefix + key], args=[bucket.capacity, bucket.refill_per_second]))
+        except redis.RedisError:
+            logger.warning("Rate limiter: Redis unavailable, using in-process buckets")
+            return super().acquire(key, bucket)
+
+
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    if settings.rate_limit_backend == "redis":
+        client = redis.Redis.from_url(settings.redis_url, socket_timeout=settings.redis_socket_timeout)
+        return RedisRateLimiter(client)
+    return RateLimiter()
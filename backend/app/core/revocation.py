@@ -0,0 +1,204 @@
+"""Refresh-token rotation state: spent token ids and revoked token families.
+
+Every refresh token carries a ``jti`` and the ``fam`` (family) of the login it
+descends from. Refreshing spends the ``jti``; presenting a spent one again means the
+token was copied, so the whole family is revoked. Access tokens carry the family too
+and are checked with ``is_family_revoked``, which a Bloom filter of revoked families
+answers locally in the common, not-revoked case.
+"""
+import logging
+import math
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict
+
+import redis
+
+from app.core.bloom import BloomFilter
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ROTATED = "rotated"
+REUSED = "reused"
+REVOKED = "revoked"
+
+
+class RevocationStore:
+    """In-process store for a single API process.
+
+    Spent ids are kept until their token would have expired anyway, up to
+    ``max_entries``; revoked families for ``family_ttl_seconds``, the longest any
+    token issued before the revocation can live.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        family_ttl_seconds: float,
+        filter_capacity: int,
+        filter_error_rate: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.family_ttl_seconds = family_ttl_seconds
+        self.filter_capacity = filter_capacity
+        self.filter_error_rate = filter_error_rate
+        self._clock = clock
+        self._spent: TTLCache[bool] = TTLCache(max_entries, family_ttl_seconds, clock=clock)
+        self._revoked: Dict[str, float] = {}
+        self._filter = BloomFilter(filter_capacity, filter_error_rate)
+        self._lock = threading.Lock()
+
+    def _remember_revoked(self, family: str, expires_at: float) -> None:
+        # Bloom filters cannot forget, so expired families are dropped by rebuilding it.
+        # If most families are still live the filter doubles, leaving room for at least
+        # as many revocations as it holds before the next rebuild.
+        if family in self._revoked:
+            # Already in the filter (syncs re-read every live family); only extend it.
+            self._revoked[family] = max(expires_at, self._revoked[family])
+            return
+        self._revoked[family] = expires_at
+        self._filter.add(family)
+        if self._filter.count > self.filter_capacity:
+            now = self._clock()
+            self._revoked = {name: until for name, until in self._revoked.items() if until > now}
+            while len(self._revoked) * 2 > self.filter_capacity:
+                self.filter_capacity *= 2
+            self._filter = BloomFilter(self.filter_capacity, self.filter_error_rate, self._revoked)
+
+    def _family_revoked(self, family: str) -> bool:
+        return self._revoked.get(family, 0) > self._clock()
+
+    def rotate(self, jti: str, family: str, ttl_seconds: float) -> str:
+        """Spend ``jti``: ``ROTATED`` the first time, ``REUSED`` (family now revoked) after that."""
+        with self._lock:
+            if self._family_revoked(family):
+                return REVOKED
+            if self._spent.get(jti):
+                self._remember_revoked(family, self._clock() + self.family_ttl_seconds)
+                return REUSED
+            self._spent.set(jti, True, ttl_seconds)
+            return ROTATED
+
+    def revoke_family(self, family: str) -> None:
+        with self._lock:
+            self._remember_revoked(family, self._clock() + self.family_ttl_seconds)
+
+    def is_family_revoked(self, family: str) -> bool:
+        if family not in self._filter:
+            return False
+        return self._family_revoked(family)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spent.clear()
+            self._revoked.clear()
+            self._filter = BloomFilter(self.filter_capacity, self.filter_error_rate)
+
+
+# Checks the family and spends the token in one round trip. KEYS: spent id, revoked
+# family, index of revoked families; ARGV: token ttl, family ttl, family expiry, family.
+ROTATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 'revoked'
+end
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return 'rotated'
+end
+redis.call('SET', KEYS[2], '1', 'EX', ARGV[2])
+redis.call('ZADD', KEYS[3], ARGV[3], ARGV[4])
+return 'reused'
+"""
+
+
+class RedisRevocationStore(RevocationStore):
+    """State shared by all API processes through Redis.
+
+    Rotation always asks Redis, since spending a token has to be atomic across
+    processes. The local Bloom filter is rebuilt from Redis's index of revoked
+    families at most every ``sync_seconds``, so a revocation made by another process
+    reaches access-token checks within that delay. If Redis is unavailable the
+    in-process state is used.
+    """
+
+    key_prefix = "refresh:"
+
+    def __init__(self, client: redis.Redis, *args, sync_seconds: float = 5.0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._client = client
+        self._rotate_script = client.register_script(ROTATE_SCRIPT)
+        self.sync_seconds = sync_seconds
+        self._synced_at = -math.inf
+        self._index_key = self.key_prefix + "revoked"
+
+    def _family_key(self, family: str) -> str:
+        return f"{self.key_prefix}revoked:{family}"
+
+    def rotate(self, jti: str, family: str, ttl_seconds: float) -> str:
+        keys = [f"{self.key_prefix}spent:{jti}", self._family_key(family), self._index_key]
+        expires_at = self._clock() + self.family_ttl_seconds
+        try:
+            result = self._rotate_script(keys=keys, args=[max(1, int(ttl_seconds)), int(self.family_ttl_seconds), expires_at, family])
+        except redis.RedisError:
+            logger.warning("Token revocation: Redis unavailable, using in-process state")
+            return super().rotate(jti, family, ttl_seconds)
+        result = result.decode() if isinstance(result, bytes) else result
+        if result == REUSED:
+            with self._lock:
+                self._remember_revoked(family, expires_at)
+        return result
+
+    def revoke_family(self, family: str) -> None:
+        super().revoke_family(family)
+        now = self._clock()
+        try:
+            with self._client.pipeline() as pipe:
+                pipe.set(self._family_key(family), "1", ex=int(self.family_ttl_seconds))
+                pipe.zadd(self._index_key, {family: now + self.family_ttl_seconds})
+                pipe.zremrangebyscore(self._index_key, "-inf", now)
+                pipe.execute()
+        except redis.RedisError:
+            logger.warning("Token revocation: could not record revoked family %s in Redis", family)
+
+    def _sync_filter(self) -> None:
+        now = self._clock()
+        if now - self._synced_at < self.sync_seconds:
+            return
+        self._synced_at = now
+        try:
+            revoked = self._client.zrangebyscore(self._index_key, now, "+inf", withscores=True)
+        except redis.RedisError:
+            logger.warning("Token revocation: Redis unavailable, revoked families not refreshed")
+            return
+        with self._lock:
+            for family, expires_at in revoked:
+                self._remember_revoked(family.decode() if isinstance(family, bytes) else family, expires_at)
+
+    def _family_revoked(self, family: str) -> bool:
+        if super()._family_revoked(family):
+            return True
+        try:
+            return bool(self._client.exists(self._family_key(family)))
+        except redis.RedisError:
+            return False
+
+    def is_family_revoked(self, family: str) -> bool:
+        self._sync_filter()
+        return super().is_family_revoked(family)
+
+
+@lru_cache
+def get_revocation_store() -> RevocationStore:
+    options = dict(
+        max_entries=settings.token_revocation_max_entries,
+        family_ttl_seconds=settings.refresh_token_expire_minutes * 60,
+        filter_capacity=settings.token_revocation_filter_capacity,
+        filter_error_rate=settings.token_revocation_filter_error_rate,
+    )
+    if settings.token_revocation_backend == "redis":
+        client = redis.Redis.from_url(settings.redis_url, socket_timeout=settings.redis_socket_timeout)
+        return RedisRevocationStore(client, sync_seconds=settings.token_revocation_sync_seconds, **options)
+    return RevocationStore(**options)
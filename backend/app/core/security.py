@@ -1,33 +1,56 @@
+import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 settings = get_settings()
+# Pinning min/max to the configured cost makes hashes with any other cost "need update",
+# so they are transparently rehashed on the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+    bcrypt__max_rounds=settings.bcrypt_rounds,
+)
 
 
-def create_token(subject: str, expires_delta: timedelta) -> str:
-    to_encode: Dict[str, Any] = {"sub": subject, "exp": datetime.utcnow() + expires_delta}
+REFRESH_TOKEN_TYPE = "refresh"
+
+
+def create_token(subject: str, expires_delta: timedelta, **claims: Any) -> str:
+    to_encode: Dict[str, Any] = {"sub": subject, "exp": datetime.utcnow() + expires_delta, **claims}
     return jwt.encode(to_encode, settings.secret_key, algorithm="HS256")
 
 
-def create_access_token(subject: str) -> str:
+def create_access_token(subject: str, family: Optional[str] = None) -> str:
     expires = timedelta(minutes=settings.access_token_expire_minutes)
-    return create_token(subject, expires)
+    return create_token(subject, expires, **({"fam": family} if family else {}))
 
 
-def create_refresh_token(subject: str) -> str:
+def create_refresh_token(subject: str, family: str) -> str:
+    """A single-use refresh token; ``family`` ties it to the login it was rotated from."""
     expires = timedelta(minutes=settings.refresh_token_expire_minutes)
-    return create_token(subject, expires)
+    return create_token(subject, expires, typ=REFRESH_TOKEN_TYPE, jti=uuid.uuid4().hex, fam=family)
+
+
+def create_token_pair(subject: str, family: Optional[str] = None) -> Tuple[str, str]:
+    """Access and refresh token for a new login (new family) or a rotation (same family)."""
+    family = family or uuid.uuid4().hex
+    return create_access_token(subject, family), create_refresh_token(subject, family)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
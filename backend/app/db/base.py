@@ -1,2 +1,3 @@
 from app.db.base_class import Base  # noqa
-from app.models import user, vehicle, policy, event, reminder, offer  # noqa
+from app.models import user, vehicle, policy, event, reminder, offer, cost_rollup  # noqa
+from app.db import search  # noqa - full-text index DDL for the tables above
@@ -0,0 +1,86 @@
+"""Full-text indexes over the free-text columns of policies and events.
+
+SQLite gets an external-content FTS5 table per source table, kept in sync by
+triggers; PostgreSQL gets a GIN index on the same ``to_tsvector`` expression the
+search query uses, which the database maintains by itself. Neither is a mapped
+table, so the DDL hangs off the source tables' create/drop events, and Alembic is
+told to ignore the reflected objects (see ``include_object``). A SQLite batch
+migration that recreates ``policies`` or ``events`` drops the triggers with the old
+table and has to create them again.
+"""
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from sqlalchemy import DDL, Table, event
+
+from app.models.event import Event
+from app.models.policy import Policy
+
+# Text search configuration for PostgreSQL; "simple" does no stemming, like FTS5's
+# unicode61 tokenizer, so both backends match the same words.
+TEXT_SEARCH_CONFIG = "simple"
+FTS5_TOKENIZER = "unicode61 remove_diacritics 2"
+
+
+class SearchIndex(NamedTuple):
+    table: Table
+    columns: Tuple[str, ...]
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table.name}_fts"
+
+    @property
+    def gin_index(self) -> str:
+        return f"ix_{self.table.name}_search"
+
+    def document(self, alias: str) -> str:
+        """The ``to_tsvector`` expression; the query must repeat it verbatim to use the GIN index."""
+        text = " || ' ' || ".join(f"coalesce({alias}.{column}, '')" for column in self.columns)
+        return f"to_tsvector('{TEXT_SEARCH_CONFIG}', {text})"
+
+
+SEARCH_INDEXES: Dict[str, SearchIndex] = {
+    "policy": SearchIndex(Policy.__table__, ("raw_text",)),
+    "event": SearchIndex(Event.__table__, ("workshop_name", "notes")),
+}
+
+
+def sqlite_create_statements(index: SearchIndex) -> List[str]:
+    table, fts = index.table.name, index.fts_table
+    columns = ", ".join(index.columns)
+    new_values = ", ".join(f"new.{column}" for column in index.columns)
+    old_values = ", ".join(f"old.{column}" for column in index.columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});"
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values});"
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content='{table}', content_rowid='id', tokenize='{FTS5_TOKENIZER}')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {columns} ON {table} BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def postgresql_create_statements(index: SearchIndex) -> List[str]:
+    return [f"CREATE INDEX {index.gin_index} ON {index.table.name} USING gin ({index.document(index.table.name)})"]
+
+
+for _index in SEARCH_INDEXES.values():
+    for _statement in sqlite_create_statements(_index):
+        event.listen(_index.table, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    for _statement in postgresql_create_statements(_index):
+        event.listen(_index.table, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+    # The triggers go with the source table; the FTS5 table has to be dropped on its own.
+    event.listen(_index.table, "before_drop", DDL(f"DROP TABLE IF EXISTS {_index.fts_table}").execute_if(dialect="sqlite"))
+
+_IGNORED_TABLE_PREFIXES = tuple(index.fts_table for index in SEARCH_INDEXES.values())
+_IGNORED_INDEXES = {index.gin_index for index in SEARCH_INDEXES.values()}
+
+
+def include_object(object: Any, name: str, type_: str, reflected: bool, compare_to: Any) -> bool:
+    """Alembic hook: skip the search tables (and FTS5 shadow tables) and GIN indexes."""
+    if reflected and compare_to is None:
+        if type_ == "table" and name.startswith(_IGNORED_TABLE_PREFIXES):
+            return False
+        if type_ == "index" and name in _IGNORED_INDEXES:
+            return False
+    return True
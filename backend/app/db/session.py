@@ -1,13 +1,105 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.sqlalchemy_database_uri, pool_pre_ping=True)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(database_uri: str) -> URL:
+    url = make_url(database_uri)
+    backend = url.get_backend_name()
+    if backend in ASYNC_DRIVERS:
+        return url.set(drivername=ASYNC_DRIVERS[backend])
+    return url
+
+
+def sqlite_pragmas() -> list[str]:
+    # WAL lets readers run alongside the single writer, and busy_timeout makes a
+    # writer wait for the lock instead of failing with "database is locked".
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+    ]
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in sqlite_pragmas():
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def engine_options(url: URL) -> Dict[str, Any]:
+    """``create_engine`` arguments for the database behind ``url``, from the settings."""
+    options: Dict[str, Any] = {"query_cache_size": settings.db_query_cache_size}
+    if url.get_backend_name() != "postgresql":
+        # SQLite keeps the driver's default pool (aiosqlite: a connection per session).
+        return options
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    statement_timeout = str(settings.db_statement_timeout_ms)
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": statement_timeout},
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        }
+    else:
+        options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+    return options
+
+
+def make_engine(database_uri: str) -> Engine:
+    url = make_url(database_uri)
+    engine = create_engine(url, **engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine, "connect", apply_sqlite_pragmas)
+    return engine
+
+
+def make_async_engine(database_uri: str) -> AsyncEngine:
+    url = async_database_url(database_uri)
+    engine = create_async_engine(url, **engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", apply_sqlite_pragmas)
+    return engine
+
+
+def pool_stats(engine: Engine | AsyncEngine) -> Dict[str, Any]:
+    """Connection counts of the engine's pool; pools without a fixed size only report their type."""
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    return stats
+
+
+engine = make_engine(settings.sqlalchemy_database_uri)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = make_async_engine(settings.sqlalchemy_database_uri)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 
 def get_db():
     db = SessionLocal()
@@ -15,3 +107,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
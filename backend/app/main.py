@@ -1,8 +1,18 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.routes import auth, events, offers, policies, reminders, upload, vehicles
+from app.api import deps
+from app.api.middleware import BodySizeLimitMiddleware
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.api.responses import FastJSONResponse
+from app.api.routes import analytics, auth, events, export, offers, policies, reminders, search, upload, vehicles
 from app.core.config import get_settings
+from app.core.hashing import get_password_hasher
+from app.db.session import async_engine, engine, pool_stats
 
 settings = get_settings()
 
@@ -17,7 +27,28 @@ default_allowed_origins = [
 # Jeśli .env nie definiuje allowed_origins, ustaw domyślne
 allowed_origins = getattr(settings, "allowed_origins", default_allowed_origins) or default_allowed_origins
 
-app = FastAPI(title=settings.app_name, openapi_url=f"{settings.api_v1_prefix}/openapi.json")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    get_password_hasher().shutdown()
+    await async_engine.dispose()
+    engine.dispose()
+
+
+app = FastAPI(
+    title=settings.app_name,
+    openapi_url=f"{settings.api_v1_prefix}/openapi.json",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# Limit rozmiaru uploadu (multipart ma niewielki narzut ponad sam plik)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_bytes=settings.upload_max_bytes + 64 * 1024,
+    path_prefixes=[f"{settings.api_v1_prefix}/upload"],
+)
 
 # ✅ Middleware CORS
 app.add_middleware(
@@ -26,6 +57,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 # ✅ Routery z prefixem /api/v1
@@ -36,9 +68,23 @@ app.include_router(events.router, prefix=settings.api_v1_prefix)
 app.include_router(reminders.router, prefix=settings.api_v1_prefix)
 app.include_router(offers.router, prefix=settings.api_v1_prefix)
 app.include_router(upload.router, prefix=settings.api_v1_prefix)
+app.include_router(export.router, prefix=settings.api_v1_prefix)
+app.include_router(analytics.router, prefix=settings.api_v1_prefix)
+app.include_router(search.router, prefix=settings.api_v1_prefix)
 
 
 @app.get("/health", tags=["health"])
 async def health() -> dict[str, str]:
     """Prosty endpoint testowy"""
     return {"status": "ok"}
+
+
+@app.get("/health/db", tags=["health"])
+async def database_health(db: AsyncSession = Depends(deps.get_async_db_session)) -> dict:
+    """Round trip to the database plus connection pool usage, for monitoring."""
+    await db.execute(text("SELECT 1"))
+    return {
+        "status": "ok",
+        "dialect": engine.dialect.name,
+        "pools": {"sync": pool_stats(engine), "async": pool_stats(async_engine)},
+    }
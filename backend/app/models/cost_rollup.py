@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from app.db.base_class import Base
+
+
+class CostRollup(Base):
+    """Event costs summed per vehicle, calendar month and event type."""
+
+    __tablename__ = "cost_rollups"
+    __table_args__ = (UniqueConstraint("user_id", "vehicle_id", "month", "type", name="uq_cost_rollups_user_vehicle_month_type"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    vehicle_id = Column(Integer, ForeignKey("vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
+    month = Column(Date, nullable=False)  # first day of the month
+    type = Column(String, nullable=False)
+    event_count = Column(Integer, nullable=False, default=0)
+    cost_total = Column(Numeric(12, 2), nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    vehicle = relationship("Vehicle", back_populates="cost_rollups")
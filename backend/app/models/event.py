@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, JSON, Numeric, String
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, JSON, Numeric, String
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -8,9 +8,14 @@ from app.db.base_class import Base
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Serves the event list (user, optional vehicle/type filters, newest first); the
+        # index is walked backwards for DESC, so no per-column direction is needed.
+        Index("ix_events_user_vehicle_type_date", "user_id", "vehicle_id", "type", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     vehicle_id = Column(Integer, ForeignKey("vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
     type = Column(String, nullable=False)
     date = Column(Date, nullable=False)
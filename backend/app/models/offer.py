@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, Numeric, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, Numeric, String
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -8,9 +8,10 @@ from app.db.base_class import Base
 
 class Offer(Base):
     __tablename__ = "offers"
+    __table_args__ = (Index("ix_offers_user_vehicle_created_at", "user_id", "vehicle_id", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     vehicle_id = Column(Integer, ForeignKey("vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
     base_policy_id = Column(Integer, ForeignKey("policies.id", ondelete="SET NULL"), nullable=True, index=True)
     provider = Column(String, nullable=False)
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, JSON, Numeric, String
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, JSON, Numeric, String
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -8,9 +8,10 @@ from app.db.base_class import Base
 
 class Policy(Base):
     __tablename__ = "policies"
+    __table_args__ = (Index("ix_policies_user_vehicle_type", "user_id", "vehicle_id", "policy_type"),)
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     vehicle_id = Column(Integer, ForeignKey("vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
     policy_type = Column(String, nullable=False)
     insurer = Column(String, nullable=False)
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -8,15 +8,20 @@ from app.db.base_class import Base
 
 class Reminder(Base):
     __tablename__ = "reminders"
+    __table_args__ = (
+        Index("ix_reminders_user_status_due_date", "user_id", "status", "due_date"),
+        # Used by the scheduler to find the next pending reminders across all users.
+        Index("ix_reminders_status_due_date", "status", "due_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     entity_type = Column(String, nullable=False)
     entity_id = Column(Integer, nullable=False)
     vehicle_id = Column(Integer, ForeignKey("vehicles.id", ondelete="CASCADE"), nullable=True, index=True)
     policy_id = Column(Integer, ForeignKey("policies.id", ondelete="CASCADE"), nullable=True, index=True)
     event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=True, index=True)
-    due_date = Column(Date, nullable=False, index=True)
+    due_date = Column(Date, nullable=False)
     channel = Column(String, nullable=False, default="push")
     status = Column(String, nullable=False, default="pending")
     snooze_until = Column(Date, nullable=True)
@@ -31,3 +31,4 @@ class Vehicle(Base):
     events = relationship("Event", back_populates="vehicle", cascade="all, delete-orphan")
     reminders = relationship("Reminder", back_populates="vehicle", cascade="all, delete-orphan")
     offers = relationship("Offer", back_populates="vehicle", cascade="all, delete-orphan")
+    cost_rollups = relationship("CostRollup", back_populates="vehicle", cascade="all, delete-orphan")
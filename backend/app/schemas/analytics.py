@@ -0,0 +1,21 @@
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class MonthlyCosts(BaseModel):
+    month: date
+    event_count: int
+    events_total: Decimal
+    premiums_total: Decimal
+    by_type: Dict[str, Decimal]
+
+
+class CostSummary(BaseModel):
+    vehicle_id: Optional[int] = None
+    events_total: Decimal
+    premiums_total: Decimal
+    by_type: Dict[str, Decimal]
+    months: List[MonthlyCosts]
@@ -21,6 +21,7 @@ class EventCreate(EventBase):
 
 
 class EventUpdate(BaseModel):
+    vehicle_id: Optional[int]
     type: Optional[str]
     date: Optional[date]
     mileage_km: Optional[int]
@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class OfferBase(BaseModel):
@@ -29,3 +29,10 @@ class OfferRead(OfferBase):
 
     class Config:
         orm_mode = True
+
+
+class QuoteRequest(BaseModel):
+    vehicle_id: int
+    policy_id: Optional[int] = None
+    weights: Dict[str, float] = {}
+    top_k: Optional[int] = Field(None, ge=1)
@@ -0,0 +1,11 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    type: Literal["policy", "event"]
+    id: int
+    vehicle_id: int
+    score: float
+    snippet: Optional[str] = None
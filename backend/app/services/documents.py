@@ -0,0 +1,45 @@
+import hashlib
+import shutil
+from pathlib import Path
+from typing import BinaryIO
+
+
+class DocumentTooLargeError(Exception):
+    pass
+
+
+class SpooledDocument:
+    """An uploaded document kept in a (spooled) temporary file together with its digest."""
+
+    def __init__(self, file: BinaryIO, size: int, sha256: str) -> None:
+        self.file = file
+        self.size = size
+        self.sha256 = sha256
+
+
+def scan_upload(file: BinaryIO, max_bytes: int, chunk_size: int) -> SpooledDocument:
+    """Hash and measure an upload in fixed-size chunks, then rewind it for the extractor.
+
+    Starlette already spools multipart files to a ``SpooledTemporaryFile`` (in memory
+    up to 1 MB, on disk beyond), so the document is never copied into one bytes object.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    file.seek(0)
+    while chunk := file.read(chunk_size):
+        size += len(chunk)
+        if size > max_bytes:
+            raise DocumentTooLargeError
+        digest.update(chunk)
+    file.seek(0)
+    return SpooledDocument(file, size, digest.hexdigest())
+
+
+def store_document(document: SpooledDocument, directory: Path, name: str, chunk_size: int) -> Path:
+    """Copy a spooled upload to shared storage where extraction workers can read it."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    document.file.seek(0)
+    with path.open("wb") as target:
+        shutil.copyfileobj(document.file, target, chunk_size)
+    return path
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+import zipfile
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List
+
+from pydantic.json import pydantic_encoder
+from sqlalchemy import JSON, Table, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.event import Event
+from app.models.offer import Offer
+from app.models.policy import Policy
+from app.models.reminder import Reminder
+from app.models.user import User
+from app.models.vehicle import Vehicle
+
+settings = get_settings()
+
+# Exported in this order, so rows only refer to rows that came before them.
+EXPORTED_TABLES: Dict[str, Table] = {
+    "vehicles": Vehicle.__table__,
+    "policies": Policy.__table__,
+    "events": Event.__table__,
+    "reminders": Reminder.__table__,
+    "offers": Offer.__table__,
+}
+USER_COLUMNS = (User.id, User.email, User.created_at)
+
+
+async def _iter_table(db: AsyncSession, table: Table, user_id: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield the user's rows of ``table`` in batches read from a server-side cursor.
+
+    Plain column rows are fetched instead of ORM objects, so nothing accumulates in
+    the session's identity map.
+    """
+    statement = (
+        select(*table.c)
+        .where(table.c.user_id == user_id)
+        .order_by(table.c.id)
+        .execution_options(yield_per=settings.stream_batch_size)
+    )
+    result = await db.stream(statement)
+    async for partition in result.mappings().partitions():
+        yield partition
+
+
+async def iter_ndjson(db: AsyncSession, user_id: int) -> AsyncIterator[str]:
+    """One ``{"type": ..., "data": {...}}`` object per line, starting with the account itself."""
+    try:
+        user = (await db.execute(select(*USER_COLUMNS).where(User.id == user_id))).mappings().one()
+        yield json.dumps({"type": "user", "data": dict(user)}, default=pydantic_encoder) + "\n"
+        for name, table in EXPORTED_TABLES.items():
+            async for rows in _iter_table(db, table, user_id):
+                yield "".join(
+                    json.dumps({"type": name, "data": dict(row)}, default=pydantic_encoder) + "\n" for row in rows
+                )
+    finally:
+        await db.close()
+
+
+class _ZipBuffer(io.RawIOBase):
+    """Write-only sink for ``ZipFile`` that hands out what was written since the last drain.
+
+    It is not seekable, so ``ZipFile`` streams entries with data descriptors instead
+    of going back to patch local headers.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _csv_cell(value: Any, column_type: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(column_type, JSON):
+        return json.dumps(value, default=pydantic_encoder)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+async def iter_zip(db: AsyncSession, user_id: int) -> AsyncIterator[bytes]:
+    """A zip with one CSV per table, compressed and sent batch by batch."""
+    buffer = _ZipBuffer()
+    try:
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, table in EXPORTED_TABLES.items():
+                with archive.open(f"{name}.csv", "w", force_zip64=True) as entry:
+                    text = io.TextIOWrapper(entry, encoding="utf-8", newline="", write_through=True)
+                    writer = csv.writer(text)
+                    writer.writerow(table.c.keys())
+                    types = [column.type for column in table.c]
+                    async for rows in _iter_table(db, table, user_id):
+                        writer.writerows([_csv_cell(value, column_type) for value, column_type in zip(row.values(), types)] for row in rows)
+                        yield buffer.drain()
+                    text.flush()
+                    text.detach()
+                yield buffer.drain()
+        yield buffer.drain()
+    finally:
+        await db.close()
@@ -0,0 +1,102 @@
+import json
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+import redis
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+Extraction = Dict[str, Any]
+
+
+def cache_key(user_id: int, sha256: str) -> str:
+    # Scoped per user: a hit must not reveal that someone else uploaded the same document.
+    return f"{user_id}:{sha256}"
+
+
+class ExtractionCache:
+    """Extraction results keyed by the uploader and the SHA-256 of the document contents.
+
+    Bounded LRU with TTL; used in eager mode where extraction runs in the API process.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._results: TTLCache[Extraction] = TTLCache(max_entries, ttl_seconds)
+
+    def get(self, user_id: int, sha256: str) -> Optional[Extraction]:
+        return self._results.get(cache_key(user_id, sha256))
+
+    def set(self, user_id: int, sha256: str, result: Extraction) -> None:
+        self._results.set(cache_key(user_id, sha256), result)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+
+# Stores a result and keeps at most ARGV[4] of them: an index sorted by write time
+# drops entries past their TTL and then the oldest ones. KEYS: entry, index; ARGV:
+# result, ttl, now, max entries.
+SET_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], KEYS[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', tonumber(ARGV[3]) - tonumber(ARGV[2]))
+local overflow = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[4])
+if overflow > 0 then
+    local oldest = redis.call('ZRANGE', KEYS[2], 0, overflow - 1)
+    redis.call('DEL', unpack(oldest))
+    redis.call('ZREMRANGEBYRANK', KEYS[2], 0, overflow - 1)
+end
+"""
+
+
+class RedisExtractionCache(ExtractionCache):
+    """Shared between API processes and workers, holding at most ``max_entries`` results.
+
+    Entries expire after the TTL; beyond ``max_entries`` the oldest are deleted. The
+    cache only saves work, so when Redis is unavailable lookups miss and writes are
+    skipped.
+    """
+
+    key_prefix = "extraction:"
+
+    def __init__(self, client: redis.Redis, max_entries: int, ttl_seconds: int, clock: Callable[[], float] = time.time) -> None:
+        self._client = client
+        self._set_script = client.register_script(SET_SCRIPT)
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._index_key = self.key_prefix + "index"
+
+    def get(self, user_id: int, sha256: str) -> Optional[Extraction]:
+        try:
+            raw = self._client.get(self.key_prefix + cache_key(user_id, sha256))
+        except redis.RedisError:
+            logger.warning("Extraction cache: Redis unavailable, treating as a miss")
+            return None
+        return None if raw is None else json.loads(raw)
+
+    def set(self, user_id: int, sha256: str, result: Extraction) -> None:
+        keys = [self.key_prefix + cache_key(user_id, sha256), self._index_key]
+        args = [json.dumps(result, default=str), self._ttl_seconds, self._clock(), self._max_entries]
+        try:
+            self._set_script(keys=keys, args=args)
+        except redis.RedisError:
+            logger.warning("Extraction cache: Redis unavailable, result not cached")
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(self.key_prefix + "*"):
+            self._client.delete(key)
+
+
+@lru_cache
+def get_extraction_cache() -> ExtractionCache:
+    if settings.extraction_jobs_eager:
+        return ExtractionCache(settings.extraction_cache_max_entries, settings.extraction_cache_ttl_seconds)
+    client = redis.Redis.from_url(settings.redis_url, socket_timeout=settings.redis_socket_timeout)
+    return RedisExtractionCache(client, settings.extraction_cache_max_entries, settings.extraction_cache_ttl_seconds)
@@ -0,0 +1,106 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+NDJSON = "application/x-ndjson"
+CSV = "text/csv"
+CONTENT_TYPES = {
+    "application/x-ndjson": NDJSON,
+    "application/jsonl": NDJSON,
+    "application/ndjson": NDJSON,
+    "text/csv": CSV,
+}
+
+# Row number and either the parsed record or the reason it could not be parsed.
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+class UnsupportedImportFormat(ValueError):
+    pass
+
+
+def import_format(content_type: Optional[str]) -> str:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type not in CONTENT_TYPES:
+        raise UnsupportedImportFormat(f"Expected one of: {', '.join(sorted(CONTENT_TYPES))}")
+    return CONTENT_TYPES[media_type]
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _csv_value(value: str) -> Any:
+    if value == "":
+        return None
+    # Nested fields (coverage_json, attachments, ...) are written as JSON inside the cell.
+    if value[0] in "[{":
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+async def iter_records(chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[ParsedRow]:
+    """Parse an NDJSON or CSV body as it arrives, one record at a time.
+
+    Rows are numbered from 1 (for CSV, the first row after the header); blank lines
+    are skipped. Quoted CSV cells may span lines.
+    """
+    row = 0
+    header: Optional[List[str]] = None
+    record_lines: List[str] = []
+    async for line in _iter_lines(chunks):
+        if fmt == NDJSON:
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield row, None, f"Invalid JSON: {exc}"
+                continue
+            if not isinstance(record, dict):
+                yield row, None, "Expected a JSON object"
+                continue
+            yield row, record, None
+            continue
+
+        record_lines.append(line)
+        text = "\n".join(record_lines)
+        if text.count('"') % 2:
+            continue  # inside a quoted cell that spans lines
+        record_lines = []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row, {name: _csv_value(value) for name, value in zip(header, values) if name}, None
+    if record_lines:
+        yield row + 1, None, "Unterminated quoted field"
+
+
+def validate_record(schema: Type[BaseModel], record: Dict[str, Any]) -> Tuple[Optional[BaseModel], List[str]]:
+    try:
+        return schema(**record), []
+    except ValidationError as exc:
+        return None, [f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()]
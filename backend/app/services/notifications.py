@@ -0,0 +1,33 @@
+import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelSender(ABC):
+    """Delivers a due reminder over one channel (``Reminder.channel``)."""
+
+    channel: str
+
+    @abstractmethod
+    def send(self, reminder: Any) -> None:
+        """Deliver ``reminder`` (a row with id, user_id, entity_type, entity_id, due_date, channel); raise on failure."""
+
+
+class LogSender(ChannelSender):
+    """Local stand-in that logs and records deliveries instead of contacting a provider."""
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self.sent: List[int] = []
+
+    def send(self, reminder: Any) -> None:
+        logger.info("Reminder %s for user %s via %s (due %s)", reminder.id, reminder.user_id, self.channel, reminder.due_date)
+        self.sent.append(reminder.id)
+
+
+@lru_cache
+def get_channel_senders() -> Dict[str, ChannelSender]:
+    return {channel: LogSender(channel) for channel in ("push", "email", "sms")}
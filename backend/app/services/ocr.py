@@ -1,17 +1,164 @@
-from typing import Any, Dict
+import codecs
+import re
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple, Union
 
+CHUNK_SIZE = 1024 * 1024
+PAGE_BREAK = "\f"
+RAW_TEXT_MAX_CHARS = 1_000_000
 
-def extract_policy_metadata(file_bytes: bytes, filename: str) -> Dict[str, Any]:
-    # Placeholder extraction logic. In production integrate pdfplumber/pytesseract.
-    text = file_bytes.decode("utf-8", errors="ignore")
+# Alias (lower-case, as written on documents) -> canonical insurer name.
+INSURERS = {
+    "pzu": "PZU",
+    "warta": "Warta",
+    "ergo hestia": "Ergo Hestia",
+    "hestia": "Ergo Hestia",
+    "allianz": "Allianz",
+    "generali": "Generali",
+    "uniqa": "Uniqa",
+    "link4": "Link4",
+    "compensa": "Compensa",
+    "proama": "Proama",
+    "axa": "AXA",
+    "wiener": "Wiener",
+    "interrisk": "InterRisk",
+    "benefia": "Benefia",
+    "balcia": "Balcia",
+    "trasti": "Trasti",
+    "mtu24": "MTU24",
+    "you can drive": "You Can Drive",
+    "beesafe": "Beesafe",
+    "tuz": "TUZ",
+    "wefox": "Wefox",
+}
+
+_DATE = r"(\d{4}-\d{2}-\d{2}|\d{1,2}[./-]\d{1,2}[./-]\d{4})"
+_AMOUNT = r"(\d{1,3}(?:[ \u00a0.]\d{3})+(?:,\d{2})?|\d{1,3}(?:[ \u00a0,]\d{3})+(?:\.\d{2})?|\d+(?:[.,]\d{1,2})?)"
+
+# Longest aliases first so "ergo hestia" wins over "hestia".
+INSURER_PATTERN = re.compile(
+    r"\b(" + "|".join(re.escape(alias) for alias in sorted(INSURERS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE,
+)
+POLICY_NUMBER_PATTERN = re.compile(
+    r"(?:polis[ay]|policy|certyfikat|certificate)\s*(?:nr|numer|no\.?|number)?\s*[:#]?\s*"
+    r"(?=[A-Z0-9/.\-]*\d)([A-Z0-9][A-Z0-9/.\-]{4,})",
+    re.IGNORECASE,
+)
+PERIOD_PATTERN = re.compile(r"\b(?:od|from)\s+" + _DATE + r"(?:\s*r\.)?\s+(?:do|to|until)\s+" + _DATE, re.IGNORECASE)
+START_DATE_PATTERN = re.compile(r"(?:data\s+pocz[aą]tku|pocz[aą]tek\s+ochrony|start\s+date|valid\s+from)\D{0,20}" + _DATE, re.IGNORECASE)
+END_DATE_PATTERN = re.compile(r"(?:data\s+ko[nń]ca|koniec\s+ochrony|end\s+date|valid\s+(?:to|until))\D{0,20}" + _DATE, re.IGNORECASE)
+PREMIUM_PATTERN = re.compile(
+    r"(?:sk[lł]adka\s+(?:[lł][aą]czna|roczna|ca[lł]kowita)|sk[lł]adka|do\s+zap[lł]aty|total\s+premium|premium(?:\s+total)?)"
+    r"\s*[:=\-]?\s*" + _AMOUNT + r"\s*(?:z[lł]|pln)?",
+    re.IGNORECASE,
+)
+FIELDS = ("insurer", "policy_number", "start_date", "end_date", "premium_total")
+
+
+def _iter_text(source: Union[bytes, BinaryIO], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield decoder.decode(view[start : start + chunk_size])
+    else:
+        while chunk := source.read(chunk_size):
+            yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def iter_pages(source: Union[bytes, BinaryIO], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yield the document one page at a time (pages are separated by form feeds, as
+    produced by pdftotext/tesseract), holding at most one page plus one chunk in memory."""
+    pending = ""
+    for text in _iter_text(source, chunk_size):
+        pending += text
+        *pages, pending = pending.split(PAGE_BREAK)
+        yield from pages
+    if pending:
+        yield pending
+
+
+def _parse_date(value: str) -> Optional[date]:
+    try:
+        if "-" in value and len(value.split("-")[0]) == 4:
+            return date.fromisoformat(value)
+        day, month, year = re.split(r"[./-]", value)
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _parse_amount(value: str) -> Optional[Decimal]:
+    cleaned = value.replace(" ", "").replace("\u00a0", "")
+    if "," in cleaned and "." in cleaned:
+        # Whichever separator comes last is the decimal one.
+        if cleaned.rfind(",") > cleaned.rfind("."):
+            cleaned = cleaned.replace(".", "").replace(",", ".")
+        else:
+            cleaned = cleaned.replace(",", "")
+    elif "," in cleaned:
+        whole, _, fraction = cleaned.rpartition(",")
+        cleaned = f"{whole}.{fraction}" if len(fraction) <= 2 else cleaned.replace(",", "")
+    elif cleaned.count(".") > 1 or ("." in cleaned and len(cleaned.rpartition(".")[2]) == 3):
+        cleaned = cleaned.replace(".", "")
+    try:
+        return Decimal(cleaned).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None
+
+
+def _dates(page: str) -> Tuple[Optional[date], Optional[date]]:
+    period = PERIOD_PATTERN.search(page)
+    if period:
+        return _parse_date(period.group(1)), _parse_date(period.group(2))
+    start = START_DATE_PATTERN.search(page)
+    end = END_DATE_PATTERN.search(page)
+    return (_parse_date(start.group(1)) if start else None, _parse_date(end.group(1)) if end else None)
+
+
+def extract_fields(pages: Iterator[str]) -> Tuple[Dict[str, Any], str]:
+    """Scan pages in order, taking each field from the first page that has it.
+
+    Returns the fields and the document text, truncated to ``RAW_TEXT_MAX_CHARS``.
+    """
+    found: Dict[str, Any] = dict.fromkeys(FIELDS)
+    text_parts = []
+    text_length = 0
+    for page in pages:
+        if text_length < RAW_TEXT_MAX_CHARS:
+            text_parts.append(page[: RAW_TEXT_MAX_CHARS - text_length])
+            text_length += len(text_parts[-1])
+        if all(found[field] is not None for field in FIELDS):
+            continue
+        if found["insurer"] is None and (match := INSURER_PATTERN.search(page)):
+            found["insurer"] = INSURERS[match.group(1).lower()]
+        if found["policy_number"] is None and (match := POLICY_NUMBER_PATTERN.search(page)):
+            found["policy_number"] = match.group(1).rstrip(".-/").upper()
+        if found["start_date"] is None or found["end_date"] is None:
+            start, end = _dates(page)
+            found["start_date"] = found["start_date"] or start
+            found["end_date"] = found["end_date"] or end
+        if found["premium_total"] is None and (match := PREMIUM_PATTERN.search(page)):
+            found["premium_total"] = _parse_amount(match.group(1))
+    return found, PAGE_BREAK.join(text_parts)
+
+
+def extract_policy_metadata(source: Union[bytes, BinaryIO], filename: str) -> Dict[str, Any]:
+    # Works on text layers (pdftotext/OCR output). ``source`` may be a file handle,
+    # which is read in chunks and processed page by page rather than copied whole.
+    found, text = extract_fields(iter_pages(source))
+    confidence = sum(value is not None for value in found.values()) / len(FIELDS)
     return {
         "raw_text": text,
         "extracted_fields": {
-            "insurer": None,
-            "policy_number": None,
-            "start_date": None,
-            "end_date": None,
-            "premium_total": None,
-            "confidence": 0.0,
+            "insurer": found["insurer"],
+            "policy_number": found["policy_number"],
+            "start_date": found["start_date"].isoformat() if found["start_date"] else None,
+            "end_date": found["end_date"].isoformat() if found["end_date"] else None,
+            "premium_total": str(found["premium_total"]) if found["premium_total"] is not None else None,
+            "confidence": round(confidence, 2),
         },
     }
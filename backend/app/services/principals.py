@@ -0,0 +1,100 @@
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+import redis
+from sqlalchemy import event, inspect
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Identity of an authenticated user, cheap enough to cache per token subject."""
+
+    id: int
+    email: str
+    created_at: datetime
+
+
+class PrincipalCache:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._local: TTLCache[Principal] = TTLCache(max_entries, ttl_seconds)
+
+    def get(self, subject: str) -> Optional[Principal]:
+        return self._local.get(subject)
+
+    def set(self, principal: Principal) -> None:
+        self._local.set(principal.email, principal)
+
+    def invalidate(self, subject: str) -> None:
+        self._local.pop(subject)
+
+    def clear(self) -> None:
+        self._local.clear()
+
+
+class RedisPrincipalCache(PrincipalCache):
+    """Shares principals between API processes, falling back to the in-process cache if Redis is unavailable."""
+
+    key_prefix = "principal:"
+
+    def __init__(self, client: redis.Redis, max_entries: int, ttl_seconds: float) -> None:
+        super().__init__(max_entries, ttl_seconds)
+        self._client = client
+        self._ttl_seconds = int(ttl_seconds)
+
+    def get(self, subject: str) -> Optional[Principal]:
+        try:
+            raw = self._client.get(self.key_prefix + subject)
+        except redis.RedisError:
+            logger.warning("Principal cache: Redis unavailable, using in-process cache")
+            return super().get(subject)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return Principal(id=data["id"], email=data["email"], created_at=datetime.fromisoformat(data["created_at"]))
+
+    def set(self, principal: Principal) -> None:
+        data = asdict(principal)
+        data["created_at"] = principal.created_at.isoformat()
+        try:
+            self._client.set(self.key_prefix + principal.email, json.dumps(data), ex=self._ttl_seconds)
+        except redis.RedisError:
+            super().set(principal)
+
+    def invalidate(self, subject: str) -> None:
+        super().invalidate(subject)
+        try:
+            self._client.delete(self.key_prefix + subject)
+        except redis.RedisError:
+            logger.warning("Principal cache: could not invalidate %s in Redis", subject)
+
+
+@lru_cache
+def get_principal_cache() -> PrincipalCache:
+    if settings.principal_cache_backend == "redis":
+        client = redis.Redis.from_url(settings.redis_url, socket_timeout=settings.redis_socket_timeout)
+        return RedisPrincipalCache(client, settings.principal_cache_max_entries, settings.principal_cache_ttl_seconds)
+    return PrincipalCache(settings.principal_cache_max_entries, settings.principal_cache_ttl_seconds)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_updated_user(mapper, connection, target: User) -> None:
+    cache = get_principal_cache()
+    history = inspect(target).attrs.email.history
+    for email in [target.email, *(history.deleted or [])]:
+        cache.invalidate(email)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, target: User) -> None:
+    get_principal_cache().invalidate(target.email)
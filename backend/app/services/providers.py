@@ -0,0 +1,142 @@
+import asyncio
+import hashlib
+import json
+import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.config import get_settings
+from app.schemas.offer import QuoteRequest
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ProviderOffer = Dict[str, Any]
+
+
+class QuoteProvider(ABC):
+    """Adapter for a single insurer's quoting API."""
+
+    name: str
+    # Identifies the catalogue or tariff the adapter quotes from; it must change
+    # whenever the offers it returns for the same request may change.
+    version: str
+
+    @abstractmethod
+    async def fetch_offers(self, request: QuoteRequest) -> List[ProviderOffer]:
+        """Return offers as dicts with the ``Offer`` fields (provider, premium_total, coverage_json, ...)."""
+
+
+class StubProvider(QuoteProvider):
+    """Local provider returning canned offers after an artificial delay."""
+
+    def __init__(
+        self,
+        name: str,
+        offers: Sequence[ProviderOffer],
+        latency_seconds: float = 0.0,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.name = name
+        self.offers = list(offers)
+        self.version = hashlib.sha1(json.dumps(self.offers, sort_keys=True, default=str).encode()).hexdigest()[:12]
+        self.latency_seconds = latency_seconds
+        self.error = error
+
+    async def fetch_offers(self, request: QuoteRequest) -> List[ProviderOffer]:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        if self.error is not None:
+            raise self.error
+        return [dict(offer) for offer in self.offers]
+
+
+class FanOutResult:
+    def __init__(self) -> None:
+        self.offers: List[ProviderOffer] = []
+        self.succeeded: List[str] = []
+        self.timed_out: List[str] = []
+        self.failed: List[str] = []
+
+    @property
+    def complete(self) -> bool:
+        return not self.timed_out and not self.failed
+
+
+class ProviderRegistry:
+    def __init__(self, providers: Sequence[QuoteProvider], provider_timeout: float, deadline: float) -> None:
+        self.providers = list(providers)
+        self.provider_timeout = provider_timeout
+        self.deadline = deadline
+        catalogues = ",".join(sorted(f"{provider.name}:{provider.version}" for provider in self.providers))
+        self.version = hashlib.sha1(catalogues.encode()).hexdigest()[:12]
+
+    async def fetch_all(self, request: QuoteRequest) -> FanOutResult:
+        """Query every provider concurrently.
+
+        Each provider gets ``provider_timeout`` seconds; whatever has not answered when
+        the global ``deadline`` passes is cancelled and the offers gathered so far are
+        returned.
+        """
+        result = FanOutResult()
+        if not self.providers:
+            return result
+        tasks = {
+            asyncio.create_task(asyncio.wait_for(provider.fetch_offers(request), self.provider_timeout)): provider
+            for provider in self.providers
+        }
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        for task in pending:
+            task.cancel()
+            result.timed_out.append(tasks[task].name)
+        for task, provider in tasks.items():
+            if task not in done:
+                continue
+            error = task.exception()
+            if isinstance(error, asyncio.TimeoutError):
+                result.timed_out.append(provider.name)
+            elif error is not None:
+                logger.warning("Quote provider %s failed: %r", provider.name, error)
+                result.failed.append(provider.name)
+            else:
+                result.succeeded.append(provider.name)
+                result.offers.extend({**offer, "provider": offer.get("provider") or provider.name} for offer in task.result())
+        return result
+
+
+STUB_OFFERS = [
+    {
+        "provider": "Shield Insurance",
+        "premium_total": 920.50,
+        "coverage_json": {"OC": True, "AC": True, "assistance": "EU"},
+        "deductible": 500,
+        "assistance_level": "EU",
+        "link_out": "https://shield.example/policy",
+    },
+    {
+        "provider": "BudgetProtect",
+        "premium_total": 780.00,
+        "coverage_json": {"OC": True, "AC": False, "assistance": "PL"},
+        "deductible": 1000,
+        "assistance_level": "PL",
+        "link_out": "https://budget.example/policy",
+    },
+    {
+        "provider": "PremiumCar",
+        "premium_total": 1100.00,
+        "coverage_json": {"OC": True, "AC": True, "szyby": True, "assistance": "EU"},
+        "deductible": 0,
+        "assistance_level": "EU",
+        "link_out": "https://premium.example/policy",
+    },
+]
+
+
+@lru_cache
+def get_provider_registry() -> ProviderRegistry:
+    providers = [
+        StubProvider(offer["provider"], [offer], latency_seconds=settings.quote_stub_latency_seconds)
+        for offer in STUB_OFFERS
+    ]
+    return ProviderRegistry(providers, settings.quote_provider_timeout_seconds, settings.quote_deadline_seconds)
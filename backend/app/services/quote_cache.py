@@ -0,0 +1,62 @@
+from functools import lru_cache
+from typing import Mapping, NamedTuple, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class QuoteKey(NamedTuple):
+    user_id: int
+    vehicle_id: int
+    policy_id: Optional[int]
+    weights: tuple[tuple[str, float], ...]
+    top_k: Optional[int]
+    catalogue_version: str
+
+
+class QuoteCache:
+    """Remembers which persisted offers answered a quote so repeated quotes reuse them.
+
+    Entries expire after a TTL and are dropped explicitly when the quoted vehicle or
+    base policy changes. The cache is per process; the TTL bounds how long other
+    workers may keep serving a quote after an update.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._entries: TTLCache[tuple[int, ...]] = TTLCache(max_entries, ttl_seconds)
+
+    @staticmethod
+    def make_key(
+        user_id: int,
+        vehicle_id: int,
+        policy_id: Optional[int],
+        weights: Mapping[str, float],
+        top_k: Optional[int],
+        catalogue_version: str,
+    ) -> QuoteKey:
+        return QuoteKey(user_id, vehicle_id, policy_id, tuple(sorted(weights.items())), top_k, catalogue_version)
+
+    def get(self, key: QuoteKey) -> Optional[tuple[int, ...]]:
+        return self._entries.get(key)
+
+    def set(self, key: QuoteKey, offer_ids: tuple[int, ...]) -> None:
+        self._entries.set(key, offer_ids)
+
+    def discard(self, key: QuoteKey) -> None:
+        self._entries.pop(key)
+
+    def invalidate_vehicle(self, user_id: int, vehicle_id: int) -> int:
+        return self._entries.discard_where(lambda key: key.user_id == user_id and key.vehicle_id == vehicle_id)
+
+    def invalidate_policy(self, user_id: int, policy_id: int) -> int:
+        return self._entries.discard_where(lambda key: key.user_id == user_id and key.policy_id == policy_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@lru_cache
+def get_quote_cache() -> QuoteCache:
+    return QuoteCache(settings.quote_cache_max_entries, settings.quote_cache_ttl_seconds)
@@ -0,0 +1,211 @@
+"""Derives reminders from policies, vehicles and their event history.
+
+Derived reminders are identified by ``(entity_type, entity_id)``: one per policy
+(renewal) and up to two per vehicle (service by time and by distance). The sync
+functions only touch the reminders of the entity they are given (the ``*_by_id``
+helpers only load entities of the given user) and run inside the caller's
+transaction; routes call them through ``AsyncSession.run_sync``.
+"""
+import calendar
+from datetime import date, timedelta
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.event import Event
+from app.models.policy import Policy
+from app.models.reminder import Reminder
+from app.models.vehicle import Vehicle
+
+settings = get_settings()
+
+POLICY_RENEWAL = "policy_renewal"
+SERVICE_BY_TIME = "vehicle_service_time"
+SERVICE_BY_DISTANCE = "vehicle_service_km"
+DERIVED_TYPES = (POLICY_RENEWAL, SERVICE_BY_TIME, SERVICE_BY_DISTANCE)
+SERVICE_EVENT_TYPES = ("service", "maintenance")
+
+ReminderKey = Tuple[str, int]
+
+
+class VehicleHistory(NamedTuple):
+    last_service_date: Optional[date]
+    last_service_km: Optional[int]
+    first_reading: Optional[Tuple[date, int]]
+    last_reading: Optional[Tuple[date, int]]
+
+
+def add_months(value: date, months: int) -> date:
+    month_index = value.month - 1 + months
+    year, month = value.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(value.day, calendar.monthrange(year, month)[1]))
+
+
+def policy_due_date(policy: Policy) -> date:
+    return policy.end_date - timedelta(days=settings.reminder_policy_lead_days)
+
+
+def service_due_by_time(vehicle: Vehicle, history: VehicleHistory) -> Optional[date]:
+    if not vehicle.service_interval_months:
+        return None
+    since = history.last_service_date or vehicle.first_registration_date or vehicle.created_at.date()
+    return add_months(since, vehicle.service_interval_months)
+
+
+def service_due_by_distance(vehicle: Vehicle, history: VehicleHistory, today: date) -> Optional[date]:
+    """Project when the odometer reaches the next service, from the km/day rate seen in events."""
+    if not vehicle.service_interval_km:
+        return None
+    readings = [reading for reading in (history.first_reading, history.last_reading) if reading]
+    current_km = max([vehicle.mileage_km or 0, *(km for _, km in readings)])
+    remaining_km = (history.last_service_km or 0) + vehicle.service_interval_km - current_km
+    if remaining_km <= 0:
+        return today
+    if not history.first_reading or not history.last_reading:
+        return None
+    (first_date, first_km), (last_date, last_km) = history.first_reading, history.last_reading
+    days, driven = (last_date - first_date).days, last_km - first_km
+    if days <= 0 or driven <= 0:
+        return None
+    return max(today, last_date + timedelta(days=int(remaining_km * days / driven)))
+
+
+def load_vehicle_history(db: Session, vehicle_ids: Sequence[int]) -> Dict[int, VehicleHistory]:
+    """Aggregate the event history of several vehicles in two grouped queries."""
+    if not vehicle_ids:
+        return {}
+    is_service = Event.type.in_(SERVICE_EVENT_TYPES)
+    services = db.execute(
+        select(Event.vehicle_id, func.max(Event.date), func.max(Event.mileage_km))
+        .where(Event.vehicle_id.in_(vehicle_ids), is_service)
+        .group_by(Event.vehicle_id)
+    ).all()
+    readings = db.execute(
+        select(Event.vehicle_id, func.min(Event.date), func.max(Event.date), func.min(Event.mileage_km), func.max(Event.mileage_km))
+        .where(Event.vehicle_id.in_(vehicle_ids), Event.mileage_km.is_not(None))
+        .group_by(Event.vehicle_id)
+    ).all()
+    service_by_vehicle = {row[0]: row[1:] for row in services}
+    readings_by_vehicle = {row[0]: row[1:] for row in readings}
+    history = {}
+    for vehicle_id in vehicle_ids:
+        service_date, service_km = service_by_vehicle.get(vehicle_id, (None, None))
+        first_date, last_date, min_km, max_km = readings_by_vehicle.get(vehicle_id, (None, None, None, None))
+        history[vehicle_id] = VehicleHistory(
+            service_date,
+            service_km,
+            (first_date, min_km) if first_date else None,
+            (last_date, max_km) if last_date else None,
+        )
+    return history
+
+
+def _load_existing(db: Session, user_ids: Iterable[int], keys: Iterable[ReminderKey]) -> Dict[ReminderKey, Reminder]:
+    keys = set(keys)
+    if not keys:
+        return {}
+    statement = select(Reminder).where(
+        Reminder.user_id.in_(set(user_ids)),
+        Reminder.entity_type.in_({entity_type for entity_type, _ in keys}),
+        Reminder.entity_id.in_({entity_id for _, entity_id in keys}),
+    )
+    existing = {}
+    for reminder in db.scalars(statement):
+        key = (reminder.entity_type, reminder.entity_id)
+        if key in keys:
+            existing[key] = reminder
+    return existing
+
+
+def _moves_deadline(existing: Reminder, desired: Reminder, today: date) -> bool:
+    if existing.due_date == desired.due_date:
+        return False
+    # Overdue distance reminders are clamped to today, which is a later date on every
+    # sync; it is still the deadline that is already due, not a new one.
+    return not (desired.entity_type == SERVICE_BY_DISTANCE and existing.due_date <= today and desired.due_date == today)
+
+
+def _apply(db: Session, existing: Optional[Reminder], desired: Optional[Reminder], today: date) -> None:
+    if desired is None:
+        if existing is not None and existing.status == "pending":
+            db.delete(existing)
+        return
+    if existing is None:
+        db.add(desired)
+    elif (existing.vehicle_id, existing.policy_id) != (desired.vehicle_id, desired.policy_id) or _moves_deadline(
+        existing, desired, today
+    ):
+        # A new deadline starts a new cycle, even if the previous one was sent.
+        existing.due_date = desired.due_date
+        existing.vehicle_id = desired.vehicle_id
+        existing.policy_id = desired.policy_id
+        existing.status = "pending"
+        existing.snooze_until = None
+
+
+def _policy_reminder(policy: Policy, today: date) -> Optional[Reminder]:
+    # An expired policy (e.g. imported history) has nothing left to renew.
+    if policy.end_date < today:
+        return None
+    return Reminder(
+        user_id=policy.user_id,
+        entity_type=POLICY_RENEWAL,
+        entity_id=policy.id,
+        vehicle_id=policy.vehicle_id,
+        policy_id=policy.id,
+        due_date=policy_due_date(policy),
+    )
+
+
+def _vehicle_reminders(vehicle: Vehicle, history: VehicleHistory, today: date) -> Dict[ReminderKey, Optional[Reminder]]:
+    desired = {}
+    for entity_type, due_date in (
+        (SERVICE_BY_TIME, service_due_by_time(vehicle, history)),
+        (SERVICE_BY_DISTANCE, service_due_by_distance(vehicle, history, today)),
+    ):
+        desired[(entity_type, vehicle.id)] = (
+            Reminder(user_id=vehicle.user_id, entity_type=entity_type, entity_id=vehicle.id, vehicle_id=vehicle.id, due_date=due_date)
+            if due_date
+            else None
+        )
+    return desired
+
+
+def sync_policies(db: Session, policies: Sequence[Policy], today: Optional[date] = None) -> None:
+    today = today or date.today()
+    existing = _load_existing(db, (p.user_id for p in policies), ((POLICY_RENEWAL, p.id) for p in policies))
+    for policy in policies:
+        _apply(db, existing.get((POLICY_RENEWAL, policy.id)), _policy_reminder(policy, today), today)
+
+
+def sync_vehicles(db: Session, vehicles: Sequence[Vehicle], today: Optional[date] = None) -> None:
+    today = today or date.today()
+    history = load_vehicle_history(db, [vehicle.id for vehicle in vehicles])
+    desired: Dict[ReminderKey, Optional[Reminder]] = {}
+    for vehicle in vehicles:
+        desired.update(_vehicle_reminders(vehicle, history[vehicle.id], today))
+    existing = _load_existing(db, (v.user_id for v in vehicles), desired)
+    for key, reminder in desired.items():
+        _apply(db, existing.get(key), reminder, today)
+
+
+def sync_policies_by_id(db: Session, user_id: int, policy_ids: Iterable[int]) -> None:
+    policy_ids = set(policy_ids)
+    if policy_ids:
+        sync_policies(db, db.scalars(select(Policy).where(Policy.user_id == user_id, Policy.id.in_(policy_ids))).all())
+
+
+def sync_vehicles_by_id(db: Session, user_id: int, vehicle_ids: Iterable[int]) -> None:
+    vehicle_ids = set(vehicle_ids)
+    if vehicle_ids:
+        sync_vehicles(db, db.scalars(select(Vehicle).where(Vehicle.user_id == user_id, Vehicle.id.in_(vehicle_ids))).all())
+
+
+def sync_policy_reminder(db: Session, user_id: int, policy_id: int) -> None:
+    sync_policies_by_id(db, user_id, [policy_id])
+
+
+def sync_vehicle_reminders(db: Session, user_id: int, vehicle_id: int) -> None:
+    sync_vehicles_by_id(db, user_id, [vehicle_id])
@@ -0,0 +1,123 @@
+"""Per-vehicle monthly cost rollups.
+
+Every event write is turned into ``RollupDelta``s (``+1`` for the new state, ``-1``
+for the old one) that are upserted into ``cost_rollups`` in the caller's
+transaction, so the table always equals ``SUM(cost_total)`` grouped by user, vehicle,
+month and type, without reading the events back.
+"""
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+from sqlalchemy import and_, delete, func, insert, literal, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from app.models.cost_rollup import CostRollup
+from app.models.event import Event
+
+RollupKey = Tuple[int, int, date, str]
+
+
+class RollupDelta(NamedTuple):
+    user_id: int
+    vehicle_id: int
+    month: date
+    type: str
+    event_count: int
+    cost_total: Decimal
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def next_month_start(value: date) -> date:
+    return date(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+def event_delta(event: Any, sign: int = 1) -> RollupDelta:
+    """Delta for adding (``sign=1``) or removing (``sign=-1``) an event, ORM object or mapping."""
+    get = event.get if isinstance(event, dict) else lambda name: getattr(event, name)
+    cost = Decimal(get("cost_total") or 0)
+    return RollupDelta(get("user_id"), get("vehicle_id"), month_start(get("date")), get("type"), sign, cost * sign)
+
+
+def merge_deltas(deltas: Iterable[RollupDelta]) -> List[RollupDelta]:
+    """Combine deltas per key and drop the ones that cancel out (e.g. an update that changed nothing)."""
+    totals: Dict[RollupKey, List[Any]] = defaultdict(lambda: [0, Decimal(0)])
+    for delta in deltas:
+        total = totals[delta[:4]]
+        total[0] += delta.event_count
+        total[1] += delta.cost_total
+    return [RollupDelta(*key, count, cost) for key, (count, cost) in totals.items() if count or cost]
+
+
+def _upsert(dialect_name: str):
+    dialect_insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}[dialect_name]
+    table = CostRollup.__table__
+    statement = dialect_insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=["user_id", "vehicle_id", "month", "type"],
+        set_={
+            "event_count": table.c.event_count + statement.excluded.event_count,
+            "cost_total": table.c.cost_total + statement.excluded.cost_total,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+
+
+def _key_clause(deltas: Iterable[RollupDelta]) -> ColumnElement:
+    return or_(
+        *(
+            and_(
+                CostRollup.user_id == delta.user_id,
+                CostRollup.vehicle_id == delta.vehicle_id,
+                CostRollup.month == delta.month,
+                CostRollup.type == delta.type,
+            )
+            for delta in deltas
+        )
+    )
+
+
+def apply_deltas(db: Session, deltas: Iterable[RollupDelta]) -> None:
+    """Upsert ``deltas`` in one executemany; rollups that drop to zero events are removed."""
+    merged = merge_deltas(deltas)
+    if not merged:
+        return
+    db.execute(_upsert(db.get_bind().dialect.name), [delta._asdict() for delta in merged])
+    removals = [delta for delta in merged if delta.event_count < 0]
+    if removals:
+        db.execute(delete(CostRollup).where(_key_clause(removals), CostRollup.event_count <= 0))
+
+
+def month_bucket(column: Any, dialect_name: str) -> ColumnElement:
+    if dialect_name == "postgresql":
+        return func.date_trunc("month", column).cast(CostRollup.month.type)
+    return func.date(column, "start of month")
+
+
+def rebuild_for_users(db: Session, user_ids: List[int]) -> None:
+    """Recompute the rollups of ``user_ids`` from their events with one INSERT ... SELECT."""
+    db.execute(delete(CostRollup).where(CostRollup.user_id.in_(user_ids)))
+    month = month_bucket(Event.date, db.get_bind().dialect.name)
+    now = literal(datetime.utcnow(), CostRollup.updated_at.type)
+    aggregated = (
+        select(
+            Event.user_id,
+            Event.vehicle_id,
+            month,
+            Event.type,
+            func.count(),
+            func.coalesce(func.sum(Event.cost_total), 0),
+            now,
+            now,
+        )
+        .where(Event.user_id.in_(user_ids))
+        .group_by(Event.user_id, Event.vehicle_id, month, Event.type)
+    )
+    columns = ["user_id", "vehicle_id", "month", "type", "event_count", "cost_total", "created_at", "updated_at"]
+    db.execute(insert(CostRollup).from_select(columns, aggregated))
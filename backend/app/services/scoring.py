@@ -0,0 +1,81 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_WEIGHTS = {
+    "price": 0.45,
+    "coverage": 0.35,
+    "deductible": 0.1,
+    "assistance": 0.1,
+}
+CRITERIA = tuple(DEFAULT_WEIGHTS)
+
+
+def resolve_weights(overrides: Optional[Mapping[str, float]] = None) -> Dict[str, float]:
+    weights = dict(DEFAULT_WEIGHTS)
+    for name, value in (overrides or {}).items():
+        if name not in weights:
+            raise ValueError(f"Unknown scoring weight: {name}")
+        if value < 0:
+            raise ValueError(f"Scoring weight must not be negative: {name}")
+        weights[name] = float(value)
+    return weights
+
+
+class ScoredOffer:
+    __slots__ = ("offer", "score", "components")
+
+    def __init__(self, offer: Mapping[str, Any], score: float, components: Dict[str, float]) -> None:
+        self.offer = offer
+        self.score = score
+        self.components = components
+
+
+class OfferCatalogue:
+    """Offers laid out as one column per scoring criterion.
+
+    Columns are oriented so that higher is better and min-max normalised once;
+    ranking for a given set of weights is then a single matrix-vector product.
+    """
+
+    def __init__(self, offers: Sequence[Mapping[str, Any]]) -> None:
+        self.offers = list(offers)
+        count = len(self.offers)
+        raw = np.empty((count, len(CRITERIA)), dtype=np.float64)
+        raw[:, 0] = np.fromiter((-float(o["premium_total"]) for o in self.offers), np.float64, count)
+        raw[:, 1] = np.fromiter((len(o.get("coverage_json") or {}) for o in self.offers), np.float64, count)
+        raw[:, 2] = np.fromiter((-float(o.get("deductible") or 0) for o in self.offers), np.float64, count)
+        raw[:, 3] = np.fromiter((o.get("assistance_level") == "EU" for o in self.offers), np.float64, count)
+        self.normalised = _normalise_columns(raw)
+
+    def __len__(self) -> int:
+        return len(self.offers)
+
+    def rank(self, weights: Optional[Mapping[str, float]] = None, top_k: Optional[int] = None) -> List[ScoredOffer]:
+        resolved = resolve_weights(weights)
+        if not self.offers:
+            return []
+        vector = np.array([resolved[name] for name in CRITERIA])
+        scores = self.normalised @ vector
+        if top_k is not None and top_k < len(scores):
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+            order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+        return [
+            ScoredOffer(
+                self.offers[index],
+                float(scores[index]),
+                dict(zip(CRITERIA, self.normalised[index].round(3).tolist())),
+            )
+            for index in order
+        ]
+
+
+def _normalise_columns(raw: np.ndarray) -> np.ndarray:
+    if raw.shape[0] == 0:
+        return raw
+    minimum = raw.min(axis=0)
+    span = raw.max(axis=0) - minimum
+    # Constant columns carry no information and score 0.5 for every offer.
+    return np.divide(raw - minimum, span, out=np.full_like(raw, 0.5), where=span != 0)
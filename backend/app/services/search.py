@@ -0,0 +1,67 @@
+"""Ranked full-text search over the indexes defined in ``app.db.search``."""
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.search import SEARCH_INDEXES, TEXT_SEARCH_CONFIG, SearchIndex
+
+MAX_TERMS = 16
+SNIPPET_START, SNIPPET_END = "[", "]"
+
+_TERM = re.compile(r"\w+")
+
+
+def search_terms(query: str) -> List[str]:
+    """Words of the user's query; operators and quotes are dropped so any input is a valid query."""
+    return _TERM.findall(query.lower())[:MAX_TERMS]
+
+
+def fts5_match(terms: Sequence[str]) -> str:
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def tsquery(terms: Sequence[str]) -> str:
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _sqlite_select(kind: str, index: SearchIndex) -> str:
+    fts, table = index.fts_table, index.table.name
+    # bm25() is lower-is-better; negate it so both backends sort by score DESC.
+    return (
+        f"SELECT '{kind}' AS type, t.id AS id, t.vehicle_id AS vehicle_id, -bm25({fts}) AS score, "
+        f"snippet({fts}, -1, '{SNIPPET_START}', '{SNIPPET_END}', '…', 12) AS snippet "
+        f"FROM {fts} JOIN {table} AS t ON t.id = {fts}.rowid "
+        f"WHERE {fts} MATCH :match AND t.user_id = :user_id"
+    )
+
+
+def _postgresql_select(kind: str, index: SearchIndex) -> str:
+    text_columns = " || ' ' || ".join(f"coalesce(t.{column}, '')" for column in index.columns)
+    return (
+        f"SELECT '{kind}' AS type, t.id AS id, t.vehicle_id AS vehicle_id, "
+        f"ts_rank({index.document('t')}, q.query) AS score, "
+        f"ts_headline('{TEXT_SEARCH_CONFIG}', {text_columns}, q.query, "
+        f"'StartSel={SNIPPET_START}, StopSel={SNIPPET_END}, MaxFragments=1, MaxWords=12, MinWords=4') AS snippet "
+        f"FROM {index.table.name} AS t, to_tsquery('{TEXT_SEARCH_CONFIG}', :tsquery) AS q(query) "
+        f"WHERE {index.document('t')} @@ q.query AND t.user_id = :user_id"
+    )
+
+
+SELECT_BUILDERS = {"sqlite": _sqlite_select, "postgresql": _postgresql_select}
+
+
+async def search(
+    db: AsyncSession, user_id: int, query: str, kinds: Optional[Sequence[str]] = None, limit: int = 20, offset: int = 0
+) -> List[Dict[str, Any]]:
+    """Best matches first across the requested kinds (``policy``/``event``), a page at a time."""
+    terms = search_terms(query)
+    if not terms:
+        return []
+    build = SELECT_BUILDERS[db.get_bind().dialect.name]
+    selects = [build(kind, SEARCH_INDEXES[kind]) for kind in (kinds or SEARCH_INDEXES)]
+    statement = text(" UNION ALL ".join(selects) + " ORDER BY score DESC, type, id LIMIT :limit OFFSET :offset")
+    params = {"match": fts5_match(terms), "tsquery": tsquery(terms), "user_id": user_id, "limit": limit, "offset": offset}
+    result = await db.execute(statement, params)
+    return [dict(row) for row in result.mappings()]
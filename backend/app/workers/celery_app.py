@@ -0,0 +1,13 @@
+from celery import Celery
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+celery_app = Celery("autoguardian", broker=settings.redis_url, include=["app.workers.extraction"])
+celery_app.conf.update(
+    task_always_eager=settings.extraction_jobs_eager,
+    task_acks_late=True,
+    task_ignore_result=True,
+    worker_prefetch_multiplier=1,
+)
@@ -0,0 +1,30 @@
+import logging
+from pathlib import Path
+
+from app.services.extraction_cache import get_extraction_cache
+from app.services.ocr import extract_policy_metadata
+from app.workers.celery_app import celery_app
+from app.workers.jobs import JOB_FAILED, JOB_RUNNING, JOB_SUCCEEDED, get_job_store
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="extraction.extract_document")
+def extract_document(job_id: str, path: str, filename: str, sha256: str, user_id: int) -> None:
+    store = get_job_store()
+    store.update(job_id, status=JOB_RUNNING)
+    document = Path(path)
+    try:
+        with document.open("rb") as handle:
+            result = extract_policy_metadata(handle, filename)
+    except Exception as exc:  # noqa: BLE001 - reported through the job status
+        logger.exception("Extraction job %s failed", job_id)
+        store.update(job_id, status=JOB_FAILED, error=str(exc))
+    else:
+        store.update(job_id, status=JOB_SUCCEEDED, result=result)
+        try:
+            get_extraction_cache().set(user_id, sha256, result)
+        except Exception:  # noqa: BLE001 - the job already succeeded; caching is best effort
+            logger.exception("Caching the result of extraction job %s failed", job_id)
+    finally:
+        document.unlink(missing_ok=True)
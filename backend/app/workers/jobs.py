@@ -0,0 +1,77 @@
+import json
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import redis
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+settings = get_settings()
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+Job = Dict[str, Any]
+
+
+def new_job(**fields: Any) -> Job:
+    return {
+        "job_id": uuid.uuid4().hex,
+        "status": JOB_QUEUED,
+        "created_at": datetime.utcnow().isoformat(),
+        "result": None,
+        "error": None,
+        **fields,
+    }
+
+
+class JobStore:
+    """In-process job store used in eager mode, where the API process runs the jobs itself."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._jobs: TTLCache[Job] = TTLCache(max_entries, ttl_seconds)
+
+    def save(self, job: Job) -> None:
+        self._jobs.set(job["job_id"], dict(job))
+
+    def get(self, job_id: str) -> Optional[Job]:
+        job = self._jobs.get(job_id)
+        return None if job is None else dict(job)
+
+    def update(self, job_id: str, **fields: Any) -> Optional[Job]:
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.update(fields)
+        self.save(job)
+        return job
+
+
+class RedisJobStore(JobStore):
+    """Job store shared between API processes and Celery workers."""
+
+    key_prefix = "job:"
+
+    def __init__(self, client: redis.Redis, ttl_seconds: int) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    def save(self, job: Job) -> None:
+        self._client.set(self.key_prefix + job["job_id"], json.dumps(job, default=str), ex=self._ttl_seconds)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        raw = self._client.get(self.key_prefix + job_id)
+        return None if raw is None else json.loads(raw)
+
+
+@lru_cache
+def get_job_store() -> JobStore:
+    if settings.extraction_jobs_eager:
+        return JobStore(settings.extraction_job_max_entries, settings.extraction_job_ttl_seconds)
+    client = redis.Redis.from_url(settings.redis_url, socket_timeout=settings.redis_socket_timeout)
+    return RedisJobStore(client, settings.extraction_job_ttl_seconds)
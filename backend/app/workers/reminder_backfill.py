@@ -0,0 +1,49 @@
+"""Recomputes derived reminders for every user.
+
+Run with ``python -m app.workers.reminder_backfill`` after changing the derivation
+rules or importing data outside the API. Users are processed in chunks, each in its
+own transaction, so the backfill can be interrupted and rerun safely.
+"""
+import logging
+from datetime import date
+from typing import Callable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db import base  # noqa: F401 - registers every model before the first query
+from app.models.policy import Policy
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.services.reminders import sync_policies, sync_vehicles
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def backfill(session_factory: Callable[[], Session], batch_size: int, today: Optional[date] = None) -> int:
+    """Sync the reminders of all users, ``batch_size`` users per transaction; returns the user count."""
+    last_id, processed = 0, 0
+    while True:
+        with session_factory() as db:
+            user_ids = db.scalars(select(User.id).where(User.id > last_id).order_by(User.id).limit(batch_size)).all()
+            if not user_ids:
+                return processed
+            sync_policies(db, db.scalars(select(Policy).where(Policy.user_id.in_(user_ids))).all())
+            sync_vehicles(db, db.scalars(select(Vehicle).where(Vehicle.user_id.in_(user_ids))).all(), today)
+            db.commit()
+        last_id = user_ids[-1]
+        processed += len(user_ids)
+        logger.info("Reminder backfill: %d users done (last id %d)", processed, last_id)
+
+
+def main() -> None:
+    from app.db.session import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    backfill(SessionLocal, settings.reminder_backfill_batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Fires due reminders.
+
+Run with ``python -m app.workers.reminder_scheduler``; several processes may run at
+once, every reminder is claimed by exactly one of them.
+"""
+import heapq
+import logging
+import signal
+import socket
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db import base  # noqa: F401 - registers every model before the first query
+from app.models.reminder import Reminder
+from app.services.notifications import ChannelSender, get_channel_senders
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+
+def due_at(due_date: date, snooze_until: Optional[date]) -> datetime:
+    effective = max(due_date, snooze_until) if snooze_until else due_date
+    return datetime.combine(effective, time.min)
+
+
+class ReminderScheduler:
+    """Keeps the next due window of pending reminders in a min-heap keyed by due time.
+
+    The window is read through the ``due_date`` index in keyset-paged batches, and a
+    pass stops paging once the rows left can only be due after today, so the heap
+    holds what is due plus at most one batch. A reminder is sent
+    only after a conditional ``pending -> sending`` UPDATE succeeds, which makes
+    concurrent schedulers safe; claims older than the lease are returned to pending.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        senders: Dict[str, ChannelSender],
+        batch_size: int = 500,
+        horizon: timedelta = timedelta(days=1),
+        lease: timedelta = timedelta(minutes=10),
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        self.session_factory = session_factory
+        self.senders = senders
+        self.batch_size = batch_size
+        self.horizon = horizon
+        self.lease = lease
+        self.clock = clock
+        self._heap: List[Tuple[datetime, int]] = []
+        self._queued: Set[int] = set()
+        self._cursor: Optional[Tuple[date, int]] = None
+
+    @property
+    def next_due(self) -> Optional[datetime]:
+        return self._heap[0][0] if self._heap else None
+
+    @property
+    def caught_up(self) -> bool:
+        """Whether every row after the cursor is due after today, so paging further can wait."""
+        return self._cursor is not None and self._cursor[0] > self.clock().date()
+
+    def rewind(self) -> None:
+        """Page from the start of the window again, picking up new, snoozed and recovered reminders."""
+        self._cursor = None
+
+    def refill(self) -> int:
+        """Load the next batch after the last row loaded; returns the number of rows read."""
+        window_end = (self.clock() + self.horizon).date()
+        statement = (
+            select(Reminder.id, Reminder.due_date, Reminder.snooze_until)
+            .where(
+                Reminder.status == STATUS_PENDING,
+                Reminder.due_date <= window_end,
+                or_(Reminder.snooze_until.is_(None), Reminder.snooze_until <= window_end),
+            )
+            .order_by(Reminder.due_date, Reminder.id)
+            .limit(self.batch_size)
+        )
+        if self._cursor is not None:
+            due_date, reminder_id = self._cursor
+            statement = statement.where(
+                or_(Reminder.due_date > due_date, and_(Reminder.due_date == due_date, Reminder.id > reminder_id))
+            )
+        with self.session_factory() as db:
+            rows = db.execute(statement).all()
+        for row in rows:
+            if row.id not in self._queued:
+                heapq.heappush(self._heap, (due_at(row.due_date, row.snooze_until), row.id))
+                self._queued.add(row.id)
+        if rows:
+            self._cursor = (rows[-1].due_date, rows[-1].id)
+        return len(rows)
+
+    def recover_expired_claims(self) -> int:
+        now = self.clock()
+        with self.session_factory() as db:
+            result = db.execute(
+                update(Reminder)
+                .where(Reminder.status == STATUS_SENDING, Reminder.updated_at < now - self.lease)
+                .values(status=STATUS_PENDING, updated_at=now)
+            )
+            db.commit()
+        return result.rowcount
+
+    def _claim(self, db: Session, reminder_id: int):
+        now = self.clock()
+        statement = (
+            update(Reminder)
+            .where(
+                Reminder.id == reminder_id,
+                Reminder.status == STATUS_PENDING,
+                # Re-checked here because the heap entry may predate a new deadline or snooze.
+                Reminder.due_date <= now.date(),
+                or_(Reminder.snooze_until.is_(None), Reminder.snooze_until <= now.date()),
+            )
+            .values(status=STATUS_SENDING, updated_at=now)
+            .returning(Reminder.id, Reminder.user_id, Reminder.entity_type, Reminder.entity_id, Reminder.due_date, Reminder.channel)
+        )
+        claimed = db.execute(statement).first()
+        db.commit()
+        return claimed
+
+    def _finish(self, db: Session, reminder_id: int, status: str) -> None:
+        db.execute(
+            update(Reminder)
+            .where(and_(Reminder.id == reminder_id, Reminder.status == STATUS_SENDING))
+            .values(status=status, updated_at=self.clock())
+        )
+        db.commit()
+
+    def run_due(self) -> int:
+        """Claim and dispatch every queued reminder whose due time has passed."""
+        now = self.clock()
+        sent = 0
+        with self.session_factory() as db:
+            while self._heap and self._heap[0][0] <= now:
+                _, reminder_id = heapq.heappop(self._heap)
+                self._queued.discard(reminder_id)
+                reminder = self._claim(db, reminder_id)
+                if reminder is None:
+                    continue  # claimed elsewhere, snoozed, moved later or no longer pending
+                sender = self.senders.get(reminder.channel)
+                try:
+                    if sender is None:
+                        raise LookupError(f"No sender for channel {reminder.channel!r}")
+                    sender.send(reminder)
+                except Exception:  # noqa: BLE001 - one bad reminder must not stop the loop
+                    logger.exception("Sending reminder %s failed", reminder_id)
+                    self._finish(db, reminder_id, STATUS_FAILED)
+                else:
+                    self._finish(db, reminder_id, STATUS_SENT)
+                    sent += 1
+        return sent
+
+    def run_once(self, poll_interval: float = 60.0) -> float:
+        """One pass over the window; returns how long to sleep before the next one."""
+        self.recover_expired_claims()
+        self.rewind()
+        while self.refill() == self.batch_size and not self.caught_up:
+            self.run_due()
+        self.run_due()
+        next_due = self.next_due
+        if next_due is None:
+            return poll_interval
+        return min(poll_interval, max(0.0, (next_due - self.clock()).total_seconds()))
+
+    def run_forever(self, stop: threading.Event, poll_interval: float = 60.0) -> None:
+        while not stop.is_set():
+            stop.wait(self.run_once(poll_interval))
+
+
+def main() -> None:
+    from app.db.session import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    scheduler = ReminderScheduler(
+        SessionLocal,
+        get_channel_senders(),
+        batch_size=settings.reminder_scheduler_batch_size,
+        horizon=timedelta(hours=settings.reminder_scheduler_horizon_hours),
+        lease=timedelta(seconds=settings.reminder_scheduler_lease_seconds),
+    )
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    logger.info("Reminder scheduler started on %s", socket.gethostname())
+    scheduler.run_forever(stop, poll_interval=settings.reminder_scheduler_poll_seconds)
+
+
+if __name__ == "__main__":
+    main()
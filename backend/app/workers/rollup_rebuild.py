@@ -0,0 +1,44 @@
+"""Rebuilds the per-vehicle cost rollups from the events table.
+
+Run with ``python -m app.workers.rollup_rebuild`` after loading events outside the
+API or if the rollups are suspected to be out of sync. Users are processed in chunks,
+each in its own transaction.
+"""
+import logging
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db import base  # noqa: F401 - registers every model before the first query
+from app.models.user import User
+from app.services.rollups import rebuild_for_users
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def rebuild(session_factory: Callable[[], Session], batch_size: int) -> int:
+    last_id, processed = 0, 0
+    while True:
+        with session_factory() as db:
+            user_ids = db.scalars(select(User.id).where(User.id > last_id).order_by(User.id).limit(batch_size)).all()
+            if not user_ids:
+                return processed
+            rebuild_for_users(db, list(user_ids))
+            db.commit()
+        last_id = user_ids[-1]
+        processed += len(user_ids)
+        logger.info("Rollup rebuild: %d users done (last id %d)", processed, last_id)
+
+
+def main() -> None:
+    from app.db.session import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    rebuild(SessionLocal, settings.rollup_rebuild_batch_size)
+
+
+if __name__ == "__main__":
+    main()
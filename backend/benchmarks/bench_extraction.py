@@ -0,0 +1,33 @@
+"""Throughput of the policy field extractor over the synthetic corpus.
+
+Run from the backend directory: ``python -m benchmarks.bench_extraction [documents]``.
+"""
+import sys
+import time
+
+from app.services.ocr import FIELDS, extract_policy_metadata
+from benchmarks.corpus import generate_corpus
+
+
+def main(count: int = 2_000) -> None:
+    corpus = generate_corpus(count)
+    total_bytes = sum(len(document.content) for document in corpus)
+
+    started = time.perf_counter()
+    results = [extract_policy_metadata(document.content, f"doc-{index}.txt") for index, document in enumerate(corpus)]
+    elapsed = time.perf_counter() - started
+
+    correct = sum(
+        result["extracted_fields"][field] == document.expected[field]
+        for result, document in zip(results, corpus)
+        for field in FIELDS
+    )
+    print(f"documents:      {count}")
+    print(f"corpus size:    {total_bytes / 1_048_576:.1f} MB")
+    print(f"docs/second:    {count / elapsed:,.0f}")
+    print(f"MB/second:      {total_bytes / 1_048_576 / elapsed:.1f}")
+    print(f"field accuracy: {correct / (count * len(FIELDS)):.2%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,71 @@
+"""Compare the vectorised offer scoring with the original per-offer Python loop.
+
+Run from the backend directory: ``python -m benchmarks.bench_scoring``.
+"""
+import random
+import timeit
+from typing import Any, Dict, List
+
+from app.services.scoring import DEFAULT_WEIGHTS, OfferCatalogue
+
+SIZES = (100, 1_000, 10_000, 50_000)
+TOP_K = 10
+
+
+def make_offers(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    coverages = ["OC", "AC", "NNW", "szyby", "opony", "assistance"]
+    return [
+        {
+            "provider": f"Provider {index}",
+            "premium_total": round(rng.uniform(500, 3000), 2),
+            "coverage_json": {name: True for name in rng.sample(coverages, rng.randint(1, len(coverages)))},
+            "deductible": rng.choice([0, 300, 500, 1000, 1500]),
+            "assistance_level": rng.choice(["EU", "PL", None]),
+        }
+        for index in range(count)
+    ]
+
+
+def _normalise(values: List[float]) -> List[float]:
+    if not values:
+        return []
+    min_v, max_v = min(values), max(values)
+    if max_v == min_v:
+        return [0.5 for _ in values]
+    return [(v - min_v) / (max_v - min_v) for v in values]
+
+
+def loop_rank(offers: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+    """The scoring loop previously inlined in ``quote_offers``, plus a sort for top-k."""
+    norm_price = _normalise([-offer["premium_total"] for offer in offers])
+    norm_coverage = _normalise([len(offer["coverage_json"]) for offer in offers])
+    norm_deductible = _normalise([-offer["deductible"] for offer in offers])
+    norm_assistance = _normalise([1 if offer.get("assistance_level") == "EU" else 0 for offer in offers])
+    scored = []
+    for index, offer in enumerate(offers):
+        score = (
+            DEFAULT_WEIGHTS["price"] * norm_price[index]
+            + DEFAULT_WEIGHTS["coverage"] * norm_coverage[index]
+            + DEFAULT_WEIGHTS["deductible"] * norm_deductible[index]
+            + DEFAULT_WEIGHTS["assistance"] * norm_assistance[index]
+        )
+        scored.append((score, offer))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [offer for _, offer in scored[:top_k]]
+
+
+def main() -> None:
+    print(f"{'offers':>8} {'loop ms':>10} {'numpy ms':>10} {'numpy+build ms':>15} {'speedup':>8}")
+    for size in SIZES:
+        offers = make_offers(size)
+        catalogue = OfferCatalogue(offers)
+        repeats = max(3, 20_000 // size)
+        loop = min(timeit.repeat(lambda: loop_rank(offers, TOP_K), number=1, repeat=repeats)) * 1000
+        vectorised = min(timeit.repeat(lambda: catalogue.rank(top_k=TOP_K), number=1, repeat=repeats)) * 1000
+        with_build = min(timeit.repeat(lambda: OfferCatalogue(offers).rank(top_k=TOP_K), number=1, repeat=repeats)) * 1000
+        print(f"{size:>8} {loop:>10.3f} {vectorised:>10.3f} {with_build:>15.3f} {loop / vectorised:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
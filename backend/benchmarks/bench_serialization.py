@@ -0,0 +1,90 @@
+"""Per-row cost of turning ORM rows into a JSON list response.
+
+Compares the previous path (``from_orm``, then FastAPI's ``response_model``
+validation and ``jsonable_encoder``, then ``json.dumps``) with ``list_response``.
+Run from the backend directory: ``python -m benchmarks.bench_serialization``.
+"""
+import asyncio
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.responses import list_response
+from app.db import base  # noqa: F401 - registers every model for relationship lookup
+from app.models.event import Event
+from app.models.policy import Policy
+from app.schemas.event import EventRead
+from app.schemas.policy import PolicyRead
+
+ROWS = 1_000
+
+
+def make_policies(count: int) -> List[Policy]:
+    now = datetime(2024, 5, 1, 12, 30)
+    return [
+        Policy(
+            id=index,
+            user_id=1,
+            vehicle_id=index % 20,
+            policy_type="OC/AC",
+            insurer="PZU",
+            policy_number=f"PZU-{index:08d}",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            premium_total=Decimal("1234.56"),
+            premium_installments_json=[{"due": "2024-01-01", "amount": 617.28}, {"due": "2024-07-01", "amount": 617.28}],
+            coverage_json={"OC": True, "AC": True, "assistance": "EU"},
+            deductible=Decimal("500.00"),
+            exclusions=["racing"],
+            documents=["policy.pdf"],
+            raw_text=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def make_events(count: int) -> List[Event]:
+    now = datetime(2024, 5, 1, 12, 30)
+    return [
+        Event(
+            id=index,
+            user_id=1,
+            vehicle_id=index % 20,
+            type="fuel",
+            date=date(2024, 1, 1) + timedelta(days=index % 365),
+            mileage_km=10_000 + index * 50,
+            cost_total=Decimal("250.40"),
+            workshop_name=None,
+            notes="Full tank",
+            attachments=["receipt.jpg"],
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def previous_path(schema: Any, rows: List[Any]) -> bytes:
+    field = create_response_field(name="response", type_=List[schema])
+    content = [schema.from_orm(row) for row in rows]
+    encoded = asyncio.run(serialize_response(field=field, response_content=content, is_coroutine=True))
+    return JSONResponse(encoded).body
+
+
+def main() -> None:
+    print(f"{'schema':>10} {'before us/row':>14} {'after us/row':>13} {'speedup':>8}")
+    for schema, rows in ((PolicyRead, make_policies(ROWS)), (EventRead, make_events(ROWS))):
+        before = min(timeit.repeat(lambda: previous_path(schema, rows), number=1, repeat=5)) / ROWS * 1e6
+        after = min(timeit.repeat(lambda: list_response(schema, rows).body, number=1, repeat=5)) / ROWS * 1e6
+        print(f"{schema.__name__:>10} {before:>14.2f} {after:>13.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Deterministic synthetic policy documents with known field values.
+
+Documents mimic the text layer of scanned policies: a few pages separated by form
+feeds, the policy details scattered over them, the rest filled with terms and
+conditions boilerplate.
+"""
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple
+
+INSURER_SPELLINGS = {
+    "PZU": ["PZU SA", "Powszechny Zakład Ubezpieczeń PZU"],
+    "Warta": ["TUiR WARTA S.A.", "Warta"],
+    "Ergo Hestia": ["Sopockie TU ERGO Hestia SA", "ERGO HESTIA"],
+    "Allianz": ["TU Allianz Polska S.A.", "Allianz"],
+    "Generali": ["Generali T.U. S.A."],
+    "Uniqa": ["UNIQA TU S.A."],
+    "Link4": ["LINK4 TU S.A."],
+    "Compensa": ["Compensa TU S.A. Vienna Insurance Group"],
+}
+
+FILLER = [
+    "Ogólne warunki ubezpieczenia mają zastosowanie do umów zawieranych z osobami fizycznymi.",
+    "Ubezpieczyciel odpowiada za szkody powstałe na terytorium Rzeczypospolitej Polskiej.",
+    "W przypadku zmiany właściciela pojazdu umowa wygasa z upływem okresu, na który została zawarta.",
+    "Roszczenia należy zgłaszać niezwłocznie, nie później niż w terminie 7 dni od zdarzenia.",
+    "Suma gwarancyjna wynosi 5 210 000 euro w odniesieniu do szkód na osobie.",
+    "Reklamacje rozpatrywane są w terminie 30 dni od dnia ich otrzymania.",
+    "The insured shall take reasonable care to prevent loss or damage to the vehicle.",
+    "§ 14 ust. 2 pkt 3 stosuje się odpowiednio do szkód całkowitych.",
+]
+
+
+class SyntheticDocument(NamedTuple):
+    content: bytes
+    expected: Dict[str, Any]
+
+
+def _format_date(value: date, rng: random.Random) -> str:
+    return value.isoformat() if rng.random() < 0.5 else value.strftime("%d.%m.%Y")
+
+
+def _format_amount(value: Decimal, polish: bool) -> str:
+    whole, fraction = f"{value:.2f}".split(".")
+    groups = f"{int(whole):,}"
+    if polish:
+        return f"{groups.replace(',', ' ')},{fraction} zł"
+    return f"{groups}.{fraction} PLN"
+
+
+def make_document(rng: random.Random, index: int, max_filler_pages: int = 6) -> SyntheticDocument:
+    insurer = rng.choice(sorted(INSURER_SPELLINGS))
+    policy_number = f"{rng.choice(['PL', 'OC', 'AC', 'KOM'])}-{rng.randint(2019, 2025)}/{index:06d}"
+    start = date(2023, 1, 1) + timedelta(days=rng.randint(0, 700))
+    end = start + timedelta(days=364)
+    premium = Decimal(rng.randint(40_000, 450_000)) / 100
+    polish = rng.random() < 0.7
+
+    if polish:
+        details = [
+            f"{rng.choice(INSURER_SPELLINGS[insurer])}",
+            f"Polisa nr {policy_number}",
+            f"Okres ubezpieczenia: od {_format_date(start, rng)} r. do {_format_date(end, rng)}",
+        ]
+        premium_line = f"Składka łączna: {_format_amount(premium, True)}"
+    else:
+        details = [
+            f"Insurer: {rng.choice(INSURER_SPELLINGS[insurer])}",
+            f"Policy number: {policy_number}",
+            f"Valid from {_format_date(start, rng)}",
+            f"Valid until {_format_date(end, rng)}",
+        ]
+        premium_line = f"Total premium: {_format_amount(premium, False)}"
+
+    pages = [[rng.choice(FILLER) for _ in range(rng.randint(5, 40))] for _ in range(1 + rng.randint(0, max_filler_pages))]
+    position = rng.randint(0, len(pages[0]))
+    pages[0][position:position] = details
+    premium_page = pages[rng.randrange(len(pages))]
+    premium_page.insert(rng.randint(0, len(premium_page)), premium_line)
+
+    text = "\f".join("\n".join(lines) for lines in pages)
+    expected = {
+        "insurer": insurer,
+        "policy_number": policy_number,
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "premium_total": f"{premium:.2f}",
+    }
+    return SyntheticDocument(text.encode(), expected)
+
+
+def generate_corpus(count: int, seed: int = 13, max_filler_pages: int = 6) -> List[SyntheticDocument]:
+    rng = random.Random(seed)
+    return [make_document(rng, index, max_filler_pages) for index in range(count)]
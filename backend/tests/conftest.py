@@ -0,0 +1,109 @@
+import os
+
+# Run extraction jobs in-process; must be set before the settings are first loaded.
+os.environ.setdefault("EXTRACTION_JOBS_EAGER", "true")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.api import deps
+from app.core.config import get_settings
+from app.core.rate_limit import get_rate_limiter
+from app.core.revocation import get_revocation_store
+from app.db.base import Base
+from app.main import app
+from app.services.extraction_cache import get_extraction_cache
+from app.services.principals import get_principal_cache
+from app.services.quote_cache import get_quote_cache
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def upload_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "upload_storage_dir", tmp_path / "uploads")
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield
+    get_principal_cache().clear()
+    get_quote_cache().clear()
+    get_extraction_cache().clear()
+    get_rate_limiter().clear()
+    get_revocation_store().clear()
+
+
+@pytest.fixture
+def async_engine(engine):
+    # NullPool keeps aiosqlite connections from outliving the TestClient event loop.
+    return create_async_engine(engine.url.set(drivername="sqlite+aiosqlite"), poolclass=NullPool)
+
+
+@pytest.fixture
+def client(engine, async_engine):
+    TestingSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    AsyncTestingSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db_session():
+        db = TestingSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db_session():
+        async with AsyncTestingSession() as db:
+            yield db
+
+    app.dependency_overrides[deps.get_db_session] = override_get_db_session
+    app.dependency_overrides[deps.get_async_db_session] = override_get_async_db_session
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+def login_headers(client, email):
+    credentials = {"email": email, "password": "s3cret-pass"}
+    client.post("/api/v1/auth/register", json=credentials)
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def auth_headers(client):
+    return login_headers(client, "driver@example.com")
+
+
+@pytest.fixture
+def other_auth_headers(client):
+    """A second account, for checking that one user cannot see or change another's data."""
+    return login_headers(client, "other@example.com")
+
+
+@pytest.fixture
+def vehicle_id(client, auth_headers):
+    return client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=auth_headers).json()["id"]
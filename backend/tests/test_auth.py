@@ -0,0 +1,80 @@
+import asyncio
+from datetime import date, timedelta
+
+from passlib.context import CryptContext
+from sqlalchemy.orm import Session
+
+from app.core.hashing import HashingOverloadedError, PasswordHasher
+from app.models.user import User
+
+
+def test_login_rehashes_password_with_outdated_cost(client, engine):
+    legacy_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("s3cret-pass")
+    with Session(engine) as db:
+        db.add(User(email="legacy@example.com", password_hash=legacy_hash))
+        db.commit()
+
+    response = client.post("/api/v1/auth/login", json={"email": "legacy@example.com", "password": "s3cret-pass"})
+    assert response.status_code == 200
+
+    with Session(engine) as db:
+        stored = db.query(User.password_hash).filter(User.email == "legacy@example.com").scalar()
+    assert stored != legacy_hash
+    assert not stored.startswith("$2b$04$")
+
+
+def test_login_rejects_wrong_password(client, auth_headers):
+    response = client.post("/api/v1/auth/login", json={"email": "driver@example.com", "password": "wrong"})
+    assert response.status_code == 401
+
+
+def test_hasher_rejects_work_beyond_queue_limit():
+    hasher = PasswordHasher(max_workers=1, queue_limit=1, use_processes=False)
+
+    async def storm():
+        return await asyncio.gather(*(hasher.hash("password") for _ in range(4)), return_exceptions=True)
+
+    try:
+        results = asyncio.run(storm())
+    finally:
+        hasher.shutdown()
+    assert sum(isinstance(result, HashingOverloadedError) for result in results) == 2
+    assert all(isinstance(result, str) for result in results if not isinstance(result, HashingOverloadedError))
+
+
+def test_overloaded_hasher_returns_503(client, monkeypatch):
+    async def overloaded(*args):
+        raise HashingOverloadedError
+
+    from app.core import hashing
+
+    monkeypatch.setattr(hashing.get_password_hasher(), "hash", overloaded)
+    response = client.post("/api/v1/auth/register", json={"email": "storm@example.com", "password": "pw"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_me_summarises_counts_and_upcoming_deadlines(client, auth_headers):
+    vehicle = client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=auth_headers).json()
+    today = date.today()
+    for offset in (-30, 10, 400):
+        policy = {
+            "vehicle_id": vehicle["id"],
+            "policy_type": "OC",
+            "insurer": "PZU",
+            "policy_number": f"P-{offset}",
+            "start_date": (today - timedelta(days=365)).isoformat(),
+            "end_date": (today + timedelta(days=offset)).isoformat(),
+            "premium_total": "900.00",
+            "coverage_json": {},
+        }
+        client.post("/api/v1/policies", json=policy, headers=auth_headers)
+    reminder = {"entity_type": "vehicle", "entity_id": vehicle["id"], "due_date": (today + timedelta(days=5)).isoformat()}
+    client.post("/api/v1/reminders", json=reminder, headers=auth_headers)
+
+    body = client.get("/api/v1/auth/me", headers=auth_headers).json()
+
+    assert body["vehicles_count"] == 1
+    assert body["policies_count"] == 3
+    assert [deadline["type"] for deadline in body["upcoming_deadlines"]] == ["reminder", "policy", "policy"]
+    assert body["upcoming_deadlines"][1]["end_date"] == (today + timedelta(days=10)).isoformat()
@@ -0,0 +1,44 @@
+import csv
+import io
+import json
+import zipfile
+
+import pytest
+
+
+@pytest.fixture
+def account(client, auth_headers, other_auth_headers):
+    vehicle_id = client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=auth_headers).json()["id"]
+    for day in range(1, 4):
+        event = {"vehicle_id": vehicle_id, "type": "fuel", "date": f"2024-03-0{day}", "cost_total": "199.99", "attachments": ["a.jpg"]}
+        client.post("/api/v1/events", json=event, headers=auth_headers)
+
+    client.post("/api/v1/vehicles", json={"make": "Fiat", "model": "Panda"}, headers=other_auth_headers)
+    return vehicle_id
+
+
+def test_ndjson_export_streams_every_entity(client, auth_headers, account, monkeypatch):
+    monkeypatch.setattr("app.services.export.settings.stream_batch_size", 2)
+    response = client.get("/api/v1/export", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["type"] for record in records] == ["user", "vehicles", "events", "events", "events"]
+    assert records[0]["data"]["email"] == "driver@example.com"
+    assert records[1]["data"]["make"] == "Skoda"
+    assert records[2]["data"]["cost_total"] == 199.99
+
+
+def test_zip_export_contains_one_csv_per_table(client, auth_headers, account):
+    response = client.get("/api/v1/export", params={"format": "zip"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].endswith('.zip"')
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.namelist() == ["vehicles.csv", "policies.csv", "events.csv", "reminders.csv", "offers.csv"]
+        events = list(csv.DictReader(io.TextIOWrapper(archive.open("events.csv"), encoding="utf-8")))
+        vehicles = list(csv.DictReader(io.TextIOWrapper(archive.open("vehicles.csv"), encoding="utf-8")))
+    assert [event["date"] for event in events] == ["2024-03-01", "2024-03-02", "2024-03-03"]
+    assert json.loads(events[0]["attachments"]) == ["a.jpg"]
+    assert [vehicle["id"] for vehicle in vehicles] == [str(account)]
@@ -1,5 +1,10 @@
+import asyncio
+
 from fastapi.testclient import TestClient
+from sqlalchemy.engine import make_url
 
+from app.core.config import get_settings
+from app.db.session import engine_options, make_async_engine, make_engine
 from app.main import app
 
 
@@ -8,3 +13,46 @@ def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_database_health_reports_pool_usage(client):
+    response = client.get("/health/db")
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["status"], body["dialect"]) == ("ok", "sqlite")
+    assert set(body["pools"]) == {"sync", "async"}
+
+
+def test_sqlite_engines_apply_pragmas_on_connect(tmp_path):
+    url = f"sqlite:///{tmp_path / 'tuned.db'}"
+    engine = make_engine(url)
+    with engine.connect() as connection:
+        pragmas = [connection.exec_driver_sql(f"PRAGMA {name}").scalar() for name in ("journal_mode", "synchronous", "busy_timeout")]
+    engine.dispose()
+    assert pragmas == ["wal", 1, 5000]
+
+    async def async_busy_timeout():
+        async_engine = make_async_engine(url)
+        async with async_engine.connect() as connection:
+            value = (await connection.exec_driver_sql("PRAGMA busy_timeout")).scalar()
+        await async_engine.dispose()
+        return value
+
+    assert asyncio.run(async_busy_timeout()) == 5000
+
+
+def test_postgres_engine_options_come_from_settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "db_pool_size", 20)
+    monkeypatch.setattr(settings, "db_statement_timeout_ms", 1500)
+
+    sync_options = engine_options(make_url("postgresql://app@db/autoguardian"))
+    async_options = engine_options(make_url("postgresql+asyncpg://app@db/autoguardian"))
+
+    assert (sync_options["pool_size"], sync_options["pool_pre_ping"]) == (20, False)
+    assert sync_options["connect_args"] == {"options": "-c statement_timeout=1500"}
+    assert async_options["connect_args"] == {
+        "server_settings": {"statement_timeout": "1500"},
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    }
+    assert "pool_size" not in engine_options(make_url("sqlite:///./dev.db"))
@@ -0,0 +1,81 @@
+import json
+
+from sqlalchemy import event
+
+from app.core.config import get_settings
+
+
+def ndjson(*rows):
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows).encode()
+
+
+def create_vehicle(client, headers, **fields):
+    return client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia", **fields}, headers=headers).json()["id"]
+
+
+def test_event_import_reports_bad_rows_and_inserts_the_rest(client, auth_headers):
+    vehicle_id = create_vehicle(client, auth_headers)
+    body = ndjson(
+        {"vehicle_id": vehicle_id, "type": "service", "date": "2024-01-10", "mileage_km": 10000},
+        "{not json",
+        {"vehicle_id": vehicle_id, "type": "fuel", "date": "not-a-date"},
+        "",
+        {"vehicle_id": vehicle_id + 100, "type": "fuel", "date": "2024-01-11"},
+        {"vehicle_id": vehicle_id, "type": "fuel", "date": "2024-01-12", "cost_total": "250.40"},
+    )
+
+    response = client.post(
+        "/api/v1/events/import", content=body, headers={**auth_headers, "Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["received"], report["imported"], report["failed"]) == (5, 2, 3)
+    assert [error["row"] for error in report["errors"]] == [2, 3, 4]
+    assert report["errors"][1]["errors"] == ["date: invalid date format"]
+    assert report["errors"][2]["errors"] == ["vehicle_id: vehicle not found"]
+    assert len(client.get("/api/v1/events", headers=auth_headers).json()) == 2
+
+
+def test_import_inserts_in_chunks(client, async_engine, auth_headers, monkeypatch):
+    monkeypatch.setattr(get_settings(), "import_chunk_size", 2)
+    vehicle_id = create_vehicle(client, auth_headers)
+    inserts = []
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO events"):
+            inserts.append(statement)
+
+    body = ndjson(*({"vehicle_id": vehicle_id, "type": "fuel", "date": f"2024-02-0{day}"} for day in range(1, 6)))
+    report = client.post(
+        "/api/v1/events/import", content=body, headers={**auth_headers, "Content-Type": "application/x-ndjson"}
+    ).json()
+
+    assert report["imported"] == 5
+    assert len(inserts) == 3
+
+
+def test_policy_csv_import_parses_quoted_and_json_cells(client, auth_headers):
+    vehicle_id = create_vehicle(client, auth_headers)
+    body = (
+        "vehicle_id,policy_type,insurer,policy_number,start_date,end_date,premium_total,coverage_json,raw_text\r\n"
+        f'{vehicle_id},OC,PZU,PZU-1,2024-01-01,2099-12-31,900.00,"{{""OC"": true}}","line one\nline two"\r\n'
+        f"{vehicle_id},AC,Warta,W-2,2024-01-01,2024-12-31,,{{}},\r\n"
+    ).encode()
+
+    response = client.post("/api/v1/policies/import", content=body, headers={**auth_headers, "Content-Type": "text/csv"})
+
+    report = response.json()
+    assert (report["imported"], report["failed"]) == (1, 1)
+    assert report["errors"] == [{"row": 2, "errors": ["premium_total: none is not an allowed value"]}]
+    (policy,) = client.get("/api/v1/policies", headers=auth_headers).json()
+    assert policy["coverage_json"] == {"OC": True}
+    assert policy["raw_text"] == "line one\nline two"
+    reminders = client.get("/api/v1/reminders", headers=auth_headers).json()
+    assert [(r["entity_type"], r["entity_id"]) for r in reminders] == [("policy_renewal", policy["id"])]
+
+
+def test_import_rejects_unknown_content_type(client, auth_headers):
+    response = client.post("/api/v1/events/import", json=[], headers=auth_headers)
+    assert response.status_code == 415
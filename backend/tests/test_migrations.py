@@ -0,0 +1,34 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.db.search import include_object
+
+
+@pytest.fixture
+def alembic_config(tmp_path):
+    config = Config(str(get_settings().alembic_ini_path))
+    config.set_main_option("sqlalchemy.url", f"sqlite:///{tmp_path / 'migrated.db'}")
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def test_migrations_match_models(alembic_config):
+    command.upgrade(alembic_config, "head")
+    engine = create_engine(alembic_config.get_main_option("sqlalchemy.url"))
+    with engine.connect() as connection:
+        context = MigrationContext.configure(connection, opts={"include_object": include_object})
+        assert compare_metadata(context, Base.metadata) == []
+        indexes = {index["name"] for index in inspect(connection).get_indexes("events")}
+        tables = set(inspect(connection).get_table_names())
+    assert "ix_events_user_vehicle_type_date" in indexes
+    assert {"policies_fts", "events_fts"} <= tables
+
+    command.downgrade(alembic_config, "base")
+    assert inspect(engine).get_table_names() == ["alembic_version"]
+    engine.dispose()
@@ -0,0 +1,43 @@
+import io
+
+from app.services.ocr import FIELDS, extract_policy_metadata, iter_pages
+from benchmarks.corpus import generate_corpus
+
+POLISH_POLICY = """Sopockie TU ERGO Hestia SA
+Polisa nr OC-2024/000123
+Okres ubezpieczenia: od 01.03.2024 r. do 28.02.2025
+\fOgólne warunki ubezpieczenia
+Składka łączna: 1 234,56 zł
+"""
+
+
+def test_extracts_fields_from_polish_policy():
+    fields = extract_policy_metadata(POLISH_POLICY.encode(), "polisa.txt")["extracted_fields"]
+    assert fields == {
+        "insurer": "Ergo Hestia",
+        "policy_number": "OC-2024/000123",
+        "start_date": "2024-03-01",
+        "end_date": "2025-02-28",
+        "premium_total": "1234.56",
+        "confidence": 1.0,
+    }
+
+
+def test_missing_fields_lower_confidence():
+    fields = extract_policy_metadata(b"Allianz\nTotal premium: 1,050.00 PLN", "partial.txt")["extracted_fields"]
+    assert fields["insurer"] == "Allianz"
+    assert fields["premium_total"] == "1050.00"
+    assert fields["policy_number"] is None
+    assert fields["confidence"] == 0.4
+
+
+def test_pages_are_split_across_chunk_boundaries():
+    text = "first page\fsecond ł page\fthird"
+    pages = list(iter_pages(io.BytesIO(text.encode()), chunk_size=3))
+    assert pages == ["first page", "second ł page", "third"]
+
+
+def test_synthetic_corpus_is_fully_extracted():
+    for document in generate_corpus(200):
+        fields = extract_policy_metadata(io.BytesIO(document.content), "doc.txt")["extracted_fields"]
+        assert {field: fields[field] for field in FIELDS} == document.expected
@@ -0,0 +1,69 @@
+from sqlalchemy import event
+
+from app.services.quote_cache import get_quote_cache
+
+
+def test_quote_endpoint_accepts_weights(client, auth_headers, vehicle_id):
+    response = client.post(
+        "/api/v1/offers/quote",
+        json={"vehicle_id": vehicle_id, "weights": {"price": 1.0}, "top_k": 2},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    offers = response.json()
+    assert len(offers) == 2
+    assert offers[0]["score_breakdown_json"]["weights"]["price"] == 1.0
+
+
+def test_quote_persists_offers_in_one_statement(client, async_engine, auth_headers, vehicle_id):
+    statements = []
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "offers" in statement:
+            statements.append(statement)
+
+    response = client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id}, headers=auth_headers)
+
+    assert response.status_code == 201
+    offers = response.json()
+    assert len(offers) == 3
+    assert all(offer["id"] and offer["created_at"] for offer in offers)
+    scores = [offer["score_breakdown_json"]["score"] for offer in offers]
+    assert scores == sorted(scores, reverse=True)
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO offers")
+
+
+def test_repeated_quote_is_served_from_cache(client, auth_headers, vehicle_id):
+    first = client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id}, headers=auth_headers)
+    second = client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id}, headers=auth_headers)
+
+    assert first.headers["X-Quote-Cache"] == "miss"
+    assert second.headers["X-Quote-Cache"] == "hit"
+    assert [offer["id"] for offer in second.json()] == [offer["id"] for offer in first.json()]
+    assert len(client.get("/api/v1/offers", params={"vehicle_id": vehicle_id}, headers=auth_headers).json()) == 3
+
+
+def test_cache_hit_keeps_the_cached_ranking(client, auth_headers, vehicle_id, monkeypatch):
+    first = client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id}, headers=auth_headers).json()
+    # Rank order need not follow id order, e.g. when ids come from a shared sequence.
+    ranked = tuple(reversed([offer["id"] for offer in first]))
+    monkeypatch.setattr(get_quote_cache(), "get", lambda key: ranked)
+
+    second = client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id}, headers=auth_headers)
+    assert second.headers["X-Quote-Cache"] == "hit"
+    assert [offer["id"] for offer in second.json()] == list(ranked)
+
+
+def test_different_weights_miss_the_cache(client, auth_headers, vehicle_id):
+    client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id}, headers=auth_headers)
+    response = client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id, "weights": {"price": 1}}, headers=auth_headers)
+    assert response.headers["X-Quote-Cache"] == "miss"
+
+
+def test_vehicle_update_invalidates_cached_quote(client, auth_headers, vehicle_id):
+    client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id}, headers=auth_headers)
+    client.put(f"/api/v1/vehicles/{vehicle_id}", json={"make": "Skoda", "model": "Superb"}, headers=auth_headers)
+    response = client.post("/api/v1/offers/quote", json={"vehicle_id": vehicle_id}, headers=auth_headers)
+    assert response.headers["X-Quote-Cache"] == "miss"
@@ -0,0 +1,110 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.api import pagination
+
+
+def _create_events(client, auth_headers, vehicle_id, count):
+    start = date(2024, 1, 1)
+    for index in range(count):
+        payload = {"vehicle_id": vehicle_id, "type": "service", "date": (start + timedelta(days=index // 2)).isoformat()}
+        client.post("/api/v1/events", json=payload, headers=auth_headers)
+
+
+def test_events_keyset_pages_cover_all_rows(client, auth_headers, vehicle_id):
+    _create_events(client, auth_headers, vehicle_id, 7)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/events", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert len(seen) == 7
+    assert len({event["id"] for event in seen}) == 7
+    keys = [(event["date"], event["id"]) for event in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_last_page_has_no_cursor(client, auth_headers, vehicle_id):
+    _create_events(client, auth_headers, vehicle_id, 2)
+    response = client.get("/api/v1/events", params={"limit": 2}, headers=auth_headers)
+    assert len(response.json()) == 2
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers):
+    response = client.get("/api/v1/events", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson"])
+def test_streamed_list(client, auth_headers, vehicle_id, fmt):
+    _create_events(client, auth_headers, vehicle_id, 5)
+    response = client.get("/api/v1/events", params={"stream": fmt, "limit": 1}, headers=auth_headers)
+    assert response.status_code == 200
+    if fmt == "json":
+        rows = response.json()
+    else:
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 5
+
+
+def test_unchanged_collection_returns_304(client, async_engine, auth_headers, vehicle_id):
+    _create_events(client, auth_headers, vehicle_id, 2)
+    first = client.get("/api/v1/events", headers=auth_headers)
+    etag = first.headers["ETag"]
+
+    statements = []
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM events" in statement:
+            statements.append(statement)
+
+    cached = client.get("/api/v1/events", headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    assert len(statements) == 1 and "count(*)" in statements[0]
+
+
+def test_etag_changes_with_filters_and_writes(client, auth_headers, vehicle_id):
+    _create_events(client, auth_headers, vehicle_id, 2)
+    etag = client.get("/api/v1/events", headers=auth_headers).headers["ETag"]
+    assert client.get("/api/v1/events", params={"type": "fuel"}, headers=auth_headers).headers["ETag"] != etag
+    assert client.get("/api/v1/events", params={"limit": 1}, headers=auth_headers).headers["ETag"] != etag
+
+    event_id = client.get("/api/v1/events", headers=auth_headers).json()[0]["id"]
+    client.put(f"/api/v1/events/{event_id}", json={"notes": "changed oil"}, headers=auth_headers)
+    response = client.get("/api/v1/events", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    client.delete(f"/api/v1/events/{event_id}", headers=auth_headers)
+    assert client.get("/api/v1/events", headers={**auth_headers, "If-None-Match": etag}).status_code == 200
+
+
+def test_list_without_limit_is_not_truncated(client, auth_headers, vehicle_id, monkeypatch):
+    monkeypatch.setattr(pagination.settings, "default_page_size", 2)
+    _create_events(client, auth_headers, vehicle_id, 4)
+
+    response = client.get("/api/v1/events", headers=auth_headers)
+    assert len(response.json()) == 4
+    assert "X-Next-Cursor" not in response.headers
+
+    first = client.get("/api/v1/events", params={"limit": 1}, headers=auth_headers)
+    rest = client.get("/api/v1/events", params={"cursor": first.headers["X-Next-Cursor"]}, headers=auth_headers)
+    assert len(rest.json()) == 2
+    assert "X-Next-Cursor" in rest.headers
@@ -0,0 +1,52 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.models.user import User
+from app.services.principals import get_principal_cache
+
+
+def test_ttl_cache_expires_entries(fake_clock):
+    cache = TTLCache(max_entries=10, ttl_seconds=5, clock=fake_clock)
+    cache.set("a", 1)
+    fake_clock.now = 4.9
+    assert cache.get("a") == 1
+    fake_clock.now = 5.0
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_authenticated_requests_skip_user_lookup(client, async_engine, auth_headers):
+    user_queries = []
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            user_queries.append(statement)
+
+    client.get("/api/v1/vehicles", headers=auth_headers)
+    client.get("/api/v1/vehicles", headers=auth_headers)
+    assert len(user_queries) == 1
+
+
+def test_user_update_invalidates_principal(client, engine, auth_headers):
+    client.get("/api/v1/vehicles", headers=auth_headers)
+    assert get_principal_cache().get("driver@example.com") is not None
+
+    with Session(engine) as db:
+        user = db.query(User).filter(User.email == "driver@example.com").one()
+        user.email = "renamed@example.com"
+        db.commit()
+
+    assert get_principal_cache().get("driver@example.com") is None
+    assert client.get("/api/v1/vehicles", headers=auth_headers).status_code == 401
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+from app.schemas.offer import QuoteRequest
+from app.services.providers import ProviderRegistry, StubProvider
+
+REQUEST = QuoteRequest(vehicle_id=1)
+OFFER = {"premium_total": 900.0, "coverage_json": {"OC": True}, "deductible": 0, "assistance_level": "EU"}
+
+
+def _fetch(registry: ProviderRegistry):
+    return asyncio.run(registry.fetch_all(REQUEST))
+
+
+def test_providers_are_queried_concurrently():
+    providers = [StubProvider(f"p{index}", [OFFER], latency_seconds=0.2) for index in range(5)]
+    started = time.perf_counter()
+    result = _fetch(ProviderRegistry(providers, provider_timeout=1, deadline=2))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert result.complete
+    assert sorted(offer["provider"] for offer in result.offers) == ["p0", "p1", "p2", "p3", "p4"]
+
+
+def test_slow_provider_times_out_and_partial_results_are_returned():
+    providers = [StubProvider("fast", [OFFER]), StubProvider("slow", [OFFER], latency_seconds=1)]
+    result = _fetch(ProviderRegistry(providers, provider_timeout=0.1, deadline=2))
+
+    assert result.succeeded == ["fast"]
+    assert result.timed_out == ["slow"]
+    assert not result.complete
+    assert len(result.offers) == 1
+
+
+def test_global_deadline_cuts_off_pending_providers():
+    providers = [StubProvider("fast", [OFFER]), StubProvider("slow", [OFFER], latency_seconds=1)]
+    started = time.perf_counter()
+    result = _fetch(ProviderRegistry(providers, provider_timeout=5, deadline=0.1))
+
+    assert time.perf_counter() - started < 0.5
+    assert result.timed_out == ["slow"]
+
+
+def test_failing_provider_is_reported():
+    providers = [StubProvider("ok", [OFFER]), StubProvider("broken", [OFFER], error=RuntimeError("boom"))]
+    result = _fetch(ProviderRegistry(providers, provider_timeout=1, deadline=1))
+
+    assert result.failed == ["broken"]
+    assert [offer["provider"] for offer in result.offers] == ["ok"]
+
+
+def test_registry_version_follows_provider_catalogues():
+    registry = ProviderRegistry([StubProvider("a", [OFFER])], provider_timeout=1, deadline=1)
+    same = ProviderRegistry([StubProvider("a", [dict(OFFER)])], provider_timeout=1, deadline=1)
+    repriced = ProviderRegistry([StubProvider("a", [{**OFFER, "premium_total": 950.0}])], provider_timeout=1, deadline=1)
+
+    assert registry.version == same.version
+    assert registry.version != repriced.version
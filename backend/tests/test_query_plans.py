@@ -0,0 +1,44 @@
+import re
+
+import pytest
+from sqlalchemy import event
+
+FULL_SCAN = re.compile(r"\bSCAN (?:TABLE )?(users|vehicles|policies|events|reminders|offers)\b(?! USING)")
+
+
+@pytest.fixture
+def seeded(client, auth_headers):
+    vehicle_id = client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=auth_headers).json()["id"]
+    client.post("/api/v1/events", json={"vehicle_id": vehicle_id, "type": "service", "date": "2024-03-01"}, headers=auth_headers)
+    return vehicle_id
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/v1/vehicles",
+        "/api/v1/events",
+        "/api/v1/events?vehicle_id={vehicle_id}&type=service",
+        "/api/v1/policies",
+        "/api/v1/reminders",
+        "/api/v1/reminders?status=pending",
+        "/api/v1/offers?vehicle_id={vehicle_id}",
+        "/api/v1/search?q=serv",
+    ],
+)
+def test_list_endpoints_use_indexes(client, engine, async_engine, auth_headers, seeded, path):
+    statements = []
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    response = client.get(path.format(vehicle_id=seeded), headers=auth_headers)
+    assert response.status_code == 200
+    assert statements
+
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = "\n".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+            assert not FULL_SCAN.search(plan), f"{statement}\n{plan}"
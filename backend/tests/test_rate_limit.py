@@ -0,0 +1,70 @@
+import fakeredis
+import pytest
+from sqlalchemy import event
+
+from app.core.config import get_settings
+from app.core.rate_limit import Bucket, RateLimiter, RedisRateLimiter
+
+
+def test_bucket_allows_burst_then_refills(fake_clock):
+    limiter = RateLimiter(clock=fake_clock)
+    bucket = Bucket.per_minute(capacity=2, per_minute=6)
+
+    assert [limiter.acquire("ip", bucket) for _ in range(3)] == [0.0, 0.0, pytest.approx(10.0)]
+    fake_clock.now = 5.0
+    assert limiter.acquire("ip", bucket) == pytest.approx(5.0)
+    fake_clock.now = 10.0
+    assert limiter.acquire("ip", bucket) == 0.0
+    assert limiter.acquire("other", bucket) == 0.0
+
+
+def test_limiter_forgets_least_recently_used_keys(fake_clock):
+    limiter = RateLimiter(max_keys=2, clock=fake_clock)
+    bucket = Bucket(capacity=1, refill_per_second=0.001)
+    for key in ("a", "b", "c"):
+        limiter.acquire(key, bucket)
+
+    assert limiter.acquire("a", bucket) == 0.0
+    assert limiter.acquire("c", bucket) > 0
+
+
+def test_login_burst_is_rejected_before_any_database_work(client, async_engine, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "auth_rate_limit_email_burst", 2)
+    monkeypatch.setattr(settings, "auth_rate_limit_email_per_minute", 1.0)
+    statements = []
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    attempt = {"email": "victim@example.com", "password": "guess"}
+    assert [client.post("/api/v1/auth/login", json=attempt).status_code for _ in range(2)] == [401, 401]
+    queries = len(statements)
+
+    response = client.post("/api/v1/auth/login", json=attempt)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+    assert len(statements) == queries
+    assert client.post("/api/v1/auth/login", json={**attempt, "email": "VICTIM@example.com"}).status_code == 429
+    assert client.post("/api/v1/auth/login", json={**attempt, "email": "other@example.com"}).status_code == 401
+
+
+def test_ip_bucket_covers_every_auth_endpoint(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "auth_rate_limit_ip_burst", 2)
+    client.post("/api/v1/auth/register", json={"email": "a@example.com", "password": "s3cret-pass"})
+    client.post("/api/v1/auth/refresh", json={"refresh_token": "not-a-token"})
+
+    response = client.post("/api/v1/auth/login", json={"email": "b@example.com", "password": "s3cret-pass"})
+    assert response.status_code == 429
+
+
+def test_redis_limiter_shares_buckets_between_processes():
+    server = fakeredis.FakeServer()
+    first = RedisRateLimiter(fakeredis.FakeRedis(server=server))
+    second = RedisRateLimiter(fakeredis.FakeRedis(server=server))
+    bucket = Bucket.per_minute(capacity=2, per_minute=1)
+
+    assert first.acquire("auth:ip:1.2.3.4", bucket) == 0.0
+    assert second.acquire("auth:ip:1.2.3.4", bucket) == 0.0
+    assert first.acquire("auth:ip:1.2.3.4", bucket) == pytest.approx(60.0, abs=1)
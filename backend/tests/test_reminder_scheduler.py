@@ -0,0 +1,125 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.reminder import Reminder
+from app.models.user import User
+from app.services.notifications import LogSender
+from app.workers.reminder_scheduler import ReminderScheduler
+
+NOW = datetime(2024, 5, 10, 9, 0)
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def user_id(engine):
+    with Session(engine) as db:
+        user = User(email="driver@example.com", password_hash="x")
+        db.add(user)
+        db.commit()
+        return user.id
+
+
+def add_reminders(engine, user_id, *specs):
+    with Session(engine) as db:
+        reminders = [Reminder(user_id=user_id, entity_type="policy", entity_id=1, **spec) for spec in specs]
+        db.add_all(reminders)
+        db.commit()
+        return [reminder.id for reminder in reminders]
+
+
+def make_scheduler(session_factory, sender, **kwargs):
+    return ReminderScheduler(session_factory, {"push": sender}, clock=lambda: NOW, **kwargs)
+
+
+def test_sends_due_reminders_and_honours_snooze(engine, session_factory, user_id):
+    due, snoozed, future = add_reminders(
+        engine,
+        user_id,
+        {"due_date": date(2024, 5, 9)},
+        {"due_date": date(2024, 5, 9), "snooze_until": date(2024, 5, 20)},
+        {"due_date": date(2024, 5, 11)},
+    )
+    sender = LogSender("push")
+    scheduler = make_scheduler(session_factory, sender)
+
+    assert scheduler.refill() == 2
+    assert scheduler.run_due() == 1
+    assert sender.sent == [due]
+    assert scheduler.next_due == datetime(2024, 5, 11)
+
+    with Session(engine) as db:
+        statuses = {r.id: r.status for r in db.query(Reminder)}
+    assert statuses == {due: "sent", snoozed: "pending", future: "pending"}
+
+
+def test_reminder_moved_later_after_loading_is_not_sent(engine, session_factory, user_id):
+    (reminder_id,) = add_reminders(engine, user_id, {"due_date": date(2024, 5, 11)})
+    sender = LogSender("push")
+    clock = [NOW]
+    scheduler = ReminderScheduler(session_factory, {"push": sender}, clock=lambda: clock[0])
+    scheduler.refill()
+
+    with Session(engine) as db:
+        db.get(Reminder, reminder_id).due_date = date(2024, 6, 30)
+        db.commit()
+    clock[0] = datetime(2024, 5, 11, 0, 1)
+
+    assert scheduler.run_due() == 0
+    assert sender.sent == []
+    with Session(engine) as db:
+        assert db.get(Reminder, reminder_id).status == "pending"
+
+
+def test_concurrent_schedulers_never_double_send(engine, session_factory, user_id):
+    ids = add_reminders(engine, user_id, *({"due_date": date(2024, 5, 1)} for _ in range(20)))
+    first, second = LogSender("push"), LogSender("push")
+    schedulers = [make_scheduler(session_factory, first, batch_size=7), make_scheduler(session_factory, second, batch_size=7)]
+
+    for scheduler in schedulers:
+        scheduler.refill()
+    while any(scheduler.next_due for scheduler in schedulers):
+        for scheduler in schedulers:
+            scheduler.run_due()
+            scheduler.refill()
+
+    assert sorted(first.sent + second.sent) == ids
+
+
+def test_expired_claims_are_recovered(engine, session_factory, user_id):
+    (reminder_id,) = add_reminders(
+        engine, user_id, {"due_date": date(2024, 5, 1), "status": "sending", "updated_at": NOW - timedelta(hours=1)}
+    )
+    sender = LogSender("push")
+    scheduler = make_scheduler(session_factory, sender, lease=timedelta(minutes=10))
+
+    assert scheduler.recover_expired_claims() == 1
+    scheduler.refill()
+    scheduler.run_due()
+    assert sender.sent == [reminder_id]
+
+
+def test_pass_pages_through_due_rows_and_stops_at_future_ones(engine, session_factory, user_id):
+    due = add_reminders(engine, user_id, *({"due_date": date(2024, 5, 9)} for _ in range(4)))
+    add_reminders(engine, user_id, *({"due_date": date(2024, 5, 11)} for _ in range(10)))
+    sender = LogSender("push")
+    scheduler = make_scheduler(session_factory, sender, batch_size=3, horizon=timedelta(days=2))
+    selects = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    delay = scheduler.run_once(poll_interval=60)
+
+    assert sender.sent == due
+    assert len(selects) == 2
+    assert len(scheduler._queued) == 2
+    assert delay == 60
@@ -0,0 +1,119 @@
+from datetime import date, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.reminder import Reminder
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.services.reminders import VehicleHistory, service_due_by_distance, sync_vehicles
+from app.workers.reminder_backfill import backfill
+
+
+def derived(client, headers):
+    return {(r["entity_type"], r["entity_id"]): r for r in client.get("/api/v1/reminders", headers=headers).json()}
+
+
+def test_policy_writes_keep_renewal_reminder_in_sync(client, auth_headers):
+    vehicle_id = client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=auth_headers).json()["id"]
+    today = date.today()
+    policy = {
+        "vehicle_id": vehicle_id,
+        "policy_type": "OC",
+        "insurer": "PZU",
+        "policy_number": "PZU-1",
+        "start_date": (today - timedelta(days=300)).isoformat(),
+        "end_date": (today + timedelta(days=60)).isoformat(),
+        "premium_total": "900.00",
+        "coverage_json": {},
+    }
+    policy_id = client.post("/api/v1/policies", json=policy, headers=auth_headers).json()["id"]
+    assert derived(client, auth_headers)[("policy_renewal", policy_id)]["due_date"] == (today + timedelta(days=30)).isoformat()
+
+    client.put(f"/api/v1/policies/{policy_id}", json={"end_date": (today + timedelta(days=90)).isoformat()}, headers=auth_headers)
+    assert derived(client, auth_headers)[("policy_renewal", policy_id)]["due_date"] == (today + timedelta(days=60)).isoformat()
+
+    # An expired policy has nothing left to renew.
+    client.put(f"/api/v1/policies/{policy_id}", json={"end_date": (today - timedelta(days=1)).isoformat()}, headers=auth_headers)
+    assert ("policy_renewal", policy_id) not in derived(client, auth_headers)
+
+    client.put(f"/api/v1/policies/{policy_id}", json={"end_date": (today + timedelta(days=90)).isoformat()}, headers=auth_headers)
+    client.delete(f"/api/v1/policies/{policy_id}", headers=auth_headers)
+    assert ("policy_renewal", policy_id) not in derived(client, auth_headers)
+
+
+def test_service_event_moves_time_based_service_reminder(client, auth_headers):
+    vehicle = {"make": "Skoda", "model": "Octavia", "first_registration_date": "2023-02-15", "service_interval_months": 12}
+    vehicle_id = client.post("/api/v1/vehicles", json=vehicle, headers=auth_headers).json()["id"]
+    assert derived(client, auth_headers)[("vehicle_service_time", vehicle_id)]["due_date"] == "2024-02-15"
+
+    event = {"vehicle_id": vehicle_id, "type": "service", "date": "2024-03-10", "mileage_km": 30000}
+    event_id = client.post("/api/v1/events", json=event, headers=auth_headers).json()["id"]
+    assert derived(client, auth_headers)[("vehicle_service_time", vehicle_id)]["due_date"] == "2025-03-10"
+
+    client.delete(f"/api/v1/events/{event_id}", headers=auth_headers)
+    assert derived(client, auth_headers)[("vehicle_service_time", vehicle_id)]["due_date"] == "2024-02-15"
+
+
+def test_distance_based_service_is_projected_from_mileage_rate():
+    vehicle = Vehicle(service_interval_km=15000, mileage_km=0)
+    history = VehicleHistory(date(2024, 1, 1), 10000, (date(2024, 1, 1), 10000), (date(2024, 4, 10), 15000))
+    # 5000 km in 100 days leaves 10000 km, i.e. another 200 days.
+    assert service_due_by_distance(vehicle, history, today=date(2024, 4, 10)) == date(2024, 10, 27)
+    assert service_due_by_distance(vehicle, history._replace(first_reading=None), today=date(2024, 4, 10)) is None
+
+
+def test_overdue_distance_reminder_is_not_renewed_on_later_syncs(engine):
+    with Session(engine) as db:
+        user = User(email="driver@example.com", password_hash="x")
+        vehicle = Vehicle(make="Skoda", model="Octavia", mileage_km=25000, service_interval_km=10000)
+        user.vehicles.append(vehicle)
+        db.add(user)
+        db.commit()
+
+        sync_vehicles(db, [vehicle], today=date(2024, 5, 1))
+        db.commit()
+        reminder = db.scalars(select(Reminder).where(Reminder.entity_type == "vehicle_service_km")).one()
+        assert reminder.due_date == date(2024, 5, 1)
+        reminder.status = "sent"
+        db.commit()
+
+        sync_vehicles(db, [vehicle], today=date(2024, 5, 2))
+        db.commit()
+        assert (reminder.due_date, reminder.status) == (date(2024, 5, 1), "sent")
+
+
+def test_backfill_is_chunked_and_idempotent(engine):
+    with Session(engine) as db:
+        for index in range(3):
+            user = User(email=f"user{index}@example.com", password_hash="x")
+            user.vehicles.append(Vehicle(make="Skoda", model="Octavia", service_interval_months=6, first_registration_date=date(2024, 1, 31)))
+            db.add(user)
+        db.commit()
+
+    session_factory = sessionmaker(bind=engine)
+    assert backfill(session_factory, batch_size=2) == 3
+    backfill(session_factory, batch_size=2)
+
+    with Session(engine) as db:
+        due_dates = db.scalars(select(Reminder.due_date).where(Reminder.entity_type == "vehicle_service_time")).all()
+    assert due_dates == [date(2024, 7, 31)] * 3
+
+
+def test_events_only_touch_the_callers_vehicles(client, auth_headers, other_auth_headers):
+    vehicle = {"make": "Skoda", "model": "Octavia", "first_registration_date": "2023-02-15", "service_interval_months": 12}
+    first = client.post("/api/v1/vehicles", json=vehicle, headers=auth_headers).json()["id"]
+    second = client.post("/api/v1/vehicles", json=vehicle, headers=auth_headers).json()["id"]
+    event = {"vehicle_id": first, "type": "service", "date": "2024-03-10"}
+    event_id = client.post("/api/v1/events", json=event, headers=auth_headers).json()["id"]
+
+    client.put(f"/api/v1/events/{event_id}", json={"vehicle_id": second}, headers=auth_headers)
+    reminders = derived(client, auth_headers)
+    assert reminders[("vehicle_service_time", first)]["due_date"] == "2024-02-15"
+    assert reminders[("vehicle_service_time", second)]["due_date"] == "2025-03-10"
+
+    assert client.post("/api/v1/events", json={**event, "vehicle_id": second, "date": "2026-01-01"}, headers=other_auth_headers).status_code == 404
+    own = client.post("/api/v1/vehicles", json=vehicle, headers=other_auth_headers).json()["id"]
+    other_event = client.post("/api/v1/events", json={**event, "vehicle_id": own}, headers=other_auth_headers).json()["id"]
+    assert client.put(f"/api/v1/events/{other_event}", json={"vehicle_id": second}, headers=other_auth_headers).status_code == 404
+    assert derived(client, auth_headers)[("vehicle_service_time", second)]["due_date"] == "2025-03-10"
@@ -0,0 +1,39 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.api.responses import list_response, model_response
+from app.models.event import Event
+from app.schemas.event import EventRead
+
+
+def make_event(**fields):
+    values = dict(
+        id=1,
+        user_id=2,
+        vehicle_id=3,
+        type="fuel",
+        date=date(2024, 3, 1),
+        mileage_km=12000,
+        cost_total=Decimal("250.40"),
+        workshop_name=None,
+        notes=None,
+        attachments=["receipt.jpg"],
+        created_at=datetime(2024, 3, 1, 10, 15, 30, 123456),
+        updated_at=datetime(2024, 3, 1, 10, 15, 30, 123456),
+    )
+    values.update(fields)
+    return Event(**values)
+
+
+def test_fast_path_matches_pydantic_output():
+    event = make_event()
+    assert json.loads(model_response(EventRead, event).body) == json.loads(EventRead.from_orm(event).json())
+
+
+def test_fast_path_accepts_result_mappings_and_fills_defaults():
+    row = {column: getattr(make_event(), column) for column in EventRead.__fields__}
+    row["attachments"] = None
+    (body,) = json.loads(list_response(EventRead, [row]).body)
+    assert body["attachments"] == []
+    assert body["cost_total"] == 250.4
@@ -0,0 +1,90 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.cost_rollup import CostRollup
+from app.workers.rollup_rebuild import rebuild
+
+
+def costs(client, headers, **params):
+    return client.get("/api/v1/analytics/costs", params=params, headers=headers).json()
+
+
+def rollups(engine):
+    with Session(engine) as db:
+        rows = db.execute(
+            select(CostRollup.vehicle_id, CostRollup.month, CostRollup.type, CostRollup.event_count, CostRollup.cost_total)
+            .order_by(CostRollup.vehicle_id, CostRollup.month, CostRollup.type)
+        ).all()
+    return [tuple(row) for row in rows]
+
+
+def test_event_writes_keep_rollups_in_sync(client, engine, auth_headers):
+    vehicle_id = client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=auth_headers).json()["id"]
+
+    def add_event(**fields):
+        event = {"vehicle_id": vehicle_id, "type": "fuel", "date": "2024-03-05", **fields}
+        return client.post("/api/v1/events", json=event, headers=auth_headers).json()["id"]
+
+    add_event(cost_total="100.00")
+    moved = add_event(cost_total="40.50")
+    removed = add_event(type="repair", date="2024-03-20", cost_total="300.00")
+    client.put(f"/api/v1/events/{moved}", json={"type": "repair", "date": "2024-04-02"}, headers=auth_headers)
+    client.delete(f"/api/v1/events/{removed}", headers=auth_headers)
+
+    assert rollups(engine) == [
+        (vehicle_id, date(2024, 3, 1), "fuel", 1, Decimal("100.00")),
+        (vehicle_id, date(2024, 4, 1), "repair", 1, Decimal("40.50")),
+    ]
+    summary = costs(client, auth_headers, vehicle_id=vehicle_id, **{"from": "2024-04-15"})
+    assert summary["events_total"] == 40.5
+    assert [month["month"] for month in summary["months"]] == ["2024-04-01"]
+
+
+def test_cost_summary_includes_premiums_by_start_month(client, auth_headers):
+    vehicle_id = client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=auth_headers).json()["id"]
+    policy = {
+        "vehicle_id": vehicle_id,
+        "policy_type": "OC",
+        "insurer": "PZU",
+        "policy_number": "PZU-1",
+        "start_date": "2024-01-15",
+        "end_date": "2024-12-31",
+        "premium_total": "900.00",
+        "coverage_json": {},
+    }
+    client.post("/api/v1/policies", json=policy, headers=auth_headers)
+    client.post(
+        "/api/v1/events",
+        json={"vehicle_id": vehicle_id, "type": "service", "date": "2024-01-03", "cost_total": "650.00"},
+        headers=auth_headers,
+    )
+
+    summary = costs(client, auth_headers)
+
+    assert (summary["events_total"], summary["premiums_total"]) == (650.0, 900.0)
+    assert summary["by_type"] == {"service": 650.0}
+    assert summary["months"] == [
+        {"month": "2024-01-01", "event_count": 1, "events_total": 650.0, "premiums_total": 900.0, "by_type": {"service": 650.0}}
+    ]
+
+
+def test_imports_update_rollups_and_rebuild_matches(client, engine, auth_headers):
+    vehicle_id = client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=auth_headers).json()["id"]
+    body = "\n".join(
+        json.dumps({"vehicle_id": vehicle_id, "type": "fuel", "date": f"2024-0{month}-1{day}", "cost_total": "10.25"})
+        for month in (1, 2)
+        for day in range(3)
+    ).encode()
+    client.post("/api/v1/events/import", content=body, headers={**auth_headers, "Content-Type": "application/x-ndjson"})
+
+    maintained = rollups(engine)
+    assert maintained == [
+        (vehicle_id, date(2024, 1, 1), "fuel", 3, Decimal("30.75")),
+        (vehicle_id, date(2024, 2, 1), "fuel", 3, Decimal("30.75")),
+    ]
+    assert rebuild(sessionmaker(bind=engine), batch_size=1) == 1
+    assert rollups(engine) == maintained
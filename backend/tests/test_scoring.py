@@ -0,0 +1,36 @@
+import pytest
+
+from app.services.scoring import OfferCatalogue, resolve_weights
+
+OFFERS = [
+    {"provider": "Shield", "premium_total": 920.50, "coverage_json": {"OC": 1, "AC": 1, "x": 1}, "deductible": 500, "assistance_level": "EU"},
+    {"provider": "Budget", "premium_total": 780.00, "coverage_json": {"OC": 1, "AC": 0, "x": 1}, "deductible": 1000, "assistance_level": "PL"},
+    {"provider": "Premium", "premium_total": 1100.00, "coverage_json": {"OC": 1, "AC": 1, "x": 1, "y": 1}, "deductible": 0, "assistance_level": "EU"},
+]
+
+
+def test_rank_matches_weighted_min_max_scores():
+    ranked = OfferCatalogue(OFFERS).rank()
+    assert [scored.offer["provider"] for scored in ranked] == ["Premium", "Budget", "Shield"]
+    assert [round(scored.score, 4) for scored in ranked] == [0.55, 0.45, 0.4024]
+
+
+def test_rank_returns_only_top_k():
+    ranked = OfferCatalogue(OFFERS).rank(top_k=2)
+    assert [scored.offer["provider"] for scored in ranked] == ["Premium", "Budget"]
+
+
+def test_weight_overrides_change_ranking():
+    ranked = OfferCatalogue(OFFERS).rank({"price": 1.0, "coverage": 0.0, "deductible": 0.0, "assistance": 0.0})
+    assert ranked[0].offer["provider"] == "Budget"
+
+
+def test_constant_columns_score_half():
+    offers = [dict(OFFERS[0], provider=name) for name in "ab"]
+    assert all(scored.score == pytest.approx(0.5) for scored in OfferCatalogue(offers).rank())
+
+
+def test_unknown_weight_is_rejected():
+    with pytest.raises(ValueError):
+        resolve_weights({"colour": 1.0})
+
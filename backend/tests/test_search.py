@@ -0,0 +1,61 @@
+from app.services.search import fts5_match, search_terms, tsquery
+
+
+def create_vehicle(client, headers):
+    return client.post("/api/v1/vehicles", json={"make": "Skoda", "model": "Octavia"}, headers=headers).json()["id"]
+
+
+def create_event(client, headers, vehicle_id, **fields):
+    event = {"vehicle_id": vehicle_id, "type": "service", "date": "2024-03-05", **fields}
+    return client.post("/api/v1/events", json=event, headers=headers).json()["id"]
+
+
+def search(client, headers, q, **params):
+    response = client.get("/api/v1/search", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200
+    return [(hit["type"], hit["id"]) for hit in response.json()]
+
+
+def test_query_is_reduced_to_prefix_terms():
+    assert search_terms('Wymiana "oleju" -AND (filtr*') == ["wymiana", "oleju", "and", "filtr"]
+    assert fts5_match(["olej", "filtr"]) == '"olej"* "filtr"*'
+    assert tsquery(["olej", "filtr"]) == "olej:* & filtr:*"
+
+
+def test_search_ranks_policies_and_events_and_follows_writes(client, auth_headers):
+    vehicle_id = create_vehicle(client, auth_headers)
+    policy = {
+        "vehicle_id": vehicle_id,
+        "policy_type": "OC",
+        "insurer": "PZU",
+        "policy_number": "PZU-1",
+        "start_date": "2024-01-01",
+        "end_date": "2024-12-31",
+        "premium_total": "900.00",
+        "coverage_json": {},
+        "raw_text": "Polisa OC. Assistance i holowanie do 200 km.",
+    }
+    policy_id = client.post("/api/v1/policies", json=policy, headers=auth_headers).json()["id"]
+    towing = create_event(client, auth_headers, vehicle_id, notes="Holowanie po awarii, holowanie na lawecie", workshop_name="Auto-Pomoc")
+    oil = create_event(client, auth_headers, vehicle_id, notes="Wymiana oleju i filtrów", workshop_name="Warsztat Kraków")
+
+    assert search(client, auth_headers, "holow") == [("event", towing), ("policy", policy_id)]
+    assert search(client, auth_headers, "holowanie", type="policy") == [("policy", policy_id)]
+    assert search(client, auth_headers, "krakow olej") == [("event", oil)]
+    assert search(client, auth_headers, "holowanie", limit=1, offset=1) == [("policy", policy_id)]
+
+    client.put(f"/api/v1/events/{oil}", json={"notes": "Wymiana klocków"}, headers=auth_headers)
+    client.delete(f"/api/v1/events/{towing}", headers=auth_headers)
+    assert search(client, auth_headers, "olej") == []
+    assert search(client, auth_headers, "holowanie") == [("policy", policy_id)]
+    assert search(client, auth_headers, "wymiana klock") == [("event", oil)]
+
+    hit = client.get("/api/v1/search", params={"q": "assistance"}, headers=auth_headers).json()[0]
+    assert "[Assistance]" in hit["snippet"]
+
+
+def test_search_only_returns_the_callers_rows(client, auth_headers, other_auth_headers):
+    create_event(client, auth_headers, create_vehicle(client, auth_headers), notes="Wymiana rozrządu")
+
+    assert search(client, other_auth_headers, "rozrząd") == []
+    assert search(client, auth_headers, "***") == []
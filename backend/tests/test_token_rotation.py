@@ -0,0 +1,115 @@
+import fakeredis
+
+from app.core import revocation
+from app.core.bloom import BloomFilter
+from app.core.revocation import REUSED, REVOKED, ROTATED, RedisRevocationStore, RevocationStore
+
+CREDENTIALS = {"email": "driver@example.com", "password": "s3cret-pass"}
+
+
+def login(client):
+    client.post("/api/v1/auth/register", json=CREDENTIALS)
+    return client.post("/api/v1/auth/login", json=CREDENTIALS).json()
+
+
+def refresh(client, token):
+    return client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+
+
+def me(client, tokens):
+    return client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {tokens['access_token']}"}).status_code
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01, items=(f"family-{index}" for index in range(1000)))
+
+    assert all(f"family-{index}" in bloom for index in range(1000))
+    false_positives = sum(f"other-{index}" in bloom for index in range(10_000))
+    assert false_positives < 300
+
+
+def test_refresh_rotates_and_each_token_works_once(client):
+    tokens = login(client)
+    rotated = refresh(client, tokens["refresh_token"])
+    assert rotated.status_code == 200
+    assert rotated.json()["refresh_token"] != tokens["refresh_token"]
+    assert refresh(client, rotated.json()["refresh_token"]).status_code == 200
+    # Refresh tokens are not access tokens, and vice versa.
+    assert me(client, {"access_token": tokens["refresh_token"]}) == 401
+    assert refresh(client, tokens["access_token"]).status_code == 401
+
+
+def test_reuse_revokes_the_whole_family(client):
+    tokens = login(client)
+    other_session = login(client)
+    stolen = tokens["refresh_token"]
+    legitimate = refresh(client, stolen).json()
+
+    response = refresh(client, stolen)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token reused, session revoked"
+    assert refresh(client, legitimate["refresh_token"]).json()["detail"] == "Session revoked"
+    assert me(client, legitimate) == 401
+    assert me(client, other_session) == 200
+
+
+def test_logout_revokes_the_session(client):
+    tokens = login(client)
+    assert client.post("/api/v1/auth/logout", json={"refresh_token": tokens["refresh_token"]}).status_code == 204
+    assert me(client, tokens) == 401
+    assert refresh(client, tokens["refresh_token"]).status_code == 401
+
+
+def test_not_revoked_families_skip_the_authoritative_lookup(monkeypatch):
+    store = RevocationStore(max_entries=100, family_ttl_seconds=60, filter_capacity=100, filter_error_rate=0.001)
+    store.revoke_family("revoked")
+    lookups = []
+    original = store._family_revoked
+    monkeypatch.setattr(store, "_family_revoked", lambda family: lookups.append(family) or original(family))
+
+    assert store.is_family_revoked("revoked")
+    assert not any(store.is_family_revoked(f"family-{index}") for index in range(50))
+    assert lookups == ["revoked"]
+
+
+def test_filter_grows_instead_of_rebuilding_on_every_revocation(monkeypatch):
+    builds = []
+    monkeypatch.setattr(revocation, "BloomFilter", lambda *args: builds.append(args) or BloomFilter(*args))
+    store = RevocationStore(max_entries=100, family_ttl_seconds=60, filter_capacity=4, filter_error_rate=0.01)
+
+    for index in range(100):
+        store.revoke_family(f"family-{index}")
+
+    assert len(builds) <= 7
+    assert store.filter_capacity >= 100
+    assert all(store.is_family_revoked(f"family-{index}") for index in range(100))
+
+
+def test_revoking_a_known_family_again_does_not_grow_the_filter(monkeypatch):
+    builds = []
+    monkeypatch.setattr(revocation, "BloomFilter", lambda *args: builds.append(args) or BloomFilter(*args))
+    store = RevocationStore(max_entries=100, family_ttl_seconds=60, filter_capacity=64, filter_error_rate=0.01)
+    for index in range(40):
+        store.revoke_family(f"family-{index}")
+
+    # What a Redis sync does on every check: re-read every live family.
+    for _ in range(50):
+        for index in range(40):
+            store.revoke_family(f"family-{index}")
+
+    assert len(builds) == 1
+    assert store._filter.count == 40
+
+
+def test_redis_store_shares_rotation_state_between_processes():
+    server = fakeredis.FakeServer()
+    options = dict(max_entries=100, family_ttl_seconds=60, filter_capacity=100, filter_error_rate=0.001, sync_seconds=0)
+    first = RedisRevocationStore(fakeredis.FakeRedis(server=server), **options)
+    second = RedisRevocationStore(fakeredis.FakeRedis(server=server), **options)
+
+    assert first.rotate("jti-1", "family", 30) == ROTATED
+    assert second.rotate("jti-1", "family", 30) == REUSED
+    assert first.rotate("jti-2", "family", 30) == REVOKED
+    assert first.is_family_revoked("family")
+    second.revoke_family("other")
+    assert first.is_family_revoked("other")
@@ -0,0 +1,131 @@
+import hashlib
+
+import fakeredis
+import redis
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from app.api.middleware import BodySizeLimitMiddleware
+from app.services.extraction_cache import RedisExtractionCache
+
+
+def test_upload_runs_extraction_job(client, auth_headers):
+    contents = "Polisa OC nr 123/2024".encode()
+    response = client.post("/api/v1/upload", files={"file": ("polisa.txt", contents, "text/plain")}, headers=auth_headers)
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["sha256"] == hashlib.sha256(contents).hexdigest()
+    assert job["size_bytes"] == len(contents)
+
+    status = client.get(f"/api/v1/upload/jobs/{job['job_id']}", headers=auth_headers).json()
+    assert status["status"] == "succeeded"
+    assert status["result"]["raw_text"] == "Polisa OC nr 123/2024"
+
+
+def test_unknown_job_is_404(client, auth_headers):
+    assert client.get("/api/v1/upload/jobs/missing", headers=auth_headers).status_code == 404
+
+
+def test_upload_and_jobs_are_private(client, auth_headers, other_auth_headers):
+    files = {"file": ("polisa.txt", b"Polisa OC nr 5/2024", "text/plain")}
+    assert client.post("/api/v1/upload", files=files).status_code == 401
+    job = client.post("/api/v1/upload", files=files, headers=auth_headers).json()
+    assert client.get(f"/api/v1/upload/jobs/{job['job_id']}").status_code == 401
+    assert client.get(f"/api/v1/upload/jobs/{job['job_id']}", headers=other_auth_headers).status_code == 404
+
+
+def test_empty_upload_is_rejected(client, auth_headers):
+    response = client.post("/api/v1/upload", files={"file": ("empty.txt", b"", "text/plain")}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def _limited_app(limit: int) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(BodySizeLimitMiddleware, max_body_bytes=limit, path_prefixes=["/upload"])
+
+    @app.post("/upload")
+    def upload(file: UploadFile = File(...)) -> dict:
+        return {"size": len(file.file.read())}
+
+    return TestClient(app)
+
+
+def test_declared_oversized_body_is_rejected_early():
+    response = _limited_app(1024).post("/upload", files={"file": ("big.bin", b"x" * 4096)})
+    assert response.status_code == 413
+
+
+def test_streamed_oversized_body_is_rejected():
+    def body():
+        for _ in range(16):
+            yield b"x" * 1024
+
+    response = _limited_app(4096).post("/upload", content=body(), headers={"Content-Type": "multipart/form-data; boundary=abc"})
+    assert response.status_code == 413
+
+
+def test_body_within_limit_passes():
+    response = _limited_app(64 * 1024).post("/upload", files={"file": ("ok.bin", b"x" * 4096)})
+    assert response.json() == {"size": 4096}
+
+
+def test_duplicate_upload_reuses_cached_extraction(client, auth_headers, monkeypatch):
+    from app.workers import extraction
+
+    calls = []
+    original = extraction.extract_policy_metadata
+
+    def counting_extract(source, filename):
+        calls.append(filename)
+        return original(source, filename)
+
+    monkeypatch.setattr(extraction, "extract_policy_metadata", counting_extract)
+    contents = b"Polisa AC nr 77/2024"
+    first = client.post("/api/v1/upload", files={"file": ("scan-1.txt", contents, "text/plain")}, headers=auth_headers).json()
+    second = client.post("/api/v1/upload", files={"file": ("scan-2.txt", contents, "text/plain")}, headers=auth_headers).json()
+
+    assert calls == ["scan-1.txt"]
+    assert second["status"] == "succeeded"
+    assert second["cached"] is True
+    assert second["job_id"] != first["job_id"]
+    assert second["result"] == client.get(f"/api/v1/upload/jobs/{first['job_id']}", headers=auth_headers).json()["result"]
+
+
+def test_cached_extraction_is_not_shared_between_users(client, auth_headers, other_auth_headers):
+    contents = b"Polisa OC nr 9/2024"
+    client.post("/api/v1/upload", files={"file": ("scan.txt", contents, "text/plain")}, headers=auth_headers)
+    job = client.post("/api/v1/upload", files={"file": ("scan.txt", contents, "text/plain")}, headers=other_auth_headers).json()
+
+    assert "cached" not in job
+
+
+def test_result_cache_failure_does_not_block_the_job(client, auth_headers, monkeypatch):
+    from app.workers import extraction
+
+    class BrokenCache:
+        def set(self, user_id, sha256, result):
+            raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(extraction, "get_extraction_cache", BrokenCache)
+    job = client.post("/api/v1/upload", files={"file": ("scan.txt", b"Polisa OC nr 1/2024", "text/plain")}, headers=auth_headers).json()
+
+    assert client.get(f"/api/v1/upload/jobs/{job['job_id']}", headers=auth_headers).json()["status"] == "succeeded"
+
+
+def test_redis_extraction_cache_keeps_at_most_max_entries():
+    now = [1000.0]
+    cache = RedisExtractionCache(fakeredis.FakeRedis(), max_entries=2, ttl_seconds=60, clock=lambda: now[0])
+
+    for index in range(3):
+        now[0] += 1
+        cache.set(1, f"sha-{index}", {"index": index})
+
+    assert cache.get(1, "sha-0") is None
+    assert [cache.get(1, f"sha-{index}") for index in (1, 2)] == [{"index": 1}, {"index": 2}]
+
+
+def test_redis_extraction_cache_misses_when_redis_is_down():
+    cache = RedisExtractionCache(redis.Redis(port=1, socket_connect_timeout=0.1), max_entries=2, ttl_seconds=60)
+    cache.set(1, "sha", {"raw_text": "x"})
+    assert cache.get(1, "sha") is None